@@ -0,0 +1,135 @@
+"""
+HTTP client for the gift-code balance check.
+
+Makes the same backend call as BalanceModal's check button, without a
+browser: one pooled keep-alive requests.Session per client, BASE_URL and the
+Basic Auth settings from config, at most `max_concurrency` requests in flight
+(safe to share between threads), and retries with exponential backoff on
+network errors, 429 and 5xx (Retry-After is honoured).
+
+UI tests keep exercising the modal; high-volume checks (src/tools/bulk_balance
+--mode api) go through here.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urljoin
+
+import requests
+
+from src.api.http import build_session
+from src.core.config import (
+    BASE_URL,
+    BALANCE_API_PATH,
+    BALANCE_API_CONCURRENCY,
+    BALANCE_API_RETRIES,
+    BALANCE_API_BACKOFF,
+    TIMEOUT,
+)
+
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class BalanceApiError(Exception):
+    """The balance check failed after all retries."""
+
+
+@dataclass
+class BalanceResult:
+    code: str
+    found: bool
+    balance: float | None
+    currency: str | None
+    http_status: int
+    attempts: int
+
+
+class BalanceClient:
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        auth: tuple[str, str] | None = None,
+        max_concurrency: int = BALANCE_API_CONCURRENCY,
+        retries: int = BALANCE_API_RETRIES,
+        backoff: float = BALANCE_API_BACKOFF,
+        timeout: float = TIMEOUT,
+        path: str = BALANCE_API_PATH,
+    ):
+        self.url = urljoin(base_url if base_url.endswith("/") else base_url + "/", path)
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrency))
+
+        # one connection per concurrent request, kept alive between calls
+        self.session = build_session(auth, pool_size=max_concurrency)
+
+    def check(self, code: str) -> BalanceResult:
+        """Balance of one code. Unknown codes come back with found=False; failures raise BalanceApiError."""
+        last_error = None
+        for attempt in range(1, self.retries + 2):
+            try:
+                with self._slots:
+                    resp = self.session.post(self.url, json={"code": code}, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                last_error = f"{e.__class__.__name__}: {e}"
+                delay = None
+            else:
+                if resp.status_code not in _RETRY_STATUSES:
+                    return self._result(code, resp, attempt)
+                last_error = f"HTTP {resp.status_code}"
+                delay = _retry_after(resp)
+
+            if attempt <= self.retries:
+                time.sleep(delay if delay is not None else self.backoff * 2 ** (attempt - 1))
+
+        raise BalanceApiError(f"{code}: {last_error} after {self.retries + 1} attempt(s)")
+
+    @staticmethod
+    def _result(code: str, resp, attempts: int) -> BalanceResult:
+        if resp.status_code == 404:
+            # only the API's own "unknown code" answer means not found; any other 404
+            # (wrong BALANCE_API_PATH, missing route) is a misconfiguration, not a missing code
+            if _error_code(resp) == "not_found":
+                return BalanceResult(code, False, None, None, 404, attempts)
+            raise BalanceApiError(f"{code}: HTTP 404 from {resp.url} (check BALANCE_API_PATH)")
+        if resp.status_code != 200:
+            raise BalanceApiError(f"{code}: HTTP {resp.status_code}")
+        try:
+            data = resp.json()
+        except ValueError:
+            raise BalanceApiError(f"{code}: response is not JSON")
+
+        balance = data.get("balance")
+        return BalanceResult(
+            code=code,
+            found=balance is not None,
+            balance=float(balance) if balance is not None else None,
+            currency=data.get("currency"),
+            http_status=200,
+            attempts=attempts,
+        )
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self) -> "BalanceClient":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _error_code(resp) -> str | None:
+    try:
+        data = resp.json()
+    except ValueError:
+        return None
+    return data.get("error") if isinstance(data, dict) else None
+
+
+def _retry_after(resp) -> float | None:
+    try:
+        return min(float(resp.headers.get("Retry-After")), 30.0)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,95 @@
+"""
+HTTP setup for purchase-flow tests.
+
+Builds the voucher cart (and optionally the buyer details) with direct HTTP
+calls instead of walking HomePage -> VoucherPage -> CheckoutPage in the
+browser, then copies the resulting cookies into the WebDriver session
+(Network.setCookies via session_state.restore_session). Tests start right at
+the step they check:
+
+    checkout = open_checkout(driver, VOUCHER_AMOUNT)
+    payment = open_payment(driver, VOUCHER_AMOUNT, BUYER)
+
+The site root defaults to HomePage.URL, so it follows --local-site.
+"""
+from urllib.parse import urlparse
+
+from src.api.http import build_session
+from src.core.config import CART_API_PATH, CHECKOUT_API_PATH, TIMEOUT
+from src.core.session_state import SessionState, restore_session
+from src.pages.base_page import site_url
+from src.pages.checkout_page import CheckoutPage
+from src.pages.home_page import HomePage
+from src.pages.payment_page import PaymentPage
+
+
+class FlowSetup:
+    def __init__(self, base_url: str | None = None, auth: tuple[str, str] | None = None, timeout: float = TIMEOUT):
+        self.base_url = base_url or HomePage.URL
+        self.timeout = timeout
+        self.session = build_session(auth)
+
+    def _post(self, path: str, payload: dict) -> dict:
+        resp = self.session.post(site_url(path, self.base_url), json=payload, timeout=self.timeout)
+        resp.raise_for_status()
+        return resp.json()
+
+    def add_voucher(self, amount) -> dict:
+        return self._post(CART_API_PATH, {"amount": amount})
+
+    def set_buyer(self, name: str, email: str, phone: str) -> dict:
+        return self._post(CHECKOUT_API_PATH, {"name": name, "email": email, "phone": phone})
+
+    def session_state(self) -> SessionState:
+        """The HTTP session's cookies, in the form restore_session() puts into a browser."""
+        parsed = urlparse(self.base_url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        cookies = []
+        for c in self.session.cookies:
+            cookie = {
+                "name": c.name,
+                "value": c.value,
+                "url": origin + (c.path or "/"),
+                "path": c.path or "/",
+                "secure": bool(c.secure),
+                "httpOnly": c.has_nonstandard_attr("HttpOnly"),
+            }
+            if c.expires is not None:
+                cookie["expires"] = c.expires
+            cookies.append(cookie)
+        return SessionState(url=self.base_url, origin=origin, cookies=cookies)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self) -> "FlowSetup":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def cart_session(amount, buyer: dict | None = None, base_url: str | None = None) -> SessionState:
+    """A new server-side cart (and buyer details) over HTTP, as cookies for restore_session()."""
+    with FlowSetup(base_url) as setup:
+        setup.add_voucher(amount)
+        if buyer is not None:
+            setup.set_buyer(buyer["name"], buyer["email"], buyer["phone"])
+        return setup.session_state()
+
+
+def _open(driver, page_cls, state: SessionState):
+    restore_session(driver, state)
+    page = page_cls(driver)
+    page.URL = site_url(page_cls.PATH, state.url)
+    return page.load()
+
+
+def open_checkout(driver, amount, base_url: str | None = None) -> CheckoutPage:
+    """Voucher of `amount` in the cart over HTTP; the browser opens CheckoutPage directly."""
+    return _open(driver, CheckoutPage, cart_session(amount, base_url=base_url))
+
+
+def open_payment(driver, amount, buyer: dict, base_url: str | None = None) -> PaymentPage:
+    """Cart + buyer details over HTTP; the browser opens PaymentPage directly."""
+    return _open(driver, PaymentPage, cart_session(amount, buyer, base_url))
@@ -0,0 +1,22 @@
+"""Shared requests.Session setup for the HTTP layer (Basic Auth from config, keep-alive pool)."""
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.core.config import BASIC_AUTH_USER, BASIC_AUTH_PASSWORD
+
+
+def default_auth() -> tuple[str, str] | None:
+    if BASIC_AUTH_USER and BASIC_AUTH_PASSWORD:
+        return BASIC_AUTH_USER, BASIC_AUTH_PASSWORD
+    return None
+
+
+def build_session(auth: tuple[str, str] | None = None, pool_size: int = 1) -> requests.Session:
+    """Session with `pool_size` keep-alive connections per host; auth defaults to the config credentials."""
+    session = requests.Session()
+    session.auth = auth if auth is not None else default_auth()
+    session.headers.update({"Accept": "application/json"})
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
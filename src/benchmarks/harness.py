@@ -0,0 +1,120 @@
+"""
+Minimal timing harness for the framework benchmarks.
+
+Results are saved as JSON:
+
+    {"meta": {...},
+     "results": {"name": {"median_ms", "p95_ms", "mean_ms", "min_ms", "samples"}},
+     "skipped": {"name": "reason"}}
+
+compare() checks medians against a baseline file; a benchmark regresses when
+its median is more than `threshold` x the baseline median and the absolute
+difference is above `min_delta_ms` (sub-millisecond noise is ignored).
+"""
+import json
+import platform
+import statistics
+import time
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from pathlib import Path
+
+from src.core.config import BENCH_REGRESSION_THRESHOLD, BENCH_MIN_DELTA_MS
+from src.reporting.duration_history import percentile
+
+
+@dataclass
+class BenchResult:
+    median_ms: float
+    p95_ms: float
+    mean_ms: float
+    min_ms: float
+    samples: int
+
+    @classmethod
+    def from_samples(cls, samples_ms: list[float]) -> "BenchResult":
+        return cls(
+            median_ms=round(statistics.median(samples_ms), 3),
+            p95_ms=round(percentile(samples_ms, 95), 3),
+            mean_ms=round(statistics.fmean(samples_ms), 3),
+            min_ms=round(min(samples_ms), 3),
+            samples=len(samples_ms),
+        )
+
+
+@dataclass
+class BenchSuite:
+    results: dict[str, BenchResult] = field(default_factory=dict)
+    skipped: dict[str, str] = field(default_factory=dict)
+
+    def measure(self, name: str, fn, repeat: int = 20, warmup: int = 2, after=None) -> BenchResult:
+        """
+        Times fn() `repeat` times after `warmup` untimed calls.
+        after(result) runs outside the timed section (e.g. quitting a browser).
+        """
+        for _ in range(warmup):
+            value = fn()
+            if after:
+                after(value)
+
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            value = fn()
+            samples.append((time.perf_counter() - start) * 1000)
+            if after:
+                after(value)
+
+        result = BenchResult.from_samples(samples)
+        self.results[name] = result
+        return result
+
+    def skip(self, name: str, reason: str):
+        self.skipped[name] = reason
+
+    def to_dict(self) -> dict:
+        return {
+            "meta": {
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "results": {name: asdict(r) for name, r in self.results.items()},
+            "skipped": self.skipped,
+        }
+
+    def save(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+
+def load_results(path: Path) -> dict:
+    """results section of a saved benchmark file ({} if missing)."""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8")).get("results", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def compare(
+    current: dict,
+    baseline: dict,
+    threshold: float = BENCH_REGRESSION_THRESHOLD,
+    min_delta_ms: float = BENCH_MIN_DELTA_MS,
+) -> list[dict]:
+    """Benchmarks present in both whose median regressed; both args are "results" dicts."""
+    regressions = []
+    for name, cur in current.items():
+        base = baseline.get(name)
+        if not base or not base.get("median_ms"):
+            continue
+        ratio = cur["median_ms"] / base["median_ms"]
+        if ratio > threshold and cur["median_ms"] - base["median_ms"] > min_delta_ms:
+            regressions.append({
+                "name": name,
+                "baseline_ms": base["median_ms"],
+                "current_ms": cur["median_ms"],
+                "ratio": round(ratio, 2),
+            })
+    return regressions
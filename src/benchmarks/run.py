@@ -0,0 +1,221 @@
+"""
+Framework overhead benchmarks.
+
+    python -m src.benchmarks.run                      # all suites, compare with baseline
+    python -m src.benchmarks.run --suite report --suite screenshot
+    python -m src.benchmarks.run --save-baseline      # accept the current numbers
+
+Suites:
+  browser     driver creation cold vs warm (pool), BasePage type/click/attr,
+              is_visible on a present vs an absent element, screenshot capture -
+              against the local stand-in site (src/local_site); skipped when
+              Chrome cannot be started
+  screenshot  encoding + thumbnail of one screenshot (ScreenshotWriter)
+  report      run_index.load_all_runs, run_index.read_index and
+              dashboard.build_dashboard_html with 10 / 100 / 1000 synthetic runs
+
+Results go to reports/benchmarks/latest.json. With a baseline file present,
+the exit code is 1 when any median regressed beyond --threshold.
+"""
+import argparse
+import io
+import json
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from selenium.webdriver.common.by import By
+
+from src.benchmarks.harness import BenchSuite, compare, load_results
+from src.core.config import BENCH_REGRESSION_THRESHOLD, BENCH_MIN_DELTA_MS
+from src.core.logger import logger
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BENCH_DIR = PROJECT_ROOT / "reports" / "benchmarks"
+SUITES = ("browser", "screenshot", "report")
+RUN_COUNTS = (10, 100, 1000)
+
+
+def _bench_browser(suite: BenchSuite, repeat: int) -> bytes | None:
+    """Returns one real screenshot for the screenshot suite (None without a browser)."""
+    from src.core.driver_factory import create_driver
+    from src.core.driver_pool import DriverPool
+    from src.local_site.server import LocalSite
+    from src.pages.home_page import HomePage
+
+    names = (
+        "driver.create.cold", "driver.acquire.warm", "page.type", "page.click", "page.attr",
+        "page.is_visible.present", "page.is_visible.absent", "screenshot.capture",
+    )
+    try:
+        create_driver().quit()
+    except Exception as e:
+        for name in names:
+            suite.skip(name, f"browser unavailable: {e.__class__.__name__}")
+        return None
+
+    suite.measure("driver.create.cold", create_driver, repeat=min(repeat, 5), warmup=0, after=lambda d: d.quit())
+
+    pool = DriverPool(size=1, owner="bench")
+    with LocalSite() as site:
+        drv = pool.acquire()
+        pool.release(drv)
+        suite.measure("driver.acquire.warm", pool.acquire, repeat=min(repeat, 10), after=pool.release)
+
+        drv = pool.acquire()
+        try:
+            home = HomePage(drv).open(site.url)
+            home.wait_until_ready()
+            modal = home.open_check_balance_modal()
+            missing = (By.ID, "bench-missing")
+
+            suite.measure("page.type", lambda: modal.type(modal.COUPON_INPUT, "1234-1234-1234"), repeat)
+            suite.measure("page.click", lambda: home.click(home.CHECK_BALANCE_BTN), repeat)
+            suite.measure("page.attr", lambda: modal.attr(modal.COUPON_INPUT, "class"), repeat)
+            suite.measure("page.is_visible.present", lambda: home.is_visible(home.CHECK_BALANCE_BTN), repeat)
+            suite.measure("page.is_visible.absent", lambda: home.is_visible(missing, expect=False), repeat)
+            suite.measure("screenshot.capture", drv.get_screenshot_as_png, repeat)
+            return drv.get_screenshot_as_png()
+        finally:
+            pool.release(drv)
+            pool.close()
+
+
+def _synthetic_png() -> bytes | None:
+    try:
+        from PIL import Image, ImageDraw
+    except ImportError:
+        return None
+
+    img = Image.new("RGB", (1280, 800), "white")
+    draw = ImageDraw.Draw(img)
+    for i in range(0, 800, 20):
+        draw.rectangle([40, i, 40 + (i * 7) % 1200, i + 12], fill=(i % 255, 120, 200))
+        draw.text((50, i), f"row {i} – fattal gift voucher", fill="black")
+    out = io.BytesIO()
+    img.save(out, "PNG")
+    return out.getvalue()
+
+
+def _bench_screenshot(suite: BenchSuite, repeat: int, png: bytes | None):
+    from src.reporting.screenshots import ScreenshotWriter
+
+    png = png or _synthetic_png()
+    if png is None:
+        suite.skip("screenshot.encode", "Pillow is not installed")
+        return
+
+    writer = ScreenshotWriter(max_workers=1)
+    try:
+        suite.measure("screenshot.encode", lambda: writer._encode(png), repeat)
+    finally:
+        writer.close()
+
+
+def _synthetic_test(i: int) -> dict:
+    return {
+        "name": f"test_synthetic_{i % 25}",
+        "status": "PASSED" if i % 7 else "FAILED",
+        "timestamp": "2026-01-01 12:00:00",
+        "duration": f"{1 + (i % 13) * 0.37:.2f}s",
+        "final_blob": f"{i:032x}.webp",
+        "final_thumb_blob": f"{i:032x}_t.webp",
+        "steps": [{"label": f"step {s}", "blob": f"{i + s:032x}.webp"} for s in range(4)],
+        "spans": [
+            {"name": "BasePage.click", "locator": "#checkRemainingBtn", "depth": 1,
+             "start_ms": s * 40.0, "duration_ms": 35.0, "wait_ms": 20.0, "command_ms": 15.0}
+            for s in range(30)
+        ],
+    }
+
+
+def _write_synthetic_runs(runs_dir: Path, count: int) -> list[dict]:
+    from src.reporting import run_index
+
+    entries = []
+    start = datetime(2025, 1, 1)
+    for n in range(count):
+        run_id = (start + timedelta(hours=n)).strftime("run_%Y-%m-%d_%H-%M-%S")
+        tests = [_synthetic_test(n * 10 + t) for t in range(10)]
+        run_dir = runs_dir / run_id
+        run_dir.mkdir(parents=True)
+        (run_dir / "run_data.json").write_text(json.dumps(tests), encoding="utf-8")
+        entries.append(run_index.run_summary(run_id, tests))
+    run_index.write_index(runs_dir, entries)
+    return entries
+
+
+def _bench_report(suite: BenchSuite, repeat: int):
+    from src.reporting import run_index
+    from src.reporting.dashboard import build_dashboard_html
+
+    for count in RUN_COUNTS:
+        tmp = Path(tempfile.mkdtemp(prefix="fattal-bench-"))
+        try:
+            runs_dir = tmp / "runs"
+            entries = _write_synthetic_runs(runs_dir, count)
+            last = entries[-1]["id"]
+            reps = max(3, repeat // (1 + count // 100))
+
+            suite.measure(f"report.load_all_runs.{count}", lambda: run_index.load_all_runs(runs_dir), reps, warmup=1)
+            suite.measure(f"report.read_index.{count}", lambda: run_index.read_index(runs_dir), reps, warmup=1)
+            suite.measure(
+                f"report.build_dashboard.{count}",
+                lambda: build_dashboard_html(last, "per_run", index_entries=entries),
+                reps, warmup=1,
+            )
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the framework's own overhead")
+    parser.add_argument("--suite", action="append", choices=SUITES, help="suite(s) to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", type=Path, default=BENCH_DIR / "latest.json")
+    parser.add_argument("--baseline", type=Path, default=BENCH_DIR / "baseline.json")
+    parser.add_argument("--threshold", type=float, default=BENCH_REGRESSION_THRESHOLD)
+    parser.add_argument("--min-delta-ms", type=float, default=BENCH_MIN_DELTA_MS)
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    suites = args.suite or list(SUITES)
+    suite = BenchSuite()
+
+    png = None
+    if "browser" in suites:
+        png = _bench_browser(suite, args.repeat)
+    if "screenshot" in suites:
+        _bench_screenshot(suite, args.repeat, png)
+    if "report" in suites:
+        _bench_report(suite, args.repeat)
+
+    suite.save(args.output)
+    for name, r in suite.results.items():
+        logger.info(f"{name:32} median {r.median_ms:9.2f} ms | p95 {r.p95_ms:9.2f} ms | n={r.samples}")
+    for name, reason in suite.skipped.items():
+        logger.info(f"{name:32} skipped ({reason})")
+
+    if args.save_baseline:
+        suite.save(args.baseline)
+        logger.info(f"Baseline saved: {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if not baseline:
+        logger.info(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    current = suite.to_dict()["results"]
+    regressions = compare(current, baseline, args.threshold, args.min_delta_ms)
+    for r in regressions:
+        logger.error(
+            f"Regression: {r['name']} {r['baseline_ms']} ms -> {r['current_ms']} ms ({r['ratio']}x)"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,10 @@ BASE_URL = os.getenv("BASE_URL", "https://projects.whiteweb.co.il/fattal-new/")
 BROWSER = os.getenv("BROWSER", "chrome")
 HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
 TIMEOUT = int(os.getenv("TIMEOUT", "10"))
+# normal = driver.get waits for every sub-resource (default)
+# eager  = returns at DOMContentLoaded; page objects then wait for their own readiness predicate
+# none   = returns immediately after navigation starts
+PAGE_LOAD_STRATEGY = os.getenv("PAGE_LOAD_STRATEGY", "normal").lower()
 
 # HTTP Basic Auth (browser-level popup in test/staging)
 # If your environment uses Basic Auth, set these in .env:
@@ -15,3 +19,106 @@ TIMEOUT = int(os.getenv("TIMEOUT", "10"))
 # BASIC_AUTH_PASSWORD=...
 BASIC_AUTH_USER = os.getenv("BASIC_AUTH_USER")
 BASIC_AUTH_PASSWORD = os.getenv("BASIC_AUTH_PASSWORD")
+# Sent as user:pass@host on every page load(), so the browser only answers the site's own challenge
+
+# Warm session: load the home page once per worker, snapshot cookies + localStorage
+# and restore them into every browser handed to a test (skips the cold first load)
+SESSION_WARMUP = os.getenv("SESSION_WARMUP", "false").lower() == "true"
+
+# Browser reuse
+# DRIVER_POOL_SIZE = how many warm browsers each pytest worker keeps for reuse.
+# 0 disables reuse (fresh Chrome per test).
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "1"))
+# DRIVER_PREWARM = browsers each worker keeps launching in the background, ahead of demand
+# (new browsers for the first test, crash recovery, @pytest.mark.fresh_browser). 0 = launch on demand.
+DRIVER_PREWARM = int(os.getenv("DRIVER_PREWARM", "0"))
+
+# Chromedriver resolution
+# CHROMEDRIVER_PATH    = explicit binary, used as-is (skips all lookups)
+# CHROMEDRIVER_CACHE_DIR = versioned cache: <dir>/<chrome major>/chromedriver
+# CHROMEDRIVER_OFFLINE = never download; use only the cache dir or PATH
+# CHROME_BINARY        = Chrome executable used for version detection
+# CHROMEDRIVER_MAJOR   = cached major to use when Chrome's version can't be detected
+#                        (unset: the newest major in the cache dir)
+CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH")
+CHROMEDRIVER_CACHE_DIR = os.getenv(
+    "CHROMEDRIVER_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "fattal-gift-automation", "chromedriver")
+)
+CHROMEDRIVER_OFFLINE = os.getenv("CHROMEDRIVER_OFFLINE", "false").lower() == "true"
+CHROME_BINARY = os.getenv("CHROME_BINARY")
+CHROMEDRIVER_MAJOR = os.getenv("CHROMEDRIVER_MAJOR")
+
+# Report screenshots
+# SCREENSHOT_FORMAT = webp / jpeg / png (webp/jpeg need Pillow; without it PNGs are stored as-is)
+SCREENSHOT_FORMAT = os.getenv("SCREENSHOT_FORMAT", "webp").lower()
+SCREENSHOT_QUALITY = int(os.getenv("SCREENSHOT_QUALITY", "80"))
+SCREENSHOT_THUMB_WIDTH = int(os.getenv("SCREENSHOT_THUMB_WIDTH", "400"))
+
+# Report retention (applied at the end of every session)
+# Runs outside all of these policies are packed into reports/archive/<run_id>.tar.gz
+REPORTS_KEEP_LAST = int(os.getenv("REPORTS_KEEP_LAST", "30"))          # newest N runs
+REPORTS_KEEP_DAYS = int(os.getenv("REPORTS_KEEP_DAYS", "14"))          # everything newer than D days
+REPORTS_KEEP_FAILED = os.getenv("REPORTS_KEEP_FAILED", "true").lower() == "true"
+REPORTS_DOWNSAMPLE_DAYS = int(os.getenv("REPORTS_DOWNSAMPLE_DAYS", "90"))  # older passing runs: one per day up to this age
+
+# Per-test duration history (reports/runs/history.json)
+# A passing test regresses when it takes longer than FACTOR x p95 of its previous passing runs
+DURATION_HISTORY_WINDOW = int(os.getenv("DURATION_HISTORY_WINDOW", "50"))          # samples kept per test
+DURATION_REGRESSION_FACTOR = float(os.getenv("DURATION_REGRESSION_FACTOR", "2.0"))
+DURATION_REGRESSION_MIN_SAMPLES = int(os.getenv("DURATION_REGRESSION_MIN_SAMPLES", "5"))
+
+# Element checks (is_visible / is_present)
+# expect=True  -> wait up to POSITIVE_CHECK_TIMEOUT for the element to show up
+#                 (defaults to TIMEOUT: positive checks are used as assertions, e.g. is_success)
+# expect=False -> wait up to NEGATIVE_CHECK_TIMEOUT for it to be gone (short on purpose)
+POSITIVE_CHECK_TIMEOUT = float(os.getenv("POSITIVE_CHECK_TIMEOUT", str(TIMEOUT)))
+NEGATIVE_CHECK_TIMEOUT = float(os.getenv("NEGATIVE_CHECK_TIMEOUT", "2"))
+
+# Adaptive polling for all waits: start fast, back off up to the max interval
+POLL_INITIAL = float(os.getenv("POLL_INITIAL", "0.05"))
+POLL_MAX = float(os.getenv("POLL_MAX", "0.5"))
+
+# Network profile (CDP request blocking), see src/core/network_profiles.py
+# full = load everything, lean = no images/fonts/media/3rd-party widgets
+NETWORK_PROFILE = os.getenv("NETWORK_PROFILE", "full")
+# Per-test request accounting (NetworkMeter): turns on Chrome's performance log for every browser
+NETWORK_ACCOUNTING = os.getenv("NETWORK_ACCOUNTING", "false").lower() == "true"
+
+# Opt-in diagnostics (off by default, each adds work to every test)
+# Per-action timing spans (BasePage / driver_factory) stored in run_data.json
+INSTRUMENTATION = os.getenv("INSTRUMENTATION", "false").lower() == "true"
+# Browser-side performance metrics (Navigation/Paint Timing + CDP Performance.getMetrics)
+# collected for every BasePage.open / open_with_basic_auth and stored per test
+PERF_METRICS = os.getenv("PERF_METRICS", "false").lower() == "true"
+
+# Local stand-in site (src/local_site) instead of BASE_URL: pytest --local-site or LOCAL_SITE=true
+LOCAL_SITE = os.getenv("LOCAL_SITE", "false").lower() == "true"
+LOCAL_SITE_LATENCY_MS = int(os.getenv("LOCAL_SITE_LATENCY_MS", "0"))          # added to every page response
+LOCAL_SITE_API_LATENCY_MS = int(os.getenv("LOCAL_SITE_API_LATENCY_MS", "0"))  # added to every API response
+
+# Benchmarks (python -m src.benchmarks.run): fail when a median is this many times the baseline's
+BENCH_REGRESSION_THRESHOLD = float(os.getenv("BENCH_REGRESSION_THRESHOLD", "1.25"))
+BENCH_MIN_DELTA_MS = float(os.getenv("BENCH_MIN_DELTA_MS", "1.0"))  # ignore smaller absolute differences (noise)
+
+# Balance API client (src/api/balance_client.py): same call the modal's check button makes
+# The default is src/local_site's endpoint; point BALANCE_API_PATH at the real site's through the env
+BALANCE_API_PATH = os.getenv("BALANCE_API_PATH", "api/balance")
+# Purchase-flow setup over HTTP (src/api/flow_setup.py)
+# The defaults are src/local_site's endpoints; set CART_API_PATH / CHECKOUT_API_PATH for the real site
+CART_API_PATH = os.getenv("CART_API_PATH", "api/cart")
+CHECKOUT_API_PATH = os.getenv("CHECKOUT_API_PATH", "api/checkout")
+BALANCE_API_CONCURRENCY = int(os.getenv("BALANCE_API_CONCURRENCY", "8"))  # requests in flight per client
+BALANCE_API_RETRIES = int(os.getenv("BALANCE_API_RETRIES", "3"))          # extra attempts on 429 / 5xx / network errors
+BALANCE_API_BACKOFF = float(os.getenv("BALANCE_API_BACKOFF", "0.5"))      # seconds, doubled per retry
+
+# Data-driven tests (src/data/provider.py)
+# DATA_DIR       = datasets: <name>.csv (header row) or <name>.jsonl (one object per line)
+# DATA_CACHE_DIR = row indexes from earlier sessions, reused while the file's SHA-256 is unchanged
+# DATA_SHARDS    = xdist_group buckets per dataset; rows stay in their bucket (pytest -n N --dist loadgroup)
+DATA_DIR = os.getenv("DATA_DIR", os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "datasets"))
+DATA_CACHE_DIR = os.getenv(
+    "DATA_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "fattal-gift-automation", "test_data")
+)
+DATA_SHARDS = int(os.getenv("DATA_SHARDS", "8"))
@@ -1,17 +1,28 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 
-from src.core.config import HEADLESS, TIMEOUT
+from src.core.config import (
+    HEADLESS,
+    TIMEOUT,
+    PAGE_LOAD_STRATEGY,
+    NETWORK_ACCOUNTING,
+    PERF_METRICS,
+)
+from src.core.driver_resolver import resolve_chromedriver
+from src.core.instrumentation import instrumented
+from src.core.readiness import NETWORK_TRACKER_JS
 
 
+@instrumented("driver.create")
 def create_driver():
     options = ChromeOptions()
 
     if HEADLESS:
         options.add_argument("--headless=new")
 
+    options.page_load_strategy = PAGE_LOAD_STRATEGY
+
     options.add_argument("--window-size=1440,900")
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
@@ -21,10 +32,25 @@ def create_driver():
     options.add_argument("--disable-extensions")
     options.add_argument("--disable-notifications")
 
+    if NETWORK_ACCOUNTING:
+        # network events for per-test request accounting (see network_profiles.NetworkMeter)
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
     driver = webdriver.Chrome(
-        service=ChromeService(ChromeDriverManager().install()),
+        service=ChromeService(resolve_chromedriver()),
         options=options
     )
 
     driver.set_page_load_timeout(TIMEOUT)
+    # readiness waits run in-page (execute_async_script) and need room for their own timeouts
+    driver.set_script_timeout(max(30, TIMEOUT * 3))
+
+    # count fetch/XHR from the very start of every document (used by wait_for_network_idle)
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_TRACKER_JS})
+
+    if PERF_METRICS:
+        # Performance.getMetrics only reports once the domain is enabled
+        driver.execute_cdp_cmd("Performance.enable", {})
     return driver
+
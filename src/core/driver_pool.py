@@ -0,0 +1,163 @@
+import os
+import threading
+from dataclasses import dataclass, asdict
+
+from selenium.common.exceptions import WebDriverException
+
+from src.core.config import DRIVER_POOL_SIZE, DRIVER_PREWARM
+from src.core.driver_factory import create_driver
+from src.core.driver_spawner import DriverSpawner, LaunchStats, timed_launch
+from src.core.instrumentation import instrumented
+from src.core.logger import logger
+
+
+def worker_id() -> str:
+    """xdist worker name (gw0, gw1, ...) or 'main' when running without xdist."""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+@dataclass
+class PoolStats:
+    created: int = 0      # brand-new browsers (pool was empty)
+    reused: int = 0       # warm browsers handed out again after reset
+    recreated: int = 0    # warm browsers that failed reset and were replaced
+    discarded: int = 0    # browsers quit on release (unhealthy / pool full)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class DriverPool:
+    """
+    Per-worker pool of warm Chrome instances.
+
+    Each xdist worker process owns its own pool; drivers are never shared
+    between workers. Between tests a driver is reset (windows, cookies,
+    storage, about:blank) instead of being quit and relaunched.
+
+    With prewarm > 0, new browsers come from a DriverSpawner that keeps that
+    many launches running in the background.
+    """
+
+    def __init__(
+        self,
+        size: int = DRIVER_POOL_SIZE,
+        factory=create_driver,
+        owner: str | None = None,
+        prewarm: int = DRIVER_PREWARM,
+    ):
+        self.size = max(0, size)
+        self.owner = owner or worker_id()
+        self.stats = PoolStats()
+        self.launch = LaunchStats()
+        self._factory = factory
+        self._spawner = DriverSpawner(factory, prewarm, self.launch) if prewarm > 0 else None
+        self._idle = []
+        self._leased = set()
+        self._lock = threading.Lock()
+
+    def _create(self):
+        if self._spawner is not None:
+            return self._spawner.take()
+        drv, launch_ms = timed_launch(self._factory)
+        self.launch.add(launch_ms, launch_ms)  # on demand: the whole launch is exposed
+        return drv
+
+    @instrumented("driver.acquire")
+    def acquire(self, fresh: bool = False):
+        """A reset warm browser, or a never-used one when fresh=True."""
+        with self._lock:
+            drv = self._idle.pop() if self._idle and not fresh else None
+
+        if drv is not None:
+            if self.reset(drv):
+                counter = "reused"
+            else:
+                self._quit(drv)
+                drv = self._create()
+                counter = "recreated"
+        else:
+            drv = self._create()
+            counter = "created"
+
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+            self._leased.add(id(drv))
+        return drv
+
+    def release(self, drv, healthy: bool = True):
+        """Returns a leased browser; unhealthy ones (crashed, hung, failed liveness check) are quit."""
+        with self._lock:
+            if id(drv) not in self._leased:
+                raise ValueError(f"Driver was not leased from pool '{self.owner}'")
+            self._leased.discard(id(drv))
+
+            keep = healthy and len(self._idle) < self.size
+            if keep:
+                self._idle.append(drv)
+            else:
+                self.stats.discarded += 1
+
+        if not keep:
+            self._quit(drv)
+
+    @staticmethod
+    def is_alive(drv) -> bool:
+        """Cheap liveness check: the browser still answers a WebDriver command."""
+        try:
+            drv.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    def close(self):
+        if self._spawner is not None:
+            self._spawner.close()
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for drv in idle:
+            self._quit(drv)
+
+    @staticmethod
+    @instrumented("driver.reset")
+    def reset(drv) -> bool:
+        """Bring a used browser back to a clean state. Returns False if the browser is unusable."""
+        try:
+            handles = drv.window_handles
+            for handle in handles[1:]:
+                drv.switch_to.window(handle)
+                drv.close()
+            drv.switch_to.window(handles[0])
+
+            # storage is per-origin, so clear it while still on the tested page
+            try:
+                drv.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except WebDriverException:
+                pass
+
+            # cookies for all domains (delete_all_cookies only covers the current one)
+            try:
+                drv.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except (WebDriverException, AttributeError):
+                drv.delete_all_cookies()
+
+            drv.get("about:blank")
+            return True
+        except WebDriverException as e:
+            logger.warning(f"Driver reset failed, browser will be recreated: {e.__class__.__name__}")
+            return False
+
+    @staticmethod
+    def _quit(drv):
+        try:
+            drv.quit()
+        except Exception:
+            pass
+
+    def summary(self) -> str:
+        s = self.stats
+        return (
+            f"Driver pool [{self.owner}] size={self.size}: "
+            f"created={s.created} reused={s.reused} recreated={s.recreated} discarded={s.discarded} | "
+            f"{self.launch.summary()}"
+        )
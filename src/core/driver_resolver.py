@@ -0,0 +1,168 @@
+"""
+Chromedriver resolution with a local, versioned cache.
+
+Lookup order (first hit wins):
+  1. CHROMEDRIVER_PATH
+  2. <CHROMEDRIVER_CACHE_DIR>/<chrome major>/chromedriver; if Chrome's version
+     can't be detected, CHROMEDRIVER_MAJOR or else the newest cached major
+  3. chromedriver on PATH (if its major matches the installed Chrome)
+  4. webdriver-manager download, copied into the cache (skipped when CHROMEDRIVER_OFFLINE=true)
+
+The result is memoized, so the lookup runs once per process.
+"""
+import os
+import re
+import shutil
+import subprocess
+import sys
+import uuid
+from functools import lru_cache
+from pathlib import Path
+
+from src.core.config import (
+    CHROMEDRIVER_PATH,
+    CHROMEDRIVER_CACHE_DIR,
+    CHROMEDRIVER_OFFLINE,
+    CHROMEDRIVER_MAJOR,
+    CHROME_BINARY,
+)
+from src.core.logger import logger
+
+DRIVER_NAME = "chromedriver.exe" if sys.platform.startswith("win") else "chromedriver"
+
+_CHROME_CANDIDATES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+
+class DriverResolutionError(RuntimeError):
+    pass
+
+
+def _binary_version(binary: str) -> str | None:
+    try:
+        out = subprocess.run(
+            [binary, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = _VERSION_RE.search(out or "")
+    return match.group(0) if match else None
+
+
+def _windows_chrome_version() -> str | None:
+    try:
+        import winreg
+    except ImportError:
+        return None
+    for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(root, r"Software\Google\Chrome\BLBeacon") as key:
+                return winreg.QueryValueEx(key, "version")[0]
+        except OSError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=None)
+def detect_chrome_version() -> str | None:
+    """Full version of the installed Chrome (e.g. '126.0.6478.126'), or None if not found."""
+    candidates = [CHROME_BINARY] if CHROME_BINARY else _CHROME_CANDIDATES
+    for candidate in candidates:
+        binary = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+        if binary and os.path.exists(binary):
+            version = _binary_version(binary)
+            if version:
+                return version
+    return _windows_chrome_version()
+
+
+def major_of(version: str | None) -> str | None:
+    return version.split(".", 1)[0] if version else None
+
+
+def cached_driver_path(major: str, cache_dir: str = CHROMEDRIVER_CACHE_DIR) -> Path:
+    return Path(cache_dir) / major / DRIVER_NAME
+
+
+def newest_cached_major(cache_dir: str = CHROMEDRIVER_CACHE_DIR) -> str | None:
+    """Highest <major> in the cache dir that holds a chromedriver."""
+    try:
+        majors = [d.name for d in Path(cache_dir).iterdir() if d.name.isdigit() and (d / DRIVER_NAME).exists()]
+    except OSError:
+        return None
+    return max(majors, key=int, default=None)
+
+
+def _store_in_cache(binary: str, major: str, cache_dir: str = CHROMEDRIVER_CACHE_DIR) -> str:
+    target = cached_driver_path(major, cache_dir)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # one tmp file per writer, so concurrent workers never copy over each other's file
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        shutil.copy2(binary, tmp)
+        os.chmod(tmp, 0o755)
+        os.replace(tmp, target)  # atomic: readers see the old or the complete new binary
+    finally:
+        tmp.unlink(missing_ok=True)
+    return str(target)
+
+
+def _from_path(major: str | None) -> str | None:
+    binary = shutil.which(DRIVER_NAME)
+    if not binary:
+        return None
+    if major is None or major_of(_binary_version(binary)) == major:
+        return binary
+    return None
+
+
+def _download(major: str | None) -> str:
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    binary = ChromeDriverManager().install()
+    driver_major = major_of(_binary_version(binary)) or major
+    if driver_major:
+        return _store_in_cache(binary, driver_major)
+    return binary
+
+
+@lru_cache(maxsize=None)
+def resolve_chromedriver() -> str:
+    """Path to a chromedriver binary matching the installed Chrome."""
+    if CHROMEDRIVER_PATH:
+        return CHROMEDRIVER_PATH
+
+    major = major_of(detect_chrome_version())
+    if major is None:
+        # offline machines are seeded for exactly this case: prefer the cache over PATH
+        major = CHROMEDRIVER_MAJOR or newest_cached_major(CHROMEDRIVER_CACHE_DIR)
+        source = "CHROMEDRIVER_MAJOR" if CHROMEDRIVER_MAJOR else "newest cached"
+        logger.info(f"Chrome version not detected; chromedriver major {major or '(none cached)'} ({source})")
+
+    if major:
+        cached = cached_driver_path(major, CHROMEDRIVER_CACHE_DIR)
+        if cached.exists():
+            logger.info(f"Using cached chromedriver {major}: {cached}")
+            return str(cached)
+
+    on_path = _from_path(major)
+    if on_path:
+        logger.info(f"Using chromedriver from PATH: {on_path}")
+        return on_path
+
+    if CHROMEDRIVER_OFFLINE:
+        raise DriverResolutionError(
+            f"No chromedriver for Chrome {major or '(unknown version)'} in "
+            f"{CHROMEDRIVER_CACHE_DIR} or PATH, and CHROMEDRIVER_OFFLINE=true"
+        )
+
+    logger.info(f"Downloading chromedriver for Chrome {major or '(unknown version)'}")
+    return _download(major)
@@ -0,0 +1,115 @@
+"""
+Background browser spawner.
+
+Keeps K browser launches in flight on a thread pool, ahead of demand. take()
+hands out the oldest launch (waiting only if it has not finished yet) and
+immediately starts a replacement, so a crash recovery, a worker's first test
+or a test that needs a pristine browser rarely waits for a full Chrome start.
+
+Launch time is split into:
+  hidden  - launch time that overlapped with other work
+  exposed - time a caller actually blocked in take() (or create without a spawner)
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from src.core.logger import logger
+
+
+@dataclass
+class LaunchStats:
+    launches: int = 0
+    launch_ms: float = 0.0
+    exposed_ms: float = 0.0
+    # add() is called from test threads (on-demand launches) and spawner threads alike
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def hidden_ms(self) -> float:
+        return max(0.0, self.launch_ms - self.exposed_ms)
+
+    def add(self, launch_ms: float, exposed_ms: float):
+        with self._lock:
+            self.launches += 1
+            self.launch_ms += launch_ms
+            self.exposed_ms += min(exposed_ms, launch_ms)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "launches": self.launches,
+                "launch_ms": self.launch_ms,
+                "exposed_ms": self.exposed_ms,
+                "hidden_ms": self.hidden_ms,
+            }
+
+    def summary(self) -> str:
+        stats = self.as_dict()
+        return (
+            f"launches={stats['launches']} launch={stats['launch_ms'] / 1000:.1f}s "
+            f"hidden={stats['hidden_ms'] / 1000:.1f}s exposed={stats['exposed_ms'] / 1000:.1f}s"
+        )
+
+
+def timed_launch(factory) -> tuple[object, float]:
+    """(driver, launch time in ms)"""
+    start = time.perf_counter()
+    drv = factory()
+    return drv, (time.perf_counter() - start) * 1000
+
+
+class DriverSpawner:
+    def __init__(self, factory, size: int, stats: LaunchStats | None = None):
+        self.size = max(1, size)
+        self.stats = stats or LaunchStats()
+        self._factory = factory
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="driver-spawner")
+        self._pending = []
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(self.size):
+            self._spawn()
+
+    def _spawn(self):
+        self._pending.append(self._executor.submit(timed_launch, self._factory))
+
+    def take(self):
+        """Next ready browser; a failed background launch is retried in the foreground."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("DriverSpawner is closed")
+            future = self._pending.pop(0)
+            self._spawn()
+
+        start = time.perf_counter()
+        try:
+            drv, launch_ms = future.result()
+        except Exception as e:
+            logger.warning(f"Background browser launch failed, launching in foreground: {e.__class__.__name__}")
+            drv, launch_ms = timed_launch(self._factory)
+            self.stats.add(launch_ms, launch_ms)
+            return drv
+
+        self.stats.add(launch_ms, (time.perf_counter() - start) * 1000)
+        return drv
+
+    def close(self):
+        """Cancels queued launches and quits browsers that were started but never taken."""
+        with self._lock:
+            self._closed = True
+            pending, self._pending = self._pending, []
+
+        for future in pending:
+            if not future.cancel():
+                future.add_done_callback(_quit_result)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _quit_result(future):
+    try:
+        drv, _ = future.result()
+        drv.quit()
+    except Exception:
+        pass
@@ -0,0 +1,95 @@
+"""
+Single-round-trip element state snapshots.
+
+One execute_script resolves any number of locators in the page and returns,
+for each, presence, visibility, disabled / ARIA state, value, text and
+bounding box - instead of one WebDriver HTTP call per property.
+"""
+from dataclasses import dataclass, field
+
+# Resolves a Selenium (By, value) locator in the page (first match or null).
+RESOLVE_JS = """
+function resolve(by, value) {
+  switch (by) {
+    case "id": return document.getElementById(value);
+    case "css selector": return document.querySelector(value);
+    case "xpath":
+      return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    case "name": return document.getElementsByName(value)[0] || null;
+    case "tag name": return document.getElementsByTagName(value)[0] || null;
+    case "class name": return document.getElementsByClassName(value)[0] || null;
+    case "link text":
+      return Array.from(document.links).find(a => a.innerText.trim() === value) || null;
+    case "partial link text":
+      return Array.from(document.links).find(a => a.innerText.includes(value)) || null;
+  }
+  return null;
+}
+"""
+
+VISIBLE_JS = """
+function visible(el) {
+  if (!el.isConnected) return false;
+  const style = window.getComputedStyle(el);
+  if (style.visibility === "hidden" || style.display === "none" || style.opacity === "0") return false;
+  return el.getClientRects().length > 0;
+}
+"""
+
+# Reads the state of each locator in arguments[0].
+SNAPSHOT_JS = RESOLVE_JS + VISIBLE_JS + """
+const locators = arguments[0];
+
+return locators.map(([by, value]) => {
+  let el = null;
+  try { el = resolve(by, value); } catch (e) { el = null; }
+  if (!el) return { present: false };
+
+  const rect = el.getBoundingClientRect();
+  return {
+    present: true,
+    visible: visible(el),
+    disabled: el.disabled === true || el.hasAttribute("disabled"),
+    aria_disabled: el.getAttribute("aria-disabled"),
+    aria_expanded: el.getAttribute("aria-expanded"),
+    aria_hidden: el.getAttribute("aria-hidden"),
+    value: ("value" in el) ? String(el.value) : null,
+    text: (el.innerText || el.textContent || "").trim().slice(0, 500),
+    rect: { x: rect.x, y: rect.y, width: rect.width, height: rect.height },
+  };
+});
+"""
+
+
+@dataclass
+class ElementState:
+    present: bool = False
+    visible: bool = False
+    disabled: bool = False
+    aria_disabled: str | None = None
+    aria_expanded: str | None = None
+    aria_hidden: str | None = None
+    value: str | None = None
+    text: str = ""
+    rect: dict = field(default_factory=dict)
+
+    @property
+    def enabled(self) -> bool:
+        """Present, without a disabled attribute/property and not aria-disabled="true"."""
+        if not self.present or self.disabled:
+            return False
+        return (self.aria_disabled or "").lower() != "true"
+
+    @property
+    def interactable(self) -> bool:
+        return self.visible and self.enabled
+
+    @classmethod
+    def from_dict(cls, data: dict | None) -> "ElementState":
+        data = data or {}
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+def snapshot_states(driver, locators) -> list[ElementState]:
+    raw = driver.execute_script(SNAPSHOT_JS, [list(loc) for loc in locators]) or []
+    return [ElementState.from_dict(item) for item in raw]
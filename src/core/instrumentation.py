@@ -0,0 +1,112 @@
+"""
+Lightweight action spans for the dashboard waterfall.
+
+A span is one framework action (driver creation, navigation, click, wait...)
+with its start offset, duration and the part of it spent in waits
+(the rest is WebDriver command time). Recording is per thread and only
+active between start_recording() and stop_recording() (conftest does this
+per test).
+
+With INSTRUMENTATION=false, @instrumented returns the original function
+and span() is a no-op, so the overhead is a single flag check.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from src.core.config import INSTRUMENTATION
+
+MAX_SPANS = 500
+
+_local = threading.local()
+
+
+class _Span:
+    __slots__ = ("name", "locator", "start", "wait", "depth")
+
+    def __init__(self, name, locator, start, depth):
+        self.name = name
+        self.locator = locator
+        self.start = start
+        self.wait = 0.0
+        self.depth = depth
+
+
+def start_recording():
+    if not INSTRUMENTATION:
+        return
+    _local.origin = time.perf_counter()
+    _local.stack = []
+    _local.spans = []
+
+
+def stop_recording() -> list[dict]:
+    spans = getattr(_local, "spans", None)
+    _local.spans = None
+    _local.stack = []
+    return spans or []
+
+
+def add_wait(seconds: float):
+    """Called by the waits: attributes wait time to the innermost open span."""
+    stack = getattr(_local, "stack", None)
+    if stack:
+        stack[-1].wait += seconds
+
+
+def _locator_str(locator) -> str:
+    if isinstance(locator, tuple) and len(locator) == 2:
+        return f"{locator[0]}={locator[1]}"
+    return ""
+
+
+@contextmanager
+def span(name: str, locator=None):
+    spans = getattr(_local, "spans", None) if INSTRUMENTATION else None
+    if spans is None:
+        yield
+        return
+
+    now = time.perf_counter()
+    current = _Span(name, _locator_str(locator), now, len(_local.stack))
+    _local.stack.append(current)
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        _local.stack.pop()
+        if _local.stack:
+            _local.stack[-1].wait += current.wait
+        if len(spans) < MAX_SPANS:
+            duration = end - current.start
+            spans.append({
+                "name": current.name,
+                "locator": current.locator,
+                "depth": current.depth,
+                "start_ms": round((current.start - _local.origin) * 1000, 1),
+                "duration_ms": round(duration * 1000, 1),
+                "wait_ms": round(current.wait * 1000, 1),
+                "command_ms": round(max(0.0, duration - current.wait) * 1000, 1),
+            })
+
+
+def instrumented(name: str | None = None):
+    """Decorator: records a span per call. The first tuple argument is taken as the locator."""
+    def decorate(func):
+        if not INSTRUMENTATION:
+            return func
+
+        span_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if getattr(_local, "spans", None) is None:
+                return func(*args, **kwargs)
+            locator = next((a for a in args[1:2] if isinstance(a, tuple)), None)
+            with span(span_name, locator):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
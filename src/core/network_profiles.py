@@ -0,0 +1,189 @@
+"""
+Named network profiles applied through Chrome DevTools (Network.setBlockedURLs).
+
+Resource types are blocked by URL pattern (extension) and third-party
+widgets by domain; blocked requests never leave the browser.
+
+NetworkMeter reads Chrome's performance log after each test and reports how
+many requests were blocked and how many bytes were transferred. Bytes saved
+are estimated from sizes observed for the same URLs in unblocked ("full")
+runs, kept in reports/network_baseline.json.
+"""
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from src.core.logger import logger
+
+_IMAGES = ("png", "jpg", "jpeg", "gif", "webp", "avif", "ico", "bmp")
+_FONTS = ("woff", "woff2", "ttf", "otf", "eot")
+_MEDIA = ("mp4", "webm", "ogg", "mp3", "wav", "m3u8", "mov")
+
+_THIRD_PARTY = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "connect.facebook.com",
+    "hotjar.com",
+    "clarity.ms",
+    "tiktok.com",
+    "tawk.to",
+    "intercom.io",
+    "zopim.com",
+    "zdassets.com",
+    "livechatinc.com",
+    "youtube.com",
+    "vimeo.com",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+)
+
+
+def _by_extension(extensions) -> tuple[str, ...]:
+    patterns = []
+    for ext in extensions:
+        patterns += [f"*.{ext}", f"*.{ext}?*"]
+    return tuple(patterns)
+
+
+def _by_domain(domains) -> tuple[str, ...]:
+    return tuple(f"*://*{domain}/*" for domain in domains)
+
+
+@dataclass(frozen=True)
+class NetworkProfile:
+    name: str
+    blocked_urls: tuple[str, ...] = ()
+
+
+NETWORK_PROFILES = {
+    "full": NetworkProfile("full"),
+    "no-media": NetworkProfile("no-media", _by_extension(_MEDIA)),
+    "no-third-party": NetworkProfile("no-third-party", _by_domain(_THIRD_PARTY)),
+    "lean": NetworkProfile(
+        "lean",
+        _by_extension(_IMAGES + _FONTS + _MEDIA) + _by_domain(_THIRD_PARTY),
+    ),
+}
+
+
+def get_profile(name: str) -> NetworkProfile:
+    try:
+        return NETWORK_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown network profile '{name}'. Known: {', '.join(NETWORK_PROFILES)}")
+
+
+def apply_network_profile(driver, name: str):
+    """Switches the browser to a profile; safe to call again on a pooled browser."""
+    profile = get_profile(name)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(profile.blocked_urls)})
+    return profile
+
+
+def _url_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.netloc}{parts.path}"
+
+
+class NetworkMeter:
+    """Per-process request accounting from Chrome's performance log."""
+
+    def __init__(self, baseline_file: Path):
+        self.baseline_file = Path(baseline_file)
+        self.baseline = self._load()
+        self.learned = {}
+
+    def _load(self) -> dict:
+        try:
+            return json.loads(self.baseline_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def drain(driver):
+        """Drops buffered events (e.g. from the previous test on a pooled browser)."""
+        try:
+            driver.get_log("performance")
+        except WebDriverException:
+            pass
+
+    def collect(self, driver, profile: str) -> dict:
+        try:
+            entries = driver.get_log("performance")
+        except WebDriverException:
+            return {}
+
+        urls, sizes, blocked = {}, {}, []
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                urls[params.get("requestId")] = params.get("request", {}).get("url", "")
+            elif method == "Network.loadingFinished":
+                sizes[params.get("requestId")] = params.get("encodedDataLength", 0)
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked.append(params.get("requestId"))
+
+        if profile == "full":
+            for request_id, size in sizes.items():
+                url = urls.get(request_id)
+                if url and size:
+                    self.learned[_url_key(url)] = int(size)
+
+        saved = sum(self.baseline.get(_url_key(urls.get(r, "")), 0) for r in blocked)
+        return {
+            "profile": profile,
+            "requests": len(urls),
+            "requests_blocked": len(blocked),
+            "bytes_loaded": int(sum(sizes.values())),
+            "bytes_saved_est": int(saved),
+        }
+
+    def save(self, shard_file: Path):
+        """Writes what this process learned; merged into the baseline by merge_baseline()."""
+        if self.learned:
+            shard_file.write_text(json.dumps(self.learned), encoding="utf-8")
+
+
+def merge_baseline(baseline_file: Path, shard_files):
+    baseline_file = Path(baseline_file)
+    try:
+        baseline = json.loads(baseline_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        baseline = {}
+
+    changed = False
+    for shard in shard_files:
+        try:
+            baseline.update(json.loads(Path(shard).read_text(encoding="utf-8")))
+            changed = True
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Skipping network baseline shard {shard}: {e}")
+        Path(shard).unlink(missing_ok=True)
+
+    if changed:
+        baseline_file.write_text(json.dumps(baseline, sort_keys=True), encoding="utf-8")
+
+
+def summarize_by_profile(tests: list[dict]) -> dict:
+    """{profile: {"tests", "requests_blocked", "bytes_saved_est", "bytes_loaded"}} for one run."""
+    totals = {}
+    for test in tests:
+        net = test.get("network") or {}
+        if not net:
+            continue
+        t = totals.setdefault(net["profile"], {"tests": 0, "requests_blocked": 0, "bytes_saved_est": 0, "bytes_loaded": 0})
+        t["tests"] += 1
+        for key in ("requests_blocked", "bytes_saved_est", "bytes_loaded"):
+            t[key] += net.get(key, 0)
+    return totals
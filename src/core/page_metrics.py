@@ -0,0 +1,133 @@
+"""
+Front-end performance metrics per navigation.
+
+For every BasePage.open / open_with_basic_auth during a test, records:
+  - Navigation Timing: TTFB, DOMContentLoaded, load, transfer size
+  - Paint Timing: first-contentful-paint, largest-contentful-paint
+  - CDP Performance.getMetrics: JS heap, DOM nodes, layout / style recalc counts
+
+Metrics are read when the navigation() context exits: for load() that is
+once the page's readiness predicate holds, for a bare open() right after
+driver.get. They describe exactly that document, labeled with the URL the
+browser ended up on, and the CDP counters don't include later interaction.
+With an eager page-load strategy the load event / LCP may not have happened
+yet; those values are then null rather than waited for.
+"""
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlsplit, urlunsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from src.core.config import PERF_METRICS
+from src.core.logger import logger
+
+# All values in ms relative to navigation start; null when not reached (yet)
+_TIMING_JS = """
+const done = arguments[arguments.length - 1];
+const nav = performance.getEntriesByType("navigation")[0];
+const paint = performance.getEntriesByName("first-contentful-paint")[0];
+const ms = v => (v && v > 0) ? Math.round(v) : null;
+
+const result = {
+  ttfb: nav ? ms(nav.responseStart) : null,
+  dom_content_loaded: nav ? ms(nav.domContentLoadedEventEnd) : null,
+  load: nav ? ms(nav.loadEventEnd) : null,
+  transfer_size: nav ? nav.transferSize : null,
+  fcp: paint ? ms(paint.startTime) : null,
+  lcp: null,
+};
+
+try {
+  // LCP entries are buffered; the observer delivers them asynchronously
+  const observer = new PerformanceObserver(list => {
+    const entries = list.getEntries();
+    if (entries.length) result.lcp = ms(entries[entries.length - 1].startTime);
+  });
+  observer.observe({ type: "largest-contentful-paint", buffered: true });
+  setTimeout(() => { observer.disconnect(); done(result); }, 0);
+} catch (e) {
+  done(result);
+}
+"""
+
+_CDP_METRICS = {
+    "JSHeapUsedSize": "js_heap_used",
+    "JSHeapTotalSize": "js_heap_total",
+    "Nodes": "dom_nodes",
+    "LayoutCount": "layout_count",
+    "RecalcStyleCount": "recalc_style_count",
+    "ScriptDuration": "script_duration",
+    "TaskDuration": "task_duration",
+}
+
+_local = threading.local()
+
+
+def collect_metrics(driver) -> dict:
+    """Timing + CDP metrics of the document currently loaded in `driver`."""
+    metrics = {}
+    try:
+        metrics.update(driver.execute_async_script(_TIMING_JS) or {})
+    except WebDriverException as e:
+        logger.debug(f"Navigation timing unavailable: {e.__class__.__name__}")
+
+    try:
+        raw = driver.execute_cdp_cmd("Performance.getMetrics", {}).get("metrics", [])
+        for item in raw:
+            key = _CDP_METRICS.get(item.get("name"))
+            if key:
+                metrics[key] = round(item.get("value", 0), 3)
+    except (WebDriverException, AttributeError):
+        pass
+    return metrics
+
+
+def start_collecting():
+    if not PERF_METRICS:
+        return
+    _local.navigations = []
+    _local.depth = 0
+
+
+@contextmanager
+def navigation(driver, url: str):
+    """
+    Wrap a navigation (driver.get, plus waiting for readiness): the page is
+    measured when the block exits. Nested blocks (open() inside load()) are
+    measured once, by the outermost.
+    """
+    if getattr(_local, "navigations", None) is None:
+        yield
+        return
+
+    _local.depth += 1
+    try:
+        yield
+    finally:
+        _local.depth -= 1
+
+    if _local.depth == 0:
+        _local.navigations.append({
+            **collect_metrics(driver),
+            "requested_url": url,
+            "url": _current_url(driver) or url,
+        })
+
+
+def _current_url(driver) -> str | None:
+    """driver.current_url without credentials."""
+    try:
+        url = driver.current_url
+    except WebDriverException:
+        return None
+    parts = urlsplit(url)
+    if "@" not in parts.netloc:
+        return url
+    return urlunsplit(parts._replace(netloc=parts.netloc.rsplit("@", 1)[1]))
+
+
+def stop_collecting() -> list[dict]:
+    navigations = getattr(_local, "navigations", None)
+    _local.navigations = None
+    return navigations or []
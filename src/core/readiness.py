@@ -0,0 +1,124 @@
+"""
+Event-driven readiness waits.
+
+Each wait is a single execute_async_script that resolves inside the page as
+soon as the condition is met (MutationObserver, input/change events, or the
+in-flight request counter going to zero), so flows move on as fast as the
+site allows instead of after a fixed sleep. On timeout a selenium
+TimeoutException is raised, like the waits in waits.py.
+
+Timeouts are capped by the driver's script timeout (set in driver_factory).
+"""
+import time
+
+from selenium.common.exceptions import TimeoutException
+
+from src.core.config import TIMEOUT
+from src.core.element_state import RESOLVE_JS
+from src.core.waits import record_wait
+
+# Counts in-flight fetch/XHR requests in window.__fattalNet.
+# Installed on every new document by driver_factory (CDP) and lazily by the waits below.
+NETWORK_TRACKER_JS = """
+(function () {
+  if (window.__fattalNet) return;
+  const net = window.__fattalNet = { inflight: 0, last: Date.now() };
+  const begin = () => { net.inflight++; net.last = Date.now(); };
+  const end = () => { net.inflight = Math.max(0, net.inflight - 1); net.last = Date.now(); };
+
+  if (window.fetch) {
+    const originalFetch = window.fetch;
+    window.fetch = function () {
+      begin();
+      return originalFetch.apply(this, arguments).finally(end);
+    };
+  }
+
+  const originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    begin();
+    this.addEventListener("loadend", end, { once: true });
+    return originalSend.apply(this, arguments);
+  };
+})();
+"""
+
+_NETWORK_IDLE_JS = NETWORK_TRACKER_JS + """
+const idleMs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+const start = Date.now();
+(function check() {
+  const net = window.__fattalNet;
+  const now = Date.now();
+  if (net.inflight === 0 && now - net.last >= idleMs) return done(true);
+  if (now - start >= timeoutMs) return done(false);
+  setTimeout(check, 25);
+})();
+"""
+
+_MUTATION_JS = RESOLVE_JS + """
+const locator = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+const target = locator ? resolve(locator[0], locator[1]) : document.body;
+if (!target) return done(false);
+
+const observer = new MutationObserver(() => finish(true));
+const timer = setTimeout(() => finish(false), timeoutMs);
+function finish(ok) { observer.disconnect(); clearTimeout(timer); done(ok); }
+observer.observe(target, { childList: true, subtree: true, attributes: true, characterData: true });
+"""
+
+_ENABLED_JS = RESOLVE_JS + """
+const locator = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+
+function enabled() {
+  const el = resolve(locator[0], locator[1]);
+  if (!el) return false;
+  if (el.disabled === true || el.hasAttribute("disabled")) return false;
+  return (el.getAttribute("aria-disabled") || "").toLowerCase() !== "true";
+}
+
+if (enabled()) return done(true);
+
+let finished = false;
+const observer = new MutationObserver(check);
+const timer = setTimeout(() => finish(false), timeoutMs);
+function check() { if (enabled()) finish(true); }
+// the button is usually toggled by the page's own input/change handlers, so check after them
+function onEvent() { setTimeout(check, 0); }
+function finish(ok) {
+  if (finished) return;
+  finished = true;
+  observer.disconnect();
+  clearTimeout(timer);
+  document.removeEventListener("input", onEvent, true);
+  document.removeEventListener("change", onEvent, true);
+  done(ok);
+}
+document.addEventListener("input", onEvent, true);
+document.addEventListener("change", onEvent, true);
+observer.observe(document.documentElement, { childList: true, subtree: true, attributes: true });
+"""
+
+
+def _run(driver, name, locator, script, *args, timeout):
+    start = time.perf_counter()
+    ok = bool(driver.execute_async_script(script, *args, int(timeout * 1000)))
+    record_wait(name, locator, start, ok)
+    if not ok:
+        target = f" {locator[0]}={locator[1]}" if locator else ""
+        raise TimeoutException(f"Timed out after {timeout}s waiting for {name}{target}")
+    return True
+
+
+def wait_for_network_idle(driver, idle_ms: int = 300, timeout: float = TIMEOUT):
+    """No fetch/XHR in flight for `idle_ms` milliseconds."""
+    return _run(driver, "network idle", None, _NETWORK_IDLE_JS, idle_ms, timeout=timeout)
+
+
+def wait_for_mutation(driver, locator=None, timeout: float = TIMEOUT):
+    """Any DOM change inside `locator` (or the whole body)."""
+    return _run(driver, "mutation", locator, _MUTATION_JS, list(locator) if locator else None, timeout=timeout)
+
+
+def wait_for_enabled(driver, locator, timeout: float = TIMEOUT):
+    """Element present and not disabled / aria-disabled; re-checked on every input, change and DOM mutation."""
+    return _run(driver, "enabled", locator, _ENABLED_JS, list(locator), timeout=timeout)
@@ -0,0 +1,151 @@
+"""
+Snapshot / restore of an authenticated browser session.
+
+capture_session() records cookies (all domains, via CDP), the current URL and
+the current origin's localStorage / sessionStorage. restore_session() puts
+them into another browser without navigating: cookies through
+Network.setCookies, storage through a script that seeds it on the first
+document of that origin. Call clear_restore() with the returned token before
+the browser is reused.
+
+Flow checkpoints build on this: CheckpointStore keeps one named snapshot per
+expensive flow prefix (e.g. "checkout" = voucher chosen, cart filled) for the
+session, and restore_checkpoint() brings a clean browser to that point in one
+navigation. A snapshot only holds the browser side: cookies that point at
+server-side state (a cart id) are shared by every restore unless the caller
+rebuilds that state per restore and passes it as server_state.
+"""
+import json
+import threading
+import uuid
+from dataclasses import dataclass, field, replace
+
+# CookieParam fields accepted by Network.setCookies ("url" instead of "domain" for cookies from HTTP clients)
+_COOKIE_KEYS = ("name", "value", "url", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+# each restore has its own flag, so several restores into one browser don't block each other
+_SEED_FLAG_PREFIX = "__fattal_seeded"
+
+_SEED_STORAGE_JS = """
+(function () {
+  if (location.origin !== %(origin)s) return;
+  if (sessionStorage.getItem(%(flag)s)) return;
+  const local = %(local)s, session = %(session)s;
+  for (const key of Object.keys(local)) localStorage.setItem(key, local[key]);
+  for (const key of Object.keys(session)) sessionStorage.setItem(key, session[key]);
+  sessionStorage.setItem(%(flag)s, "1");
+})();
+"""
+
+_CAPTURE_JS = """
+const prefix = arguments[0];
+function dump(storage) {
+  const items = {};
+  for (let i = 0; i < storage.length; i++) {
+    const key = storage.key(i);
+    if (!key.startsWith(prefix)) items[key] = storage.getItem(key);
+  }
+  return items;
+}
+return {
+  url: location.href,
+  origin: location.origin,
+  localStorage: dump(localStorage),
+  sessionStorage: dump(sessionStorage),
+};
+"""
+
+
+@dataclass
+class SessionState:
+    url: str
+    origin: str
+    cookies: list[dict] = field(default_factory=list)
+    local_storage: dict = field(default_factory=dict)
+    session_storage: dict = field(default_factory=dict)
+
+
+def capture_session(driver) -> SessionState:
+    cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+    page = driver.execute_script(_CAPTURE_JS, _SEED_FLAG_PREFIX)
+    return SessionState(
+        url=page["url"],
+        origin=page["origin"],
+        cookies=cookies,
+        local_storage=page["localStorage"],
+        session_storage=page["sessionStorage"],
+    )
+
+
+def _cookie_param(cookie: dict) -> dict:
+    param = {k: cookie[k] for k in _COOKIE_KEYS if k in cookie}
+    if cookie.get("session") or param.get("expires", -1) < 0:
+        param.pop("expires", None)  # session cookie
+    return param
+
+
+def restore_session(driver, state: SessionState) -> str | None:
+    """Restores cookies + storage. Returns a token for clear_restore() (None if nothing was scheduled)."""
+    if state.cookies:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_cookie_param(c) for c in state.cookies]})
+
+    if not state.local_storage and not state.session_storage:
+        return None
+
+    source = _SEED_STORAGE_JS % {
+        "origin": json.dumps(state.origin),
+        "flag": json.dumps(f"{_SEED_FLAG_PREFIX}_{uuid.uuid4().hex[:8]}"),
+        "local": json.dumps(state.local_storage),
+        "session": json.dumps(state.session_storage),
+    }
+    result = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+    return result.get("identifier")
+
+
+def clear_restore(driver, token: str | None):
+    if token:
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": token})
+
+
+def with_cookies(state: SessionState, fresh: SessionState) -> SessionState:
+    """`state` with its cookies replaced by `fresh`'s cookies of the same name."""
+    names = {c["name"] for c in fresh.cookies}
+    return replace(state, cookies=[c for c in state.cookies if c["name"] not in names] + list(fresh.cookies))
+
+
+def restore_checkpoint(driver, state: SessionState, server_state: SessionState | None = None) -> str | None:
+    """
+    restore_session() + navigation to the checkpoint URL. Returns the clear_restore() token.
+    server_state: freshly built server-side state (e.g. a new cart) whose cookies
+    replace the snapshot's, so this test doesn't share it with other restores.
+    """
+    if server_state is not None:
+        state = with_cookies(state, server_state)
+    token = restore_session(driver, state)
+    driver.get(state.url)
+    return token
+
+
+class CheckpointStore:
+    """Named flow snapshots for one pytest worker, shared by all its tests."""
+
+    def __init__(self):
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> SessionState | None:
+        with self._lock:
+            return self._states.get(name)
+
+    def put(self, name: str, state: SessionState):
+        with self._lock:
+            self._states[name] = state
+
+    def invalidate(self, name: str):
+        """Drops a snapshot (e.g. the test that used it failed); the next test rebuilds it."""
+        with self._lock:
+            self._states.pop(name, None)
+
+    def names(self) -> list[str]:
+        with self._lock:
+            return sorted(self._states)
@@ -1,20 +1,125 @@
-from selenium.webdriver.support.ui import WebDriverWait
+import threading
+import time
+from dataclasses import dataclass
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.support import expected_conditions as EC
 
+from src.core.config import POLL_INITIAL, POLL_MAX
+from src.core.instrumentation import add_wait
+from src.core.logger import logger
+
+POLL_BACKOFF = 1.5
+
+_IGNORED = (NoSuchElementException, StaleElementReferenceException)
+
+
+@dataclass
+class WaitRecord:
+    condition: str
+    locator: str
+    elapsed: float
+    ok: bool
+
+
+class WaitStats:
+    """Latency of every wait in this process (reset per test by conftest)."""
+
+    def __init__(self):
+        self._records = []
+        self._lock = threading.Lock()
+
+    def add(self, record: WaitRecord):
+        with self._lock:
+            self._records.append(record)
+
+    def reset(self):
+        with self._lock:
+            self._records = []
+
+    def records(self) -> list[WaitRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def summary(self, slowest: int = 3) -> dict:
+        records = self.records()
+        top = sorted(records, key=lambda r: r.elapsed, reverse=True)[:slowest]
+        return {
+            "count": len(records),
+            "total": round(sum(r.elapsed for r in records), 3),
+            "timeouts": sum(1 for r in records if not r.ok),
+            "slowest": [
+                {"condition": r.condition, "locator": r.locator, "elapsed": round(r.elapsed, 3), "ok": r.ok}
+                for r in top
+            ],
+        }
+
+
+WAIT_STATS = WaitStats()
+
+
+def _describe(locator) -> str:
+    return f"{locator[0]}={locator[1]}" if locator else ""
+
+
+def wait_until(driver, condition, timeout, name: str = "condition", locator=None, ignored=_IGNORED):
+    """
+    Polls `condition(driver)` until it returns a truthy value or `timeout` expires.
+    Polling starts at POLL_INITIAL and backs off to POLL_MAX, so conditions that
+    are already true return almost immediately.
+    Exceptions in `ignored` count as "not yet"; anything else propagates.
+    """
+    start = time.perf_counter()
+    deadline = start + timeout
+    interval = POLL_INITIAL
+
+    while True:
+        try:
+            value = condition(driver)
+            if value:
+                record_wait(name, locator, start, ok=True)
+                return value
+        except ignored:
+            pass
+
+        now = time.perf_counter()
+        if now >= deadline:
+            record_wait(name, locator, start, ok=False)
+            raise TimeoutException(f"Timed out after {timeout}s waiting for {name} {_describe(locator)}".rstrip())
+
+        time.sleep(min(interval, deadline - now))
+        interval = min(interval * POLL_BACKOFF, POLL_MAX)
+
+
+def record_wait(name, locator, start, ok):
+    """Adds one finished wait (started at perf_counter() `start`) to WAIT_STATS."""
+    elapsed = time.perf_counter() - start
+    WAIT_STATS.add(WaitRecord(name, _describe(locator), elapsed, ok))
+    add_wait(elapsed)
+    logger.debug(f"wait {name} {_describe(locator)}: {elapsed:.3f}s {'ok' if ok else 'timeout'}")
+
 
 def wait_visible(driver, locator, timeout=10):
-    return WebDriverWait(driver, timeout).until(
-        EC.visibility_of_element_located(locator)
-    )
+    return wait_until(driver, EC.visibility_of_element_located(locator), timeout, "visible", locator)
 
 
 def wait_clickable(driver, locator, timeout=10):
-    return WebDriverWait(driver, timeout).until(
-        EC.element_to_be_clickable(locator)
-    )
+    return wait_until(driver, EC.element_to_be_clickable(locator), timeout, "clickable", locator)
 
 
 def wait_present(driver, locator, timeout=10):
-    return WebDriverWait(driver, timeout).until(
-        EC.presence_of_element_located(locator)
+    return wait_until(driver, EC.presence_of_element_located(locator), timeout, "present", locator)
+
+
+def wait_invisible(driver, locator, timeout=10):
+    return wait_until(driver, EC.invisibility_of_element_located(locator), timeout, "invisible", locator)
+
+
+def wait_absent(driver, locator, timeout=10):
+    return wait_until(
+        driver, lambda d: len(d.find_elements(*locator)) == 0, timeout, "absent", locator
     )
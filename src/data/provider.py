@@ -0,0 +1,241 @@
+"""
+Streaming test data (coupons, buyers, amounts, ...) for data-driven tests.
+
+    from src.data.provider import params
+
+    @pytest.mark.parametrize("buyer", params("buyers"))
+    def test_checkout(driver, buyer):
+        CheckoutPage(driver).fill_buyer_details(buyer["name"], buyer["email"], buyer["phone"])
+
+A dataset is DATA_DIR/<name>.csv (header row) or <name>.jsonl. Iterating a
+Dataset streams its rows; collection only needs an index (row id + byte
+offset per row), built in one streaming pass and cached in DATA_CACHE_DIR
+under the file's SHA-256. The next session reuses it while the file is
+unchanged, and a size/mtime match skips even the hashing. Tests get a Row,
+which reads its own record from the file on first access, so a dataset is
+never held in memory whole.
+
+Row ids come from an "id" column/key, otherwise "row<N>". Every param is
+marked xdist_group("<dataset>:<bucket>"), with the bucket derived from the
+row id (CRC32 % DATA_SHARDS). With `pytest -n N --dist loadgroup` a row keeps
+its bucket however the file is reordered or extended.
+"""
+import csv
+import hashlib
+import io
+import json
+import os
+import zlib
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from src.core.config import DATA_DIR, DATA_CACHE_DIR, DATA_SHARDS
+
+_INDEX_VERSION = 1
+_BOM = b"\xef\xbb\xbf"
+
+
+class Row(Mapping):
+    """One dataset row; parsed from the file the first time a field is read."""
+
+    __slots__ = ("dataset", "id", "offset", "_data")
+
+    def __init__(self, dataset: "Dataset", row_id: str, offset: int):
+        self.dataset = dataset
+        self.id = row_id
+        self.offset = offset
+        self._data = None
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            self._data = self.dataset.read_at(self.offset)
+        return self._data
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return f"Row({self.dataset.name}:{self.id})"
+
+
+class Dataset:
+    def __init__(self, path, cache_dir=None):
+        self.path = Path(path)
+        self.name = self.path.stem
+        self.format = self.path.suffix.lower().lstrip(".")
+        if self.format not in ("csv", "jsonl"):
+            raise ValueError(f"{self.path}: datasets are .csv or .jsonl")
+        self.cache_dir = Path(cache_dir or DATA_CACHE_DIR)
+        self._index = None
+
+    def __iter__(self) -> Iterator[dict]:
+        """Streams every row as a dict."""
+        for _, record in self._records():
+            yield record
+
+    def first(self) -> dict:
+        return next(iter(self))
+
+    def rows(self) -> list[Row]:
+        """Lazy rows for parametrization (ids and offsets only)."""
+        index = self.index()
+        return [Row(self, row_id, offset) for row_id, offset in zip(index["ids"], index["offsets"])]
+
+    def read_at(self, offset: int) -> dict:
+        with self.path.open("rb") as f:
+            f.seek(offset)
+            if self.format == "jsonl":
+                return json.loads(f.readline().decode("utf-8"))
+            values = next(csv.reader(_LineReader(f)))
+        return dict(zip(self.index()["header"], values))
+
+    # --- index -----------------------------------------------------------
+
+    def index(self) -> dict:
+        if self._index is None:
+            self._index = self._load_or_build_index()
+        return self._index
+
+    def _load_or_build_index(self) -> dict:
+        stat = self.path.stat()
+        memo_file = self.cache_dir / f"{self.name}-{_path_key(self.path)}.stat.json"
+        memo = _read_json(memo_file) or {}
+
+        # unchanged size + mtime: trust the last hash instead of reading the file again
+        if memo.get("size") == stat.st_size and memo.get("mtime_ns") == stat.st_mtime_ns:
+            digest = memo.get("sha256")
+        else:
+            digest = _sha256(self.path)
+
+        index_file = self.cache_dir / f"{self.name}-{digest[:16]}.json"
+        index = _read_json(index_file)
+        if not index or index.get("version") != _INDEX_VERSION or index.get("sha256") != digest:
+            index = self._build_index(digest)
+            _write_json(index_file, index)
+
+        if memo.get("sha256") != digest or memo.get("mtime_ns") != stat.st_mtime_ns:
+            _write_json(memo_file, {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest})
+        return index
+
+    def _build_index(self, digest: str) -> dict:
+        ids, offsets = [], []
+        for n, (offset, record) in enumerate(self._records(), 1):
+            ids.append(str(record.get("id") or f"row{n}"))
+            offsets.append(offset)
+        header = self._csv_header() if self.format == "csv" else None
+        return {"version": _INDEX_VERSION, "sha256": digest, "header": header, "ids": ids, "offsets": offsets}
+
+    # --- parsing ---------------------------------------------------------
+
+    def _records(self) -> Iterator[tuple[int, dict]]:
+        """(byte offset, row) pairs in file order."""
+        with self.path.open("rb") as f:
+            if f.read(3) != _BOM:
+                f.seek(0)
+            if self.format == "jsonl":
+                offset = f.tell()
+                for raw in f:
+                    if raw.strip():
+                        yield offset, json.loads(raw.decode("utf-8"))
+                    offset += len(raw)
+                return
+
+            lines = _LineReader(f)
+            reader = csv.reader(lines)
+            header = [h.strip() for h in next(reader, [])]
+            while True:
+                offset = lines.position  # the reader pulls exactly one record's lines per next()
+                values = next(reader, None)
+                if values is None:
+                    return
+                if values:
+                    yield offset, dict(zip(header, values))
+
+    def _csv_header(self) -> list[str]:
+        with self.path.open("rb") as f:
+            if f.read(3) != _BOM:
+                f.seek(0)
+            return [h.strip() for h in next(csv.reader(_LineReader(f)), [])]
+
+
+class _LineReader:
+    """Text lines of a binary file, tracking the byte offset of the next unread line."""
+
+    def __init__(self, f: io.BufferedReader):
+        self.f = f
+        self.position = f.tell()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        raw = self.f.readline()
+        if not raw:
+            raise StopIteration
+        self.position += len(raw)
+        return raw.decode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def dataset(name: str) -> Dataset:
+    """DATA_DIR/<name>.csv or .jsonl (or an explicit path)."""
+    path = Path(name)
+    if path.suffix:
+        return Dataset(path)
+    for suffix in (".csv", ".jsonl"):
+        candidate = Path(DATA_DIR) / f"{name}{suffix}"
+        if candidate.exists():
+            return Dataset(candidate)
+    raise FileNotFoundError(f"No dataset '{name}' in {DATA_DIR}")
+
+
+def shard_of(row_id: str, shards: int = DATA_SHARDS) -> int:
+    return zlib.crc32(row_id.encode("utf-8")) % max(1, shards)
+
+
+def params(name: str, shards: int = DATA_SHARDS) -> list:
+    """pytest.param per row, id = row id, grouped into `shards` xdist groups (0 = no groups)."""
+    data = dataset(name)
+    out = []
+    for row in data.rows():
+        marks = [pytest.mark.xdist_group(f"{data.name}:{shard_of(row.id, shards)}")] if shards > 0 else []
+        out.append(pytest.param(row, id=row.id, marks=marks))
+    return out
+
+
+def _path_key(path: Path) -> str:
+    return hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:8]
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_json(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path: Path, data: dict):
+    # several xdist workers may index the same file: write aside, then swap in
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp, path)
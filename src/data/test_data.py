@@ -1,5 +1,12 @@
 import os
 
+from src.data.provider import dataset
+
 # Coupon code for balance check tests
 # Comes from .env, with a safe default for local runs
 COUPON_CODE = os.getenv("TEST_COUPON_CODE", "1234-1234-1234")
+
+# Single-scenario defaults for the purchase flow.
+# Data-driven tests parametrize over the datasets instead: params("buyers"), params("amounts"), params("coupons")
+VOUCHER_AMOUNT = int(os.getenv("TEST_VOUCHER_AMOUNT", "500"))
+BUYER = dataset("buyers").first()  # first row of src/data/datasets/buyers.csv
@@ -0,0 +1,301 @@
+"""
+Local stand-in for the Fattal gift site.
+
+Serves pages that mirror the DOM the page objects target, under the same
+path prefix as BASE_URL (/fattal-new/):
+
+    /fattal-new/                  home: balance button + modal, voucher amount form
+    /fattal-new/cart/add          voucher form target: creates the cart -> checkout
+    /fattal-new/checkout          buyer details form (needs a cart, else -> home)
+    /fattal-new/checkout/submit   checkout form target: stores the buyer -> payment
+    /fattal-new/payment           payment step (needs a cart with a buyer, else -> checkout)
+    /fattal-new/confirmation      success page
+    /fattal-new/api/balance       POST {"code": ...} -> {"code", "balance", "currency"}
+    /fattal-new/api/cart          POST {"amount": ...} -> creates the cart (same cookie as cart/add)
+    /fattal-new/api/checkout      POST {"name", "email", "phone"} -> stores the buyer
+
+Like the real site, the modal's #checkRemainingBtn stays disabled until a code
+is typed. The cart lives server-side behind an HttpOnly "fattal_cart" cookie,
+so the purchase flow can be set up either through the pages or over HTTP
+(src/api/flow_setup.py). Optional Basic Auth and artificial latency (pages and API
+separately) make it usable for timing-sensitive tests and for benchmarking
+the framework itself.
+
+    python -m src.local_site.server --port 8000 --latency-ms 200
+"""
+import argparse
+import base64
+import json
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http.cookies import SimpleCookie
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from src.core.config import LOCAL_SITE_LATENCY_MS, LOCAL_SITE_API_LATENCY_MS
+
+PAGES_DIR = Path(__file__).resolve().parent / "pages"
+PREFIX = "/fattal-new/"
+
+_PAGES = {
+    "": "home.html",
+    "checkout": "checkout.html",
+    "payment": "payment.html",
+    "confirmation": "confirmation.html",
+}
+
+CART_COOKIE = "fattal_cart"
+
+DEFAULT_BALANCES = {"1234-1234-1234": 250.0}
+
+
+@dataclass
+class LocalSiteSettings:
+    latency_ms: int = LOCAL_SITE_LATENCY_MS
+    api_latency_ms: int = LOCAL_SITE_API_LATENCY_MS
+    basic_auth: tuple[str, str] | None = None  # (user, password)
+    balances: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_BALANCES))
+    currency: str = "ILS"
+    api_failures: int = 0  # the first N API calls answer 503 (flaky backend)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    settings: LocalSiteSettings  # set on the per-server subclass
+
+    def log_message(self, format, *args):
+        pass  # keep pytest output clean
+
+    def _authorized(self) -> bool:
+        if not self.settings.basic_auth:
+            return True
+        user, password = self.settings.basic_auth
+        token = base64.b64encode(f"{user}:{password}".encode("utf-8")).decode("ascii")
+        return self.headers.get("Authorization") == f"Basic {token}"
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict | None = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: dict):
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _route(self) -> str | None:
+        path = self.path.split("?", 1)[0].split("#", 1)[0]
+        if path == PREFIX.rstrip("/"):
+            return ""
+        if not path.startswith(PREFIX):
+            return None
+        return path[len(PREFIX):].strip("/")
+
+    def _guard(self, route: str | None) -> bool:
+        if route is None:
+            self._send(404, b"not found", "text/plain")
+            return False
+        if not self._authorized():
+            self._send(401, b"unauthorized", "text/plain", {"WWW-Authenticate": 'Basic realm="fattal"'})
+            return False
+        return True
+
+    def _query(self) -> dict:
+        query = self.path.split("?", 1)[1] if "?" in self.path else ""
+        return {k: v[0] for k, v in parse_qs(query).items()}
+
+    def _json_body(self) -> dict | None:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return None
+        return body if isinstance(body, dict) else None
+
+    def _cart(self) -> dict | None:
+        cookie = SimpleCookie(self.headers.get("Cookie") or "")
+        morsel = cookie.get(CART_COOKIE)
+        return self.server.carts.get(morsel.value) if morsel else None
+
+    def _cart_cookie(self, cart_id: str) -> dict:
+        return {"Set-Cookie": f"{CART_COOKIE}={cart_id}; Path={PREFIX}; HttpOnly; SameSite=Lax"}
+
+    def _redirect(self, route: str, headers: dict | None = None):
+        self._send(302, b"", "text/plain", {"Location": PREFIX + route, **(headers or {})})
+
+    def do_GET(self):
+        route = self._route()
+        if not self._guard(route):
+            return
+        time.sleep(self.settings.latency_ms / 1000)
+
+        if route == "cart/add":
+            cart_id = self.server.new_cart(self._query().get("amount", ""))
+            self._redirect("checkout", self._cart_cookie(cart_id))
+            return
+        if route == "checkout/submit":
+            cart = self._cart()
+            if cart is None:
+                self._redirect("")
+                return
+            query = self._query()
+            cart["buyer"] = {"name": query.get("buyer_name", ""), "email": query.get("email", ""), "phone": query.get("phone", "")}
+            self._redirect("payment")
+            return
+        if route not in _PAGES:
+            self._send(404, b"not found", "text/plain")
+            return
+
+        cart = self._cart()
+        if route in ("checkout", "payment") and cart is None:
+            self._redirect("")
+            return
+        if route == "payment" and not cart.get("buyer"):
+            self._redirect("checkout")
+            return
+
+        body = (PAGES_DIR / _PAGES[route]).read_text(encoding="utf-8")
+        if cart is not None:
+            body = body.replace("%AMOUNT%", str(cart["amount"]))
+        self._send(200, body.encode("utf-8"), "text/html; charset=utf-8")
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        route = self._route()
+        if not self._guard(route):
+            return
+        handler = {
+            "api/balance": self._api_balance,
+            "api/cart": self._api_cart,
+            "api/checkout": self._api_checkout,
+        }.get(route)
+        if handler is None:
+            self._send(404, b"not found", "text/plain")
+            return
+
+        time.sleep(self.settings.api_latency_ms / 1000)
+        body = self._json_body()
+        if body is None:
+            self._send_json(400, {"error": "bad_request"})
+            return
+        handler(body)
+
+    def _api_balance(self, body: dict):
+        if self.server.take_failure():
+            self._send_json(503, {"error": "unavailable"})
+            return
+
+        code = str(body.get("code", "")).strip()
+        if code not in self.settings.balances:
+            self._send_json(404, {"code": code, "error": "not_found"})
+            return
+        self._send_json(200, {"code": code, "balance": self.settings.balances[code], "currency": self.settings.currency})
+
+    def _api_cart(self, body: dict):
+        cart_id = self.server.new_cart(body.get("amount", ""))
+        payload = json.dumps({"cart_id": cart_id, "amount": self.server.carts[cart_id]["amount"]}).encode("utf-8")
+        self._send(200, payload, "application/json", self._cart_cookie(cart_id))
+
+    def _api_checkout(self, body: dict):
+        cart = self._cart()
+        if cart is None:
+            self._send_json(409, {"error": "no_cart"})
+            return
+        cart["buyer"] = {k: str(body.get(k, "")) for k in ("name", "email", "phone")}
+        self._send_json(200, {"amount": cart["amount"], "buyer": cart["buyer"]})
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, handler, failures: int):
+        super().__init__(address, handler)
+        self._failures = failures
+        self._lock = threading.Lock()
+        self.api_calls = 0  # balance API calls
+        self.carts = {}     # cart id -> {"amount", "buyer"}
+
+    def new_cart(self, amount) -> str:
+        cart_id = uuid.uuid4().hex
+        with self._lock:
+            self.carts[cart_id] = {"amount": str(amount), "buyer": None}
+        return cart_id
+
+    def take_failure(self) -> bool:
+        with self._lock:
+            self.api_calls += 1
+            if self._failures > 0:
+                self._failures -= 1
+                return True
+            return False
+
+
+class LocalSite:
+    """Threaded HTTP server on 127.0.0.1; port 0 picks a free port."""
+
+    def __init__(self, settings: LocalSiteSettings | None = None, host: str = "127.0.0.1", port: int = 0):
+        self.settings = settings or LocalSiteSettings()
+        handler = type("LocalSiteHandler", (_Handler,), {"settings": self.settings})
+        self._server = _Server((host, port), handler, self.settings.api_failures)
+        self._thread = None
+
+    @property
+    def api_calls(self) -> int:
+        return self._server.api_calls
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{PREFIX}"
+
+    def start(self) -> "LocalSite":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, name="local-site", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "LocalSite":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the local stand-in Fattal gift site")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=int, default=LOCAL_SITE_LATENCY_MS)
+    parser.add_argument("--api-latency-ms", type=int, default=LOCAL_SITE_API_LATENCY_MS)
+    parser.add_argument("--user", help="require Basic Auth with this user")
+    parser.add_argument("--password", default="")
+    args = parser.parse_args()
+
+    settings = LocalSiteSettings(
+        latency_ms=args.latency_ms,
+        api_latency_ms=args.api_latency_ms,
+        basic_auth=(args.user, args.password) if args.user else None,
+    )
+    site = LocalSite(settings, port=args.port).start()
+    print(f"Serving {site.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-import time
 
+from src.core.config import TIMEOUT, POSITIVE_CHECK_TIMEOUT
+from src.core.readiness import wait_for_enabled, wait_for_network_idle
 from src.pages.base_page import BasePage
 
 
@@ -17,6 +19,10 @@ class BalanceModal(BasePage):
         "checkRemainingBtn"
     )
 
+    # Balance / error message shown after a check; the id is src/local_site's,
+    # the real modal's result element has not been mapped yet
+    RESULT = (By.ID, "balanceResult")
+
     def is_open(self) -> bool:
         return self.is_visible(self.COUPON_INPUT)
 
@@ -35,20 +41,29 @@ class BalanceModal(BasePage):
         return self.is_present(self.CHECK_BUTTON)
 
     def is_check_button_enabled(self) -> bool:
-        if not self.is_present(self.CHECK_BUTTON):
-            return False
-
-        disabled_attr = self.attr(self.CHECK_BUTTON, "disabled")
-        aria_disabled = self.attr(self.CHECK_BUTTON, "aria-disabled")
-
-        if disabled_attr is not None:
-            return False
-        if aria_disabled is not None and aria_disabled.lower() == "true":
+        # presence + disabled + aria-disabled in a single round trip
+        try:
+            state = self.wait_for_state(self.CHECK_BUTTON, lambda s: s.present, POSITIVE_CHECK_TIMEOUT, "present")
+        except TimeoutException:
             return False
+        return state.enabled
 
-        return self.is_enabled(self.CHECK_BUTTON)
-
-    def wait_and_click_check(self, wait_seconds: float = 1.0):
-        time.sleep(wait_seconds)
+    def wait_and_click_check(self, timeout: float = TIMEOUT):
+        # proceeds as soon as the site enables the button, then waits for the balance request to settle
+        wait_for_enabled(self.driver, self.CHECK_BUTTON, timeout)
         self.click_present(self.CHECK_BUTTON)
+        wait_for_network_idle(self.driver, timeout=timeout)
+        return self
+
+    def clear_result(self):
+        # the previous code's message stays in place until the next response arrives
+        for el in self.driver.find_elements(*self.RESULT):
+            self.driver.execute_script("arguments[0].textContent = '';", el)
         return self
+
+    def check_balance(self, code: str, timeout: float = TIMEOUT) -> str:
+        """Checks one code and returns the message the modal shows; the modal stays open for the next code."""
+        self.enter_coupon_code(code)
+        self.clear_result()
+        self.wait_and_click_check(timeout)
+        return self.wait_for_state(self.RESULT, lambda s: bool(s.text), timeout, "result").text
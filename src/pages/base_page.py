@@ -1,17 +1,59 @@
 from urllib.parse import urlparse
 
-from src.core.config import TIMEOUT
-from src.core.waits import wait_visible, wait_clickable, wait_present
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.support import expected_conditions as EC
+
+from src.core.config import (
+    BASE_URL,
+    BASIC_AUTH_USER,
+    BASIC_AUTH_PASSWORD,
+    TIMEOUT,
+    POSITIVE_CHECK_TIMEOUT,
+    NEGATIVE_CHECK_TIMEOUT,
+)
+from src.core.element_state import ElementState, snapshot_states
+from src.core.instrumentation import instrumented
+from src.core.page_metrics import navigation
+from src.core.waits import (
+    wait_until,
+    wait_visible,
+    wait_present,
+    wait_invisible,
+    wait_absent,
+)
+
+# How strongly a cached handle was verified when it was looked up
+_PRESENT = 0
+_VISIBLE = 1
+
+
+def site_url(path: str, base: str = BASE_URL) -> str:
+    """URL of a page under the site root (BASE_URL or the local site)."""
+    return base.rstrip("/") + "/" + path.lstrip("/") if path else base
 
 
 class BasePage:
+    # Page URL for load(); None for pages that are only reached by navigation.
+    # PATH (relative to the site root) lets the URL follow another site, e.g. --local-site.
+    URL = None
+    PATH = None
+    # Readiness predicate: load() returns once this element is visible and enabled.
+    # None = the document has been parsed (readyState interactive/complete).
+    READY = None
+
     def __init__(self, driver):
         self.driver = driver
+        # locator -> (WebElement, _PRESENT/_VISIBLE); cleared on navigation
+        self._elements = {}
 
+    @instrumented()
     def open(self, url: str):
-        self.driver.get(url)
+        self.invalidate_cache()
+        with navigation(self.driver, url):
+            self.driver.get(url)
         return self
 
+    @instrumented()
     def open_with_basic_auth(self, url: str, username: str, password: str):
         parsed = urlparse(url)
 
@@ -24,43 +66,121 @@ class BasePage:
         if parsed.fragment:
             auth_url += f"#{parsed.fragment}"
 
-        self.driver.get(auth_url)
+        self.invalidate_cache()
+        # recorded without credentials
+        with navigation(self.driver, url):
+            self.driver.get(auth_url)
+        return self
+
+    @instrumented()
+    def load(self):
+        if self.URL is None:
+            raise ValueError(f"{type(self).__name__} has no URL to load")
+        # measured once the page is ready, not right after driver.get
+        with navigation(self.driver, self.URL):
+            if BASIC_AUTH_USER and BASIC_AUTH_PASSWORD:
+                self.open_with_basic_auth(self.URL, BASIC_AUTH_USER, BASIC_AUTH_PASSWORD)
+            else:
+                self.open(self.URL)
+            return self.wait_until_ready()
+
+    # -------------------------
+    # Readiness
+    # -------------------------
+    def is_ready(self) -> bool:
+        """Single check of the readiness predicate (one round trip, no waiting)."""
+        if self.READY is None:
+            return self.driver.execute_script("return document.readyState") != "loading"
+        return self.state_of(self.READY).interactable
+
+    @instrumented()
+    def wait_until_ready(self, timeout: float | None = None):
+        """Waits for the page's readiness predicate instead of the full page load."""
+        wait_until(self.driver, lambda _d: self.is_ready(), TIMEOUT if timeout is None else timeout, "ready", self.READY)
         return self
 
+    # -------------------------
+    # Element handle cache
+    # -------------------------
+    def invalidate_cache(self):
+        self._elements.clear()
+
+    def _element(self, locator, visible: bool = False):
+        """
+        Cached WebElement for `locator`. A handle looked up for presence only is
+        re-checked with a visibility wait the first time a caller needs it visible.
+        Handles are handed out without a round trip; one left behind by a
+        navigation raises StaleElementReferenceException and _with_element re-finds it.
+        """
+        level = _VISIBLE if visible else _PRESENT
+        cached = self._elements.get(locator)
+        if cached is not None and cached[1] >= level:
+            return cached[0]
+
+        wait = wait_visible if visible else wait_present
+        el = wait(self.driver, locator, TIMEOUT)
+        self._elements[locator] = (el, level)
+        return el
+
+    def _with_element(self, locator, action, visible: bool = False):
+        """Runs action(el) on the cached handle; re-resolves once if the handle went stale."""
+        try:
+            return action(self._element(locator, visible))
+        except StaleElementReferenceException:
+            self._elements.pop(locator, None)
+            return action(self._element(locator, visible))
+
+    # -------------------------
+    # Actions
+    # -------------------------
+    @instrumented()
     def click(self, locator):
-        wait_clickable(self.driver, locator, TIMEOUT).click()
+        def _click(el):
+            # staleness must reach _with_element (re-resolve) instead of being polled away
+            wait_until(
+                self.driver, EC.element_to_be_clickable(el), TIMEOUT, "clickable", locator, ignored=()
+            ).click()
+
+        self._with_element(locator, _click, visible=True)
         return self
 
+    @instrumented()
     def click_present(self, locator):
         """Click element even if Selenium doesn't classify it as 'clickable' (useful for div/a buttons)."""
-        el = wait_present(self.driver, locator, TIMEOUT)
-        el.click()
+        self._with_element(locator, lambda el: el.click())
         return self
 
+    @instrumented()
     def type(self, locator, text: str, clear: bool = True):
-        el = wait_visible(self.driver, locator, TIMEOUT)
-        try:
-            el.click()
-        except Exception:
-            pass
-
-        if clear:
+        def _type(el):
             try:
-                el.clear()
+                el.click()
+            except StaleElementReferenceException:
+                raise
             except Exception:
-                # fallback to JS clear
-                self.driver.execute_script("arguments[0].value = '';", el)
+                pass
+
+            if clear:
+                try:
+                    el.clear()
+                except StaleElementReferenceException:
+                    raise
+                except Exception:
+                    # fallback to JS clear
+                    self.driver.execute_script("arguments[0].value = '';", el)
+
+            el.send_keys(text)
 
-        el.send_keys(text)
+        self._with_element(locator, _type, visible=True)
         return self
 
+    @instrumented()
     def set_value_js(self, locator, value: str):
         """
         JS fallback: sets value and triggers input/change events
         (important when UI enables buttons only after events).
         """
-        el = wait_present(self.driver, locator, TIMEOUT)
-        self.driver.execute_script(
+        self._with_element(locator, lambda el: self.driver.execute_script(
             """
             const el = arguments[0];
             const val = arguments[1];
@@ -71,42 +191,90 @@ class BasePage:
             """,
             el,
             value
-        )
+        ))
         return self
 
+    # -------------------------
+    # Queries
+    # -------------------------
+    @instrumented()
     def find(self, locator):
-        return wait_visible(self.driver, locator, TIMEOUT)
+        return self._element(locator, visible=True)
 
+    @instrumented()
     def find_present(self, locator):
-        return wait_present(self.driver, locator, TIMEOUT)
+        return self._element(locator)
 
+    @instrumented()
     def text_of(self, locator) -> str:
-        return wait_visible(self.driver, locator, TIMEOUT).text
+        return self._with_element(locator, lambda el: el.text, visible=True)
 
+    @instrumented()
     def attr(self, locator, name: str):
-        el = wait_present(self.driver, locator, TIMEOUT)
-        return el.get_attribute(name)
+        return self._with_element(locator, lambda el: el.get_attribute(name))
 
     def value_of(self, locator) -> str:
         return self.attr(locator, "value") or ""
 
-    def is_visible(self, locator) -> bool:
-        try:
-            wait_visible(self.driver, locator, TIMEOUT)
-            return True
-        except Exception:
-            return False
+    @instrumented()
+    def is_visible(self, locator, expect: bool = True, timeout: float | None = None) -> bool:
+        """
+        expect=True : waits (POSITIVE_CHECK_TIMEOUT) for the element to become visible.
+                      timeout=0 checks once without waiting.
+        expect=False: the element is expected NOT to be visible - waits only
+                      NEGATIVE_CHECK_TIMEOUT for it to go away, and returns
+                      False as soon as it is gone.
+        """
+        if expect:
+            return self._check(wait_visible, locator, POSITIVE_CHECK_TIMEOUT if timeout is None else timeout, _VISIBLE)
+        self._elements.pop(locator, None)
+        return not self._check(wait_invisible, locator, NEGATIVE_CHECK_TIMEOUT if timeout is None else timeout)
 
-    def is_present(self, locator) -> bool:
+    @instrumented()
+    def is_present(self, locator, expect: bool = True, timeout: float | None = None) -> bool:
+        """Same as is_visible, for presence in the DOM."""
+        if expect:
+            return self._check(wait_present, locator, POSITIVE_CHECK_TIMEOUT if timeout is None else timeout, _PRESENT)
+        self._elements.pop(locator, None)
+        return not self._check(wait_absent, locator, NEGATIVE_CHECK_TIMEOUT if timeout is None else timeout)
+
+    def _check(self, wait, locator, timeout: float, cache_level: int | None = None) -> bool:
         try:
-            wait_present(self.driver, locator, TIMEOUT)
-            return True
+            el = wait(self.driver, locator, timeout)
         except Exception:
+            self._elements.pop(locator, None)
             return False
 
+        # a successful positive check leaves a handle for the next interaction
+        if cache_level is not None:
+            cached = self._elements.get(locator)
+            if cached is None or cached[1] < cache_level or cached[0] != el:
+                self._elements[locator] = (el, cache_level)
+        return True
+
+    # -------------------------
+    # State snapshots (one round trip for many properties / locators)
+    # -------------------------
+    @instrumented()
+    def snapshot(self, *locators) -> list[ElementState]:
+        """Visibility, disabled/ARIA state, value, text and rect for each locator, in one execute_script."""
+        return snapshot_states(self.driver, locators)
+
+    def state_of(self, locator) -> ElementState:
+        return self.snapshot(locator)[0]
+
+    @instrumented()
+    def wait_for_state(self, locator, predicate, timeout: float | None = None, name: str = "state") -> ElementState:
+        """Polls snapshots of `locator` until predicate(state) holds; returns that state."""
+        def _condition(_driver):
+            state = self.state_of(locator)
+            return state if predicate(state) else False
+
+        return wait_until(self.driver, _condition, TIMEOUT if timeout is None else timeout, name, locator)
+
+    @instrumented()
     def is_enabled(self, locator) -> bool:
-        el = wait_present(self.driver, locator, TIMEOUT)
-        return el.is_enabled()
+        return self._with_element(locator, lambda el: el.is_enabled())
 
     @property
     def current_url(self) -> str:
@@ -1,13 +1,18 @@
 from selenium.webdriver.common.by import By
-from src.pages.base_page import BasePage
+from src.pages.base_page import BasePage, site_url
 
 class CheckoutPage(BasePage):
-    # TODO: Adjust locators to actual DOM
+    # TODO: Adjust path and locators to actual DOM
+    PATH = "checkout"
+    URL = site_url(PATH)
+
     BUYER_NAME = (By.CSS_SELECTOR, "input[name*='buyer'], input[placeholder*='שם']")
     BUYER_EMAIL = (By.CSS_SELECTOR, "input[type='email']")
     BUYER_PHONE = (By.CSS_SELECTOR, "input[type='tel'], input[placeholder*='טלפון']")
     CONTINUE_TO_PAYMENT = (By.XPATH, "//button[contains(.,'לתשלום') or contains(.,'המשך')]")
 
+    READY = BUYER_NAME
+
     def fill_buyer_details(self, name: str, email: str, phone: str):
         self.type(self.BUYER_NAME, name)
         self.type(self.BUYER_EMAIL, email)
@@ -5,5 +5,7 @@ class ConfirmationPage(BasePage):
     # TODO: Adjust locators to actual DOM
     SUCCESS_TITLE = (By.XPATH, "//*[contains(.,'אישור') or contains(.,'הצלחה') or contains(.,'תודה')]")
 
+    READY = SUCCESS_TITLE
+
     def is_success(self) -> bool:
         return self.is_visible(self.SUCCESS_TITLE)
@@ -1,16 +1,13 @@
 from selenium.webdriver.common.by import By
 
-from src.core.config import (
-    BASE_URL,
-    BASIC_AUTH_USER,
-    BASIC_AUTH_PASSWORD
-)
+from src.core.config import BASE_URL
 from src.pages.base_page import BasePage
 from src.pages.balance_modal import BalanceModal
 
 
 class HomePage(BasePage):
     URL = BASE_URL
+    PATH = ""
 
     BODY = (By.TAG_NAME, "body")
 
@@ -20,13 +17,11 @@ class HomePage(BasePage):
         "button.btn.nav-btn.rounded-3.d-none.d-md-block"
     )
 
-    def load(self):
-        if BASIC_AUTH_USER and BASIC_AUTH_PASSWORD:
-            return self.open_with_basic_auth(self.URL, BASIC_AUTH_USER, BASIC_AUTH_PASSWORD)
-        return self.open(self.URL)
+    # Ready once the balance button can be used (not when every tracking pixel has loaded)
+    READY = CHECK_BALANCE_BTN
 
     def is_loaded(self) -> bool:
-        return self.is_visible(self.BODY)
+        return self.is_visible(self.BODY) and self.is_ready()
 
     def open_check_balance_modal(self) -> BalanceModal:
         self.click(self.CHECK_BALANCE_BTN)
@@ -1,6 +1,10 @@
-from src.pages.base_page import BasePage
+from src.pages.base_page import BasePage, site_url
 
 class PaymentPage(BasePage):
+    # TODO: Adjust path to actual site
+    PATH = "payment"
+    URL = site_url(PATH)
+
     # Payment pages often use iframes / external providers.
     # Keep this page minimal and implement provider-specific logic later.
     def pay_mock(self):
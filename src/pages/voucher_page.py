@@ -6,6 +6,8 @@ class VoucherPage(BasePage):
     AMOUNT_INPUT = (By.CSS_SELECTOR, "input[type='number'], input[name*='amount']")
     NEXT_BTN = (By.XPATH, "//button[contains(.,'המשך') or contains(.,'להמשך')]")
 
+    READY = AMOUNT_INPUT
+
     def set_amount(self, amount: int):
         self.type(self.AMOUNT_INPUT, str(amount))
         return self
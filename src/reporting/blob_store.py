@@ -0,0 +1,161 @@
+"""
+Content-addressed screenshot store shared by all runs.
+
+    reports/blobs/<2-char prefix>/<digest><ext>     full image
+    reports/blobs/<2-char prefix>/<digest>_t<ext>   thumbnail
+    reports/blobs/refs.json                         {blob name: number of runs referencing it}
+
+The digest is taken over the raw PNG from the driver, so an identical page
+(home page, open modal, ...) is encoded and stored only once across runs.
+Reference counts are maintained by the session controller; gc() removes
+blobs that no run points to. refs.json is shared by every session writing
+into reports/, so each read-modify-write holds refs.lock (an O_EXCL lock file,
+which also works on Windows).
+"""
+import hashlib
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+REFS_FILE = "refs.json"
+LOCK_FILE = "refs.lock"
+LOCK_TIMEOUT_SECONDS = 30
+# a lock file older than this was left behind by a killed session
+LOCK_STALE_SECONDS = 120
+
+# blobs younger than this are never collected: they may belong to a session
+# that is still running and has not registered its references yet
+GC_GRACE_SECONDS = 3600
+
+
+def digest_of(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def thumb_name(blob: str) -> str:
+    stem, ext = os.path.splitext(blob)
+    return f"{stem}_t{ext}"
+
+
+class BlobStore:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def path_of(self, blob: str) -> Path:
+        return self.root / blob[:2] / blob
+
+    def exists(self, blob: str) -> bool:
+        return self.path_of(blob).exists()
+
+    def write(self, blob: str, data: bytes):
+        """Atomic write; concurrent writers of the same blob produce the same bytes."""
+        path = self.path_of(blob)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{blob}.{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    # -------------------------
+    # Reference counting
+    # -------------------------
+    def _refs_path(self) -> Path:
+        return self.root / REFS_FILE
+
+    def load_refs(self) -> dict:
+        try:
+            return json.loads(self._refs_path().read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def save_refs(self, refs: dict):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self._refs_path().with_name(f".{REFS_FILE}.{uuid.uuid4().hex}.tmp")
+        tmp.write_text(json.dumps(refs, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self._refs_path())
+
+    @contextmanager
+    def refs_lock(self):
+        """Exclusive access to refs.json across threads, workers and concurrent sessions."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        lock = self.root / LOCK_FILE
+        deadline = time.monotonic() + LOCK_TIMEOUT_SECONDS
+        while True:
+            try:
+                fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - lock.stat().st_mtime > LOCK_STALE_SECONDS:
+                        lock.unlink(missing_ok=True)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"{lock} is held by another session")
+                time.sleep(0.02)
+        try:
+            os.close(fd)
+            yield
+        finally:
+            lock.unlink(missing_ok=True)
+
+    def add_refs(self, blobs):
+        with self.refs_lock():
+            refs = self.load_refs()
+            for blob in blobs:
+                refs[blob] = refs.get(blob, 0) + 1
+            self.save_refs(refs)
+
+    def release_refs(self, blobs):
+        """One decrement per item, so pass a blob once for every run that referenced it."""
+        with self.refs_lock():
+            refs = self.load_refs()
+            for blob in blobs:
+                count = refs.get(blob, 0) - 1
+                if count > 0:
+                    refs[blob] = count
+                else:
+                    refs.pop(blob, None)
+            self.save_refs(refs)
+
+    def gc(self, grace_seconds: int = GC_GRACE_SECONDS, now: float | None = None) -> tuple[int, int]:
+        """Deletes unreferenced blobs (and their thumbnails). Returns (files removed, bytes freed); now = epoch seconds."""
+        if not self.root.exists():
+            return 0, 0
+
+        # held throughout, so no session registers a blob while it is being deleted
+        with self.refs_lock():
+            live = set()
+            for blob in self.load_refs():
+                live.add(blob)
+                live.add(thumb_name(blob))
+
+            cutoff = (time.time() if now is None else now) - grace_seconds
+            removed = freed = 0
+            for path in self.root.glob("*/*"):
+                if path.name in live or not path.is_file():
+                    continue
+                stat = path.stat()
+                if stat.st_mtime > cutoff:
+                    continue
+                path.unlink()
+                removed += 1
+                freed += stat.st_size
+        return removed, freed
+
+
+def blobs_of(tests: list[dict]) -> set[str]:
+    """Blob names referenced by one run's test records."""
+    blobs = set()
+    for test in tests:
+        if test.get("final_blob"):
+            blobs.add(test["final_blob"])
+        for step in test.get("steps") or []:
+            if step.get("blob"):
+                blobs.add(step["blob"])
+    return blobs
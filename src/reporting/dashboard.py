@@ -0,0 +1,629 @@
+"""
+Dashboard HTML for reports/Dashboard.html and reports/runs/<run_id>/Dashboard.html.
+
+The page is static: it embeds no test results. It loads the run list from
+runs/index.js (src/reporting/run_index.py), a run's tests from its
+run_data.js when the run is selected, and duration history from
+runs/history.js (src/reporting/duration_history.py).
+"""
+import json
+
+DASHBOARD_TITLE = "Fattal QA Automation Dashboard - Fattal- Gift"
+
+
+def build_dashboard_html(selected_run_id: str, mode: str, index_entries: list[dict] | None = None) -> str:
+    """
+    mode:
+      - "root": for reports/Dashboard.html
+      - "per_run": for reports/runs/<run_id>/Dashboard.html
+
+    The page does not embed test results. The run list comes from
+    runs/index.js (or index_entries, inlined), and each run's data is
+    loaded from its run_data.js when the run is selected.
+    """
+    if mode == "root":
+        logo_path = "assets/logo.svg"
+        favicon_path = "assets/favicon.svg"
+        screenshots_src_prefix = "runs/{runId}/Screenshots/{file}"
+        blobs_prefix = "blobs/"
+        run_data_src = "runs/{runId}/run_data.js"
+        index_src = "runs/index.js"
+        history_src = "runs/history.js"
+    else:
+        # per-run dashboard is inside reports/runs/<run_id>/Dashboard.html
+        logo_path = "../../assets/logo.svg"
+        favicon_path = "../../assets/favicon.svg"
+        screenshots_src_prefix = "Screenshots/{file}"
+        blobs_prefix = "../../blobs/"
+        run_data_src = "run_data.js"
+        index_src = "../index.js"
+        history_src = "../history.js"
+
+    if index_entries is not None:
+        index_script = (
+            "<script>window.FATTAL_RUN_INDEX = "
+            f"{json.dumps(index_entries, ensure_ascii=False)};</script>"
+        )
+    else:
+        index_script = f'<script src="{index_src}"></script>'
+
+    return f"""<!DOCTYPE html>
+<html lang="he">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1"/>
+  <title>{DASHBOARD_TITLE}</title>
+  <link rel="icon" type="image/svg+xml" href="{favicon_path}">
+  <style>
+    body {{
+      font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+      background-color: #f9f9f9;
+      margin: 20px;
+      color: #333;
+    }}
+    .dashboard-header {{
+      display: flex;
+      align-items: center;
+      justify-content: space-between;
+      margin-bottom: 10px;
+      gap: 24px;
+    }}
+    .dashboard-header h1 {{
+      margin: 0;
+      font-size: 1.8em;
+      display: flex;
+      align-items: center;
+      white-space: nowrap;
+    }}
+    .dashboard-header h1::before {{
+      content: '🧪';
+      margin-right: 10px;
+    }}
+    .header-logo {{
+      height: 60px;
+      max-width: 240px;
+      object-fit: contain;
+      border-radius: 8px;
+      background: #fff;
+      padding: 6px 12px;
+      box-shadow: 0 2px 8px rgba(0,0,0,0.04);
+    }}
+    @media (max-width: 700px) {{
+      .dashboard-header {{
+        flex-direction: column;
+        align-items: flex-start;
+        gap: 8px;
+      }}
+      .header-logo {{
+        margin-left: 0;
+        margin-top: 6px;
+        height: 44px;
+        max-width: 180px;
+      }}
+    }}
+
+    select {{
+      font-size: 14px;
+      padding: 5px;
+      margin-left: 10px;
+    }}
+
+    .test-entry {{
+      background: #fff;
+      border-radius: 6px;
+      padding: 15px;
+      margin-bottom: 20px;
+      box-shadow: 0 1px 4px rgba(0,0,0,0.1);
+      transition: background 0.2s ease;
+    }}
+    .test-entry:hover {{
+      background: #f0f8ff;
+    }}
+
+    .meta-line {{
+      margin: 6px 0 0 0;
+      font-size: 14px;
+    }}
+
+    /* 4-step grid */
+    .steps-grid {{
+      display: grid;
+      grid-template-columns: repeat(4, minmax(140px, 1fr));
+      gap: 14px;
+      margin-top: 12px;
+      align-items: start;
+    }}
+    @media (max-width: 1000px) {{
+      .steps-grid {{
+        grid-template-columns: repeat(2, minmax(140px, 1fr));
+      }}
+    }}
+    @media (max-width: 520px) {{
+      .steps-grid {{
+        grid-template-columns: 1fr;
+      }}
+    }}
+
+    .step-card {{
+      display: flex;
+      flex-direction: column;
+      gap: 6px;
+    }}
+    .step-title {{
+      font-weight: 700;
+      font-size: 13px;
+      color: #222;
+    }}
+    .step-card img {{
+      width: 100%;
+      height: auto;
+      max-height: 190px;
+      object-fit: contain;
+      border-radius: 6px;
+      border: 1px solid #ccc;
+      background: #fff;
+      cursor: pointer;
+    }}
+
+    /* Modal */
+    .modal {{
+      display: none;
+      position: fixed;
+      z-index: 999;
+      left: 0; top: 0; width: 100%; height: 100%;
+      background-color: rgba(0,0,0,0.85);
+    }}
+    .modal-content {{
+      margin: 5% auto;
+      display: block;
+      max-width: 92vw;
+      max-height: 84vh;
+    }}
+    .close {{
+      position: absolute;
+      top: 15px;
+      right: 35px;
+      color: #fff;
+      font-size: 40px;
+      font-weight: bold;
+      cursor: pointer;
+    }}
+
+    /* Back-to-top button */
+    #backToTop {{
+      position: fixed;
+      bottom: 18px;
+      right: 18px;
+      width: 46px;
+      height: 46px;
+      border-radius: 999px;
+      border: none;
+      background: #111827;
+      color: white;
+      font-size: 22px;
+      cursor: pointer;
+      display: none;
+      box-shadow: 0 8px 20px rgba(0,0,0,0.22);
+    }}
+    #backToTop:hover {{
+      background: #0b1220;
+    }}
+
+    /* Per-test action waterfall */
+    .waterfall {{
+      margin-top: 12px;
+      font-size: 12px;
+    }}
+    .waterfall summary {{
+      cursor: pointer;
+      font-weight: 700;
+      font-size: 13px;
+    }}
+    .wf-row {{
+      display: grid;
+      grid-template-columns: minmax(180px, 28%) 1fr 70px;
+      gap: 8px;
+      align-items: center;
+      padding: 2px 0;
+      border-bottom: 1px solid #f0f0f0;
+    }}
+    .wf-label {{
+      white-space: nowrap;
+      overflow: hidden;
+      text-overflow: ellipsis;
+    }}
+    .wf-locator {{
+      color: #888;
+      margin-left: 6px;
+    }}
+    .wf-track {{
+      position: relative;
+      height: 12px;
+      background: #f6f6f6;
+      border-radius: 3px;
+    }}
+    .wf-bar {{
+      position: absolute;
+      top: 0;
+      height: 12px;
+      background: #3b82f6;       /* command time */
+      border-radius: 3px;
+      overflow: hidden;
+    }}
+    .wf-wait {{
+      height: 100%;
+      background: #f59e0b;       /* time spent in waits */
+    }}
+    .wf-ms {{
+      text-align: right;
+      color: #555;
+    }}
+
+    /* Duration trends */
+    .sparkline {{
+      vertical-align: middle;
+      margin-left: 6px;
+    }}
+    .regressed {{
+      color: #b45309;
+      font-weight: 700;
+    }}
+    .muted {{
+      color: #888;
+    }}
+    .perf-panel {{
+      display: grid;
+      grid-template-columns: repeat(2, minmax(220px, 1fr));
+      gap: 14px;
+      background: #fff;
+      border-radius: 6px;
+      padding: 10px 15px;
+      margin-bottom: 20px;
+      box-shadow: 0 1px 4px rgba(0,0,0,0.1);
+      font-size: 13px;
+    }}
+    .perf-panel h4 {{
+      margin: 4px 0;
+    }}
+    .perf-panel ol {{
+      margin: 0;
+      padding-left: 20px;
+    }}
+
+    /* Per-navigation page performance */
+    .navigations {{
+      margin-top: 8px;
+      font-size: 12px;
+    }}
+    .navigations summary {{
+      cursor: pointer;
+      font-weight: 700;
+      font-size: 13px;
+    }}
+    .nav-table {{
+      border-collapse: collapse;
+      margin-top: 6px;
+    }}
+    .nav-table th, .nav-table td {{
+      padding: 3px 8px;
+      border-bottom: 1px solid #f0f0f0;
+      text-align: right;
+    }}
+    .nav-table th:first-child, .nav-table td:first-child {{
+      text-align: left;
+      max-width: 360px;
+      overflow: hidden;
+      text-overflow: ellipsis;
+      white-space: nowrap;
+    }}
+  </style>
+
+  {index_script}
+  <script src="{history_src}"></script>
+  <script>
+    const selectedRunId = {json.dumps(selected_run_id)};
+    const screenshotsPrefix = `{screenshots_src_prefix}`;
+    const blobsPrefix = `{blobs_prefix}`;
+    const runDataSrc = `{run_data_src}`;
+
+    window.FATTAL_RUN_DATA = window.FATTAL_RUN_DATA || {{}};
+
+    function loadRun(runId, callback) {{
+      if (FATTAL_RUN_DATA[runId]) return callback(FATTAL_RUN_DATA[runId]);
+
+      const script = document.createElement("script");
+      script.src = runDataSrc.replace("{{runId}}", runId);
+      script.onload = () => callback(FATTAL_RUN_DATA[runId] || []);
+      script.onerror = () => callback([]);
+      document.head.appendChild(script);
+    }}
+
+    function buildRunOptions() {{
+      const select = document.getElementById("runSelect");
+      const runs = (window.FATTAL_RUN_INDEX || []).slice()
+        .sort((a, b) => (a.id < b.id ? 1 : -1));
+
+      select.innerHTML = runs.map(r => {{
+        const selected = r.id === selectedRunId ? "selected" : "";
+        const label = r.archived ? `${{r.label}} | 📦 archived` : r.label;
+        return `<option value="${{r.id}}" ${{selected}}>${{label}}</option>`;
+      }}).join("");
+      populateRun(select.value);
+    }}
+
+    function openModal(src) {{
+      const modal = document.getElementById("screenshotModal");
+      const modalImg = document.getElementById("modalImage");
+      modal.style.display = "block";
+      modalImg.src = src;
+    }}
+
+    function closeModal() {{
+      document.getElementById("screenshotModal").style.display = "none";
+    }}
+
+    function imgSrc(runId, file) {{
+      return screenshotsPrefix
+        .replace("{{runId}}", runId)
+        .replace("{{file}}", file);
+    }}
+
+    // new runs reference the shared blob store; older runs have per-run files
+    function shotSrc(runId, file, blob) {{
+      if (blob) return blobsPrefix + blob.slice(0, 2) + "/" + blob;
+      return file ? imgSrc(runId, file) : "";
+    }}
+
+    function esc(text) {{
+      return String(text == null ? "" : text)
+        .replace(/&/g, "&amp;").replace(/</g, "&lt;")
+        .replace(/>/g, "&gt;").replace(/"/g, "&quot;");
+    }}
+
+    // spans: [{{name, locator, depth, start_ms, duration_ms, wait_ms, command_ms}}]
+    function waterfallHtml(spans) {{
+      if (!Array.isArray(spans) || !spans.length) return "";
+
+      const rows = spans.slice().sort((a, b) => a.start_ms - b.start_ms || a.depth - b.depth);
+      const total = Math.max(1, ...rows.map(s => s.start_ms + s.duration_ms));
+
+      const body = rows.map(s => {{
+        const left = (s.start_ms / total) * 100;
+        const width = Math.max((s.duration_ms / total) * 100, 0.3);
+        const waitPct = s.duration_ms ? Math.min(100, (s.wait_ms / s.duration_ms) * 100) : 0;
+        const title = `${{s.name}} ${{s.locator || ""}} | ${{s.duration_ms}} ms ` +
+          `(wait ${{s.wait_ms}} ms, command ${{s.command_ms}} ms)`;
+        return `
+          <div class="wf-row" title="${{esc(title)}}">
+            <div class="wf-label" style="padding-left:${{s.depth * 12}}px">${{esc(s.name)}}<span class="wf-locator">${{esc(s.locator)}}</span></div>
+            <div class="wf-track"><div class="wf-bar" style="left:${{left}}%;width:${{width}}%"><div class="wf-wait" style="width:${{waitPct}}%"></div></div></div>
+            <div class="wf-ms">${{s.duration_ms}} ms</div>
+          </div>
+        `;
+      }}).join("");
+
+      return `
+        <details class="waterfall">
+          <summary>Timeline – ${{rows.length}} actions, ${{Math.round(total)}} ms (blue = command, orange = wait)</summary>
+          ${{body}}
+        </details>
+      `;
+    }}
+
+    function kb(bytes) {{
+      return `${{Math.round((bytes || 0) / 1024)}} KB`;
+    }}
+
+    function networkLine(net) {{
+      if (!net || !net.profile) return "";
+      return ` | <strong>Network:</strong> ${{net.profile}}, ${{net.requests_blocked}} blocked, ` +
+        `~${{kb(net.bytes_saved_est)}} saved, ${{kb(net.bytes_loaded)}} loaded`;
+    }}
+
+    function ms(v) {{
+      return v == null ? "–" : `${{v}} ms`;
+    }}
+
+    // navigations: [{{url, requested_url, ttfb, dom_content_loaded, load, fcp, lcp, js_heap_used, dom_nodes, layout_count, ...}}]
+    function navigationsHtml(navs) {{
+      if (!Array.isArray(navs) || !navs.length) return "";
+
+      const rows = navs.map(n => `
+        <tr>
+          <td title="requested: ${{esc(n.requested_url)}}">${{esc(n.url || n.requested_url)}}</td>
+          <td>${{ms(n.ttfb)}}</td><td>${{ms(n.dom_content_loaded)}}</td><td>${{ms(n.load)}}</td>
+          <td>${{ms(n.fcp)}}</td><td>${{ms(n.lcp)}}</td>
+          <td>${{n.js_heap_used == null ? "–" : (n.js_heap_used / 1048576).toFixed(1) + " MB"}}</td>
+          <td>${{n.dom_nodes == null ? "–" : n.dom_nodes}}</td>
+          <td>${{n.layout_count == null ? "–" : n.layout_count}}</td>
+        </tr>
+      `).join("");
+
+      return `
+        <details class="navigations">
+          <summary>Page performance – ${{navs.length}} navigation(s)</summary>
+          <table class="nav-table">
+            <tr><th>URL</th><th>TTFB</th><th>DCL</th><th>Load</th><th>FCP</th><th>LCP</th><th>JS heap</th><th>Nodes</th><th>Layouts</th></tr>
+            ${{rows}}
+          </table>
+        </details>
+      `;
+    }}
+
+    function seconds(duration) {{
+      return parseFloat(String(duration || "0")) || 0;
+    }}
+
+    // last 20 durations of a test up to (and including) the selected run
+    function sparklineHtml(key, runId) {{
+      const hist = ((window.FATTAL_DURATION_HISTORY || {{}}).tests || {{}})[key];
+      if (!hist || !Array.isArray(hist.samples)) return "";
+
+      const samples = hist.samples.filter(s => s[0] <= runId).slice(-20);
+      if (samples.length < 2) return "";
+
+      const w = 120, h = 22;
+      const max = Math.max(...samples.map(s => s[1]), 0.01);
+      const pts = samples.map((s, i) => [
+        ((i / (samples.length - 1)) * (w - 4) + 2).toFixed(1),
+        (h - 2 - (s[1] / max) * (h - 4)).toFixed(1),
+      ]);
+      const dots = samples.map((s, i) => s[2] === "PASSED" ? "" :
+        `<circle cx="${{pts[i][0]}}" cy="${{pts[i][1]}}" r="2" fill="#dc2626"/>`).join("");
+      const last = pts[pts.length - 1];
+      const title = `last ${{samples.length}} runs: ` + samples.map(s => s[1] + "s").join(", ");
+
+      return ` <svg class="sparkline" width="${{w}}" height="${{h}}"><title>${{esc(title)}}</title>` +
+        `<polyline points="${{pts.map(p => p.join(",")).join(" ")}}" fill="none" stroke="#3b82f6" stroke-width="1.5"/>` +
+        `${{dots}}<circle cx="${{last[0]}}" cy="${{last[1]}}" r="2.5" fill="#111"/></svg>`;
+    }}
+
+    function regressionBadge(stats) {{
+      if (!stats || !stats.regressed) return "";
+      return ` <span class="regressed" title="p50 ${{stats.p50}}s, p95 ${{stats.p95}}s over ${{stats.samples}} run(s)">` +
+        `⚠ ${{stats.ratio}}× p95</span>`;
+    }}
+
+    function perfPanelHtml(data) {{
+      if (!data.length) return "";
+
+      const slowest = data.slice()
+        .sort((a, b) => seconds(b.duration) - seconds(a.duration))
+        .slice(0, 5);
+      const regressed = data
+        .filter(t => t.duration_stats && t.duration_stats.ratio > 1)
+        .sort((a, b) => b.duration_stats.ratio - a.duration_stats.ratio)
+        .slice(0, 5);
+
+      const item = (t, extra) => `<li>${{esc(t.name)}} – ${{t.duration}}${{extra}}</li>`;
+      const slowList = slowest.map(t => {{
+        const st = t.duration_stats;
+        return item(t, st && st.p50 != null ? ` <span class="muted">(p50 ${{st.p50}}s)</span>` : "");
+      }}).join("");
+      const regList = regressed.length
+        ? regressed.map(t => item(t, ` <span class="${{t.duration_stats.regressed ? "regressed" : "muted"}}">` +
+            `${{t.duration_stats.ratio}}× p95 (${{t.duration_stats.p95}}s)</span>`)).join("")
+        : `<li class="muted">nothing slower than its p95</li>`;
+
+      return `
+        <div class="perf-panel">
+          <div><h4>Slowest</h4><ol>${{slowList}}</ol></div>
+          <div><h4>Most regressed</h4><ol>${{regList}}</ol></div>
+        </div>
+      `;
+    }}
+
+    function populateRun(runId) {{
+      if (!runId) return;
+
+      const entry = (window.FATTAL_RUN_INDEX || []).find(r => r.id === runId);
+      if (entry && entry.archived) {{
+        document.getElementById("results").innerHTML =
+          `<p class="meta-line">This run was archived to <strong>reports/${{entry.archive}}</strong> ` +
+          `(run folder and screenshots).</p>`;
+        return;
+      }}
+      loadRun(runId, data => renderRun(runId, data));
+    }}
+
+    function renderRun(runId, data) {{
+      // ignore late loads for a run that is no longer selected
+      if (document.getElementById("runSelect").value !== runId) return;
+
+      const container = document.getElementById("results");
+      container.innerHTML = perfPanelHtml(data);
+
+      const showPassed = document.getElementById("filterPassed").checked;
+      const showFailed = document.getElementById("filterFailed").checked;
+
+      data.forEach(test => {{
+        if ((test.status === "PASSED" && !showPassed) || (test.status === "FAILED" && !showFailed)) return;
+
+        const div = document.createElement("div");
+        div.classList.add("test-entry");
+
+        const color = test.status === "PASSED" ? "green" : "red";
+
+        const steps = Array.isArray(test.steps) ? test.steps.slice(0, 4) : [];
+        const hasSteps = steps.length > 0;
+
+        let gridHtml = "";
+
+        if (hasSteps) {{
+          const cards = steps.map(s => {{
+            const src = shotSrc(runId, s.file, s.blob);
+            const thumb = shotSrc(runId, s.thumb || s.file, s.thumb_blob || s.blob);
+            return `
+              <div class="step-card">
+                <div class="step-title">${{s.label}}</div>
+                <img src="${{thumb}}" loading="lazy" onclick="openModal('${{src}}')" />
+              </div>
+            `;
+          }}).join("");
+
+          gridHtml = `<div class="steps-grid">${{cards}}</div>`;
+        }} else {{
+          const src = shotSrc(runId, test.final_screenshot, test.final_blob);
+          const thumb = shotSrc(runId, test.final_thumb || test.final_screenshot, test.final_thumb_blob || test.final_blob);
+          if (src) {{
+            gridHtml = `
+              <div class="steps-grid" style="grid-template-columns: minmax(200px, 340px);">
+                <div class="step-card">
+                  <div class="step-title">final_screenshot</div>
+                  <img src="${{thumb}}" loading="lazy" onclick="openModal('${{src}}')" />
+                </div>
+              </div>
+            `;
+          }}
+        }}
+
+        div.innerHTML = `
+          <h3>${{test.name}} — <span style="color:${{color}}">${{test.status}}</span></h3>
+          <p class="meta-line"><strong>Timestamp:</strong> ${{test.timestamp}} | <strong>Duration:</strong> ${{test.duration}}${{regressionBadge(test.duration_stats)}}${{sparklineHtml(test.nodeid || test.name, runId)}}${{networkLine(test.network)}}</p>
+          ${{gridHtml}}
+          ${{waterfallHtml(test.spans)}}
+          ${{navigationsHtml(test.navigations)}}
+          <hr>
+        `;
+
+        container.appendChild(div);
+      }});
+    }}
+
+    window.addEventListener("scroll", () => {{
+      const btn = document.getElementById("backToTop");
+      btn.style.display = (window.scrollY > 450) ? "block" : "none";
+    }});
+
+    function backToTop() {{
+      window.scrollTo({{ top: 0, behavior: "smooth" }});
+    }}
+  </script>
+</head>
+
+<body onload="buildRunOptions()">
+  <div class="dashboard-header">
+    <h1>{DASHBOARD_TITLE}</h1>
+    <img src="{logo_path}" alt="Fattal Logo" class="header-logo" />
+  </div>
+
+  <label>Choose Run:
+    <select id="runSelect" onchange="populateRun(this.value)"></select>
+  </label>
+
+  <div style="margin-top: 10px;">
+    <label><input type="checkbox" id="filterPassed" checked onchange="populateRun(document.getElementById('runSelect').value)"> Show Passed</label>
+    <label><input type="checkbox" id="filterFailed" checked onchange="populateRun(document.getElementById('runSelect').value)"> Show Failed</label>
+  </div>
+
+  <div id="results" style="margin-top: 20px;"></div>
+
+  <button id="backToTop" onclick="backToTop()" title="Back to top">↑</button>
+
+  <div id="screenshotModal" class="modal" onclick="closeModal()">
+    <span class="close">&times;</span>
+    <img class="modal-content" id="modalImage">
+  </div>
+</body>
+</html>
+"""
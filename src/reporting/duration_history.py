@@ -0,0 +1,144 @@
+"""
+Per-test duration history across runs.
+
+reports/runs/history.json keeps the last DURATION_HISTORY_WINDOW samples of
+every test, keyed by node id (same-named tests in different modules are
+different series):
+
+    {"version": 2,
+     "tests": {"tests/test_x.py::test_name": {"samples": [[run_id, seconds, status], ...],
+                                             "p50": ..., "p95": ...}}}
+
+Each session appends only its own results and recomputes the stats of the
+tests it ran, so the cost does not grow with the number of runs.
+history.js holds the same data for the dashboard (sparklines, slowest /
+most-regressed panel), loaded with a <script> tag like runs/index.js.
+
+A passing test is flagged as regressed when its duration exceeds
+DURATION_REGRESSION_FACTOR x p95 of its earlier passing samples, once it has
+at least DURATION_REGRESSION_MIN_SAMPLES of them. Failed runs are kept in the
+history but not used as a baseline - timeouts would inflate it.
+"""
+import json
+import math
+from pathlib import Path
+
+from src.core.config import (
+    DURATION_HISTORY_WINDOW,
+    DURATION_REGRESSION_FACTOR,
+    DURATION_REGRESSION_MIN_SAMPLES,
+)
+
+HISTORY_FILE = "history.json"
+HISTORY_JS = "history.js"
+# v1 was keyed by test name; older files are rebuilt from the runs on disk
+HISTORY_VERSION = 2
+
+
+def history_key(test: dict) -> str | None:
+    """Series a run_data record belongs to: its node id (records before node ids: its name)."""
+    return test.get("nodeid") or test.get("name")
+
+
+def duration_seconds(test: dict) -> float:
+    """Test duration from a run_data record ("1.23s")."""
+    try:
+        return float(str(test.get("duration", "0")).rstrip("s"))
+    except ValueError:
+        return 0.0
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Linear-interpolated percentile (pct in 0..100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo, hi = math.floor(k), math.ceil(k)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def _passed_durations(samples: list) -> list[float]:
+    return [s[1] for s in samples if s[2] == "PASSED"]
+
+
+class DurationHistory:
+    def __init__(
+        self,
+        runs_dir: Path,
+        window: int = DURATION_HISTORY_WINDOW,
+        factor: float = DURATION_REGRESSION_FACTOR,
+        min_samples: int = DURATION_REGRESSION_MIN_SAMPLES,
+    ):
+        self.path = Path(runs_dir) / HISTORY_FILE
+        self.js_path = Path(runs_dir) / HISTORY_JS
+        self.window = window
+        self.factor = factor
+        self.min_samples = min_samples
+        self.tests = self._load()
+
+    def exists(self) -> bool:
+        return self._version == HISTORY_VERSION
+
+    def _load(self) -> dict:
+        self._version = None
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        self._version = data.get("version")
+        return data.get("tests", {}) if self._version == HISTORY_VERSION else {}
+
+    def add_run(self, run_id: str, tests: list[dict]) -> dict[str, dict]:
+        """
+        Adds one run's results. Returns per-test stats against the earlier
+        samples: {history_key: {p50, p95, samples, ratio, regressed}}.
+        A run that is already in the history is not added twice.
+        """
+        stats = {}
+        for test in tests:
+            key = history_key(test)
+            if not key:
+                continue
+            entry = self.tests.setdefault(key, {"samples": []})
+            samples = entry["samples"]
+            if any(s[0] == run_id for s in samples):
+                continue
+
+            seconds = duration_seconds(test)
+            status = test.get("status", "")
+            baseline = _passed_durations(samples)
+            p50, p95 = percentile(baseline, 50), percentile(baseline, 95)
+            ratio = round(seconds / p95, 2) if p95 else None
+            stats[key] = {
+                "p50": round(p50, 2) if p50 is not None else None,
+                "p95": round(p95, 2) if p95 is not None else None,
+                "samples": len(baseline),
+                "ratio": ratio,
+                "regressed": bool(
+                    status == "PASSED"
+                    and ratio is not None
+                    and len(baseline) >= self.min_samples
+                    and ratio > self.factor
+                ),
+            }
+
+            samples.append([run_id, round(seconds, 2), status])
+            samples.sort(key=lambda s: s[0])
+            del samples[:-self.window]
+            self._update_stats(entry)
+        return stats
+
+    @staticmethod
+    def _update_stats(entry: dict):
+        durations = _passed_durations(entry["samples"])
+        p50, p95 = percentile(durations, 50), percentile(durations, 95)
+        entry["p50"] = round(p50, 2) if p50 is not None else None
+        entry["p95"] = round(p95, 2) if p95 is not None else None
+
+    def save(self):
+        payload = json.dumps({"version": HISTORY_VERSION, "tests": self.tests}, ensure_ascii=False)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(payload, encoding="utf-8")
+        tmp.replace(self.path)
+        self.js_path.write_text(f"window.FATTAL_DURATION_HISTORY = {payload};\n", encoding="utf-8")
@@ -0,0 +1,171 @@
+"""
+Retention for reports/runs.
+
+A run stays in the live tree if any policy keeps it:
+  - it is one of the newest REPORTS_KEEP_LAST runs
+  - it is newer than REPORTS_KEEP_DAYS days
+  - it has failures (REPORTS_KEEP_FAILED)
+  - it is the newest passing run of its day and newer than REPORTS_DOWNSAMPLE_DAYS
+
+Everything else is packed into reports/archive/<run_id>.tar.gz (run folder
+plus the screenshot blobs it references), removed from the live tree, and
+kept in the run index as an "archived" summary. Decisions are made from the
+index alone, so only expiring runs are ever read from disk.
+
+Manual run:  python -m src.reporting.retention [--dry-run]
+"""
+import argparse
+import json
+import shutil
+import tarfile
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.core.config import (
+    REPORTS_KEEP_LAST,
+    REPORTS_KEEP_DAYS,
+    REPORTS_KEEP_FAILED,
+    REPORTS_DOWNSAMPLE_DAYS,
+)
+from src.core.logger import logger
+from src.reporting import run_index
+from src.reporting.blob_store import BlobStore, blobs_of, thumb_name
+
+
+@dataclass
+class RetentionPolicy:
+    keep_last: int = REPORTS_KEEP_LAST
+    keep_days: int = REPORTS_KEEP_DAYS
+    keep_failed: bool = REPORTS_KEEP_FAILED
+    downsample_days: int = REPORTS_DOWNSAMPLE_DAYS
+
+
+def run_datetime(run_id: str) -> datetime | None:
+    try:
+        return datetime.strptime(run_id.replace("run_", "")[:19], "%Y-%m-%d_%H-%M-%S")
+    except ValueError:
+        return None
+
+
+def select_expired(entries: list[dict], policy: RetentionPolicy, now: datetime | None = None) -> list[str]:
+    """Run IDs (from live index entries) that no policy keeps."""
+    now = now or datetime.now()
+    live = sorted(
+        (e for e in entries if not e.get("archived")),
+        key=lambda e: e["id"],
+        reverse=True,
+    )
+
+    keep = {e["id"] for e in live[:max(0, policy.keep_last)]}
+    days_seen = set()
+
+    for e in live:
+        started = run_datetime(e["id"])
+        age = (now - started) if started else timedelta(0)  # unparsable IDs are treated as new
+
+        if age <= timedelta(days=policy.keep_days):
+            keep.add(e["id"])
+        elif policy.keep_failed and e.get("failed", 0) > 0:
+            keep.add(e["id"])
+        elif age <= timedelta(days=policy.downsample_days) and started.date() not in days_seen:
+            keep.add(e["id"])
+
+        if started and e.get("failed", 0) == 0 and e["id"] in keep:
+            days_seen.add(started.date())
+
+    return [e["id"] for e in live if e["id"] not in keep]
+
+
+def _archive_run(run_dir: Path, archive_dir: Path, store: BlobStore) -> set[str]:
+    """Packs one run (and its blobs) into a tar.gz. Returns the blobs it referenced."""
+    blobs = set()
+    data_file = run_dir / "run_data.json"
+    if data_file.exists():
+        try:
+            blobs = blobs_of(json.loads(data_file.read_text(encoding="utf-8")))
+        except json.JSONDecodeError:
+            pass
+
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    target = archive_dir / f"{run_dir.name}.tar.gz"
+    tmp = target.with_suffix(".tmp")
+    with tarfile.open(tmp, "w:gz") as tar:
+        tar.add(run_dir, arcname=run_dir.name)
+        for blob in blobs:
+            for name in (blob, thumb_name(blob)):
+                path = store.path_of(name)
+                if path.exists():
+                    tar.add(path, arcname=f"{run_dir.name}/blobs/{name}")
+    tmp.replace(target)
+
+    shutil.rmtree(run_dir)
+    return blobs
+
+
+def apply_retention(
+    runs_dir: Path,
+    archive_dir: Path,
+    store: BlobStore,
+    policy: RetentionPolicy | None = None,
+    now: datetime | None = None,
+    dry_run: bool = False,
+) -> list[str]:
+    """Archives expired runs and compacts the index. Returns the archived run IDs."""
+    policy = policy or RetentionPolicy()
+    entries = run_index.read_index(runs_dir)
+    expired = select_expired(entries, policy, now)
+    if dry_run:
+        return expired
+
+    if expired:
+        _archive_expired(runs_dir, archive_dir, store, entries, expired)
+
+    # always: blobs orphaned by crashed or aborted sessions have no run to expire with
+    removed, freed = store.gc(now=now.timestamp() if now else None)
+    logger.info(
+        f"Retention: archived {len(expired)} run(s), "
+        f"removed {removed} unreferenced screenshot(s), freed {freed / 1024:.0f} KB"
+    )
+    return expired
+
+
+def _archive_expired(runs_dir: Path, archive_dir: Path, store: BlobStore, entries: list[dict], expired: list[str]):
+    released = []  # each run held one reference per blob, so a blob may appear several times
+    archived = []
+    for run_id in expired:
+        run_dir = Path(runs_dir) / run_id
+        if run_dir.is_dir():
+            released.extend(_archive_run(run_dir, Path(archive_dir), store))
+        archived.append(run_id)
+
+    if released:
+        store.release_refs(released)
+
+    archived_set = set(archived)
+    for e in entries:
+        if e["id"] in archived_set:
+            e["archived"] = True
+            e["archive"] = f"{Path(archive_dir).name}/{e['id']}.tar.gz"
+    run_index.write_index(runs_dir, entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply report retention to reports/runs")
+    parser.add_argument("--reports-dir", default=str(Path(__file__).resolve().parents[2] / "reports"))
+    parser.add_argument("--dry-run", action="store_true", help="only list the runs that would be archived")
+    args = parser.parse_args()
+
+    reports_dir = Path(args.reports_dir)
+    expired = apply_retention(
+        reports_dir / "runs",
+        reports_dir / "archive",
+        BlobStore(reports_dir / "blobs"),
+        dry_run=args.dry_run,
+    )
+    for run_id in expired:
+        print(run_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Compact, append-only run index for the dashboard.
+
+reports/runs/index.js holds one summary line per run:
+
+    FATTAL_RUN_INDEX.push({"id": ..., "label": ..., "total": ..., ...});
+
+Adding a run appends a single line, so finishing a session costs the same no
+matter how many runs exist. The file is plain JavaScript so the dashboard can
+load it with a <script> tag straight from disk (fetch() is blocked on file://).
+Per-run test data lives next to run_data.json as run_data.js and is loaded on
+demand when a run is selected.
+"""
+import json
+from datetime import datetime
+from pathlib import Path
+
+from src.reporting.duration_history import duration_seconds
+
+INDEX_FILE = "index.js"
+RUN_DATA_JS = "run_data.js"
+
+_HEADER = "window.FATTAL_RUN_INDEX = window.FATTAL_RUN_INDEX || [];\n"
+_PREFIX = "FATTAL_RUN_INDEX.push("
+_SUFFIX = ");"
+
+
+def index_path(runs_dir: Path) -> Path:
+    return Path(runs_dir) / INDEX_FILE
+
+
+def _entry_line(entry: dict) -> str:
+    return f"{_PREFIX}{json.dumps(entry, ensure_ascii=False)}{_SUFFIX}\n"
+
+
+def read_index(runs_dir: Path) -> list[dict]:
+    """All index entries, oldest first. A later line for the same run ID replaces the earlier one."""
+    path = index_path(runs_dir)
+    if not path.exists():
+        return []
+
+    entries = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not (line.startswith(_PREFIX) and line.endswith(_SUFFIX)):
+            continue
+        try:
+            entry = json.loads(line[len(_PREFIX):-len(_SUFFIX)])
+        except json.JSONDecodeError:
+            continue
+        entries.pop(entry.get("id"), None)
+        entries[entry.get("id")] = entry
+    return list(entries.values())
+
+
+def append_entry(runs_dir: Path, entry: dict):
+    path = index_path(runs_dir)
+    if not path.exists():
+        path.write_text(_HEADER, encoding="utf-8")
+    with path.open("a", encoding="utf-8") as f:
+        f.write(_entry_line(entry))
+
+
+def write_index(runs_dir: Path, entries: list[dict]):
+    """Rewrites the whole index (migration / compaction only)."""
+    path = index_path(runs_dir)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(_HEADER + "".join(_entry_line(e) for e in entries), encoding="utf-8")
+    tmp.replace(path)
+
+
+def write_run_data_js(run_dir: Path, run_id: str, tests: list[dict]):
+    payload = json.dumps(tests, ensure_ascii=False)
+    (Path(run_dir) / RUN_DATA_JS).write_text(
+        "window.FATTAL_RUN_DATA = window.FATTAL_RUN_DATA || {};\n"
+        f"FATTAL_RUN_DATA[{json.dumps(run_id)}] = {payload};\n",
+        encoding="utf-8"
+    )
+
+
+def load_all_runs(runs_dir: Path) -> dict:
+    """{run_id: tests} from every run_data.json (newest first). Reads all runs: migrations only."""
+    run_data = {}
+    runs_dir = Path(runs_dir)
+    if not runs_dir.exists():
+        return run_data
+
+    for run_folder in sorted(runs_dir.iterdir(), reverse=True):
+        if not run_folder.is_dir():
+            continue
+        data_file = run_folder / "run_data.json"
+        if data_file.exists():
+            try:
+                run_data[run_folder.name] = json.loads(data_file.read_text(encoding="utf-8"))
+            except Exception:
+                pass
+    return run_data
+
+
+def format_run_label(run_id: str, tests: list[dict]) -> str:
+    try:
+        dt = datetime.strptime(run_id.replace("run_", "")[:19], "%Y-%m-%d_%H-%M-%S")
+        day_name = dt.strftime("%A")
+        ts = dt.strftime("%Y-%m-%d %H:%M:%S")
+    except Exception:
+        day_name = ""
+        ts = run_id
+
+    total = len(tests)
+    passed = sum(1 for t in tests if t.get("status") == "PASSED")
+    failed = sum(1 for t in tests if t.get("status") == "FAILED")
+    desktop = total
+
+    return f"{day_name} {ts} | {total} tests | ✅ {passed} | ❌ {failed} | 💻 {desktop}"
+
+
+def run_summary(run_id: str, tests: list[dict], duration_sec: float | None = None) -> dict:
+    """Compact index entry for one run."""
+    if duration_sec is None:
+        duration_sec = sum(duration_seconds(t) for t in tests)
+    return {
+        "id": run_id,
+        "label": format_run_label(run_id, tests),
+        "total": len(tests),
+        "passed": sum(1 for t in tests if t.get("status") == "PASSED"),
+        "failed": sum(1 for t in tests if t.get("status") == "FAILED"),
+        "duration": round(duration_sec, 2),
+        "regressed": sum(1 for t in tests if (t.get("duration_stats") or {}).get("regressed")),
+    }
+
+
+def ensure_index(runs_dir: Path):
+    """
+    One-time migration for report folders created before the run index existed:
+    builds index.js and run_data.js from the existing run_data.json files.
+    """
+    runs_dir = Path(runs_dir)
+    if index_path(runs_dir).exists():
+        return
+
+    all_runs = load_all_runs(runs_dir)
+    entries = []
+    for run_id in sorted(all_runs.keys()):
+        tests = all_runs[run_id]
+        write_run_data_js(runs_dir / run_id, run_id, tests)
+        entries.append(run_summary(run_id, tests))
+    write_index(runs_dir, entries)
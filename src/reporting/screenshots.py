@@ -0,0 +1,107 @@
+"""
+Background screenshot writer.
+
+The test thread only grabs the raw PNG bytes from the driver
+(get_screenshot_as_png) and hands them over; encoding to a compact format,
+thumbnail generation and disk I/O happen on a small thread pool.
+
+Images go to the content-addressed BlobStore, keyed by the digest of the raw
+PNG. The blob name is known up front, so the test record can reference it
+before the file is written, and an image that is already in the store is not
+encoded or written again. Call flush() before the report is finalized.
+"""
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.config import SCREENSHOT_FORMAT, SCREENSHOT_QUALITY, SCREENSHOT_THUMB_WIDTH
+from src.core.logger import logger
+from src.reporting.blob_store import BlobStore, digest_of, thumb_name
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional: fall back to storing the original PNG
+    Image = None
+
+_EXTENSIONS = {"webp": ".webp", "jpeg": ".jpg", "jpg": ".jpg", "png": ".png"}
+_PIL_FORMATS = {"webp": "WEBP", "jpeg": "JPEG", "jpg": "JPEG", "png": "PNG"}
+
+
+class ScreenshotWriter:
+    def __init__(
+        self,
+        fmt: str = SCREENSHOT_FORMAT,
+        quality: int = SCREENSHOT_QUALITY,
+        thumb_width: int = SCREENSHOT_THUMB_WIDTH,
+        max_workers: int = 2,
+    ):
+        if fmt not in _EXTENSIONS:
+            raise ValueError(f"Unsupported SCREENSHOT_FORMAT: {fmt}")
+        self.fmt = fmt if Image is not None else "png"
+        self.quality = quality
+        self.thumb_width = thumb_width
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="screenshot-writer")
+        self._pending = []
+        self._inflight = set()
+        self._lock = threading.Lock()
+
+    @property
+    def extension(self) -> str:
+        return _EXTENSIONS[self.fmt]
+
+    def submit(self, png: bytes, store: BlobStore) -> dict:
+        """
+        Queues one screenshot for the content-addressed store.
+        Returns {"blob": ..., "thumb_blob": ...} (blob names inside the store).
+        """
+        blob = f"{digest_of(png)}{self.extension}"
+        thumb = thumb_name(blob) if Image is not None else blob
+
+        with self._lock:
+            known = blob in self._inflight or store.exists(blob)
+            self._inflight.add(blob)
+        if not known:
+            self._pending.append(self._pool.submit(self._write_blob, png, store, blob, thumb))
+        return {"blob": blob, "thumb_blob": thumb}
+
+    def flush(self):
+        pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"Screenshot write failed: {e}")
+
+    def close(self):
+        self.flush()
+        self._pool.shutdown(wait=True)
+
+    def _write_blob(self, png: bytes, store: BlobStore, blob: str, thumb_blob: str):
+        full, thumb = self._encode(png)
+        if thumb is not None:
+            store.write(thumb_blob, thumb)
+        store.write(blob, full)  # last: exists(blob) implies the thumbnail is there too
+
+    def _encode(self, png: bytes) -> tuple[bytes, bytes | None]:
+        """(full image, thumbnail) in the configured format; no thumbnail without Pillow."""
+        if Image is None:
+            return png, None
+
+        with Image.open(io.BytesIO(png)) as img:
+            img = img.convert("RGB")
+            full = self._save(img, self.quality)
+
+            img.thumbnail((self.thumb_width, self.thumb_width * 4))
+            thumb = self._save(img, min(self.quality, 70))
+        return full, thumb
+
+    def _save(self, img, quality: int) -> bytes:
+        out = io.BytesIO()
+        pil_format = _PIL_FORMATS[self.fmt]
+        if pil_format == "PNG":
+            img.save(out, pil_format, optimize=True)
+        elif pil_format == "WEBP":
+            img.save(out, pil_format, quality=quality, method=4)
+        else:
+            img.save(out, pil_format, quality=quality, optimize=True)
+        return out.getvalue()
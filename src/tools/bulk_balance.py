@@ -0,0 +1,290 @@
+"""
+Bulk gift-code balance checker.
+
+    python -m src.tools.bulk_balance codes.csv -o balances.jsonl --workers 4
+    python -m src.tools.bulk_balance codes.csv --mode api --workers 16
+
+Codes are read lazily from CSV (a "code" column, or the first column), JSONL
+({"code": ...}) or plain text (one code per line) and handed to N workers.
+In browser mode each worker owns one browser and keeps the balance modal open
+between codes (HomePage -> BalanceModal.check_balance); in api mode the
+workers share one pooled BalanceClient (src/api/balance_client.py) and no
+browser is started. Every result is appended to the output as soon as it
+finishes:
+
+    {"code": ..., "status": "ok", "balance": 250.0, "message": ...,
+     "error": null, "latency_ms": 812.4, "worker": 0}
+
+status is "ok" (balance found), "invalid" (the site answered without a
+balance, e.g. unknown code) or "error" (the check itself failed). In browser
+mode only a message in the success format ("יתרה: 250 ILS", label + amount +
+currency) counts as a balance; any other text, digits or not, is "invalid".
+
+The output file is the checkpoint: running again with the same output skips
+codes that already have an "ok" / "invalid" result and retries the errors.
+--restart starts from scratch.
+"""
+import argparse
+import csv
+import json
+import queue
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+
+from selenium.common.exceptions import WebDriverException
+
+from src.core.config import BASE_URL
+from src.core.logger import logger
+
+FINAL_STATUSES = ("ok", "invalid")
+# success message of the balance modal: "יתרה: 1,200.50 ILS" (also ₪ / ש"ח)
+_BALANCE_MESSAGE = re.compile(r'יתרה\s*:?\s*(\d[\d,]*(?:\.\d+)?)\s*(?:ILS|₪|ש"ח)')
+
+
+def read_codes(path: Path) -> Iterator[str]:
+    """Yields codes one at a time; the input file is never loaded whole."""
+    path = Path(path)
+    with path.open(encoding="utf-8-sig", newline="") as f:
+        if path.suffix.lower() == ".jsonl":
+            for line in f:
+                line = line.strip()
+                if line:
+                    code = str(json.loads(line).get("code", "")).strip()
+                    if code:
+                        yield code
+        elif path.suffix.lower() == ".csv":
+            rows = csv.reader(f)
+            header = next(rows, None)
+            if header is None:
+                return
+            names = [h.strip().lower() for h in header]
+            if "code" in names:
+                column = names.index("code")
+            else:
+                column = 0
+                if header[0].strip():
+                    yield header[0].strip()  # no header row: the first line is a code
+            for row in rows:
+                if len(row) > column and row[column].strip():
+                    yield row[column].strip()
+        else:
+            for line in f:
+                if line.strip():
+                    yield line.strip()
+
+
+def load_checkpoint(output: Path) -> set[str]:
+    """Codes that already have a final result in `output`."""
+    done = set()
+    if not Path(output).exists():
+        return done
+    with Path(output).open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # line cut short by a crash
+            if record.get("status") in FINAL_STATUSES:
+                done.add(record.get("code"))
+    return done
+
+
+def parse_balance(message: str) -> float | None:
+    """The amount of a success message; None for anything else (errors may echo the code's digits)."""
+    match = _BALANCE_MESSAGE.search(message or "")
+    return float(match.group(1).replace(",", "")) if match else None
+
+
+class BrowserChecker:
+    """One browser with the balance modal kept open between codes."""
+
+    def __init__(self, base_url: str | None = None):
+        self.base_url = base_url
+        self.driver = None
+        self.modal = None
+
+    def _open(self):
+        from src.core.driver_factory import create_driver
+        from src.pages.home_page import HomePage
+
+        self.driver = create_driver()
+        home = HomePage(self.driver)
+        if self.base_url:
+            home.URL = self.base_url
+        home.load()
+        self.modal = home.open_check_balance_modal()
+
+    def check(self, code: str) -> dict:
+        if self.modal is None:
+            self._open()
+        try:
+            message = self.modal.check_balance(code)
+        except WebDriverException:
+            self.close()  # reopened on the next code
+            raise
+
+        balance = parse_balance(message)
+        return {
+            "status": "ok" if balance is not None else "invalid",
+            "balance": balance,
+            "message": message,
+        }
+
+    def close(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+        self.driver = None
+        self.modal = None
+
+
+class ApiChecker:
+    """Balance checks over HTTP through a shared BalanceClient."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def check(self, code: str) -> dict:
+        result = self.client.check(code)
+        return {
+            "status": "ok" if result.found else "invalid",
+            "balance": result.balance,
+            "message": f"{result.balance} {result.currency}" if result.found else f"HTTP {result.http_status}",
+        }
+
+    def close(self):
+        pass  # the client is shared between workers and closed by main()
+
+
+def _check_one(checker, code: str, worker: int, attempts: int = 2) -> dict:
+    start = time.perf_counter()
+    error = None
+    for _ in range(attempts):
+        try:
+            result = checker.check(code)
+            break
+        except Exception as e:
+            error = f"{e.__class__.__name__}: {str(e).strip()[:200]}"
+    else:
+        result = {"status": "error", "balance": None, "message": None}
+
+    return {
+        "code": code,
+        **result,
+        "error": None if result["status"] != "error" else error,
+        "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+        "worker": worker,
+    }
+
+
+def run_bulk(codes, output: Path, workers: int, checker_factory, restart: bool = False) -> dict:
+    """
+    Checks `codes` (any iterable) with `workers` checkers from checker_factory().
+    A checker has check(code) -> {"status", "balance", "message"} and close().
+    """
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    done = set() if restart else load_checkpoint(output)
+
+    # a crash can leave a half-written last line; start the next record on its own line
+    if not restart and output.exists() and output.stat().st_size:
+        with output.open("rb") as f:
+            f.seek(-1, 2)
+            needs_newline = f.read(1) != b"\n"
+    else:
+        needs_newline = False
+
+    todo = queue.Queue(maxsize=workers * 2)  # keeps reading the input lazy
+    lock = threading.Lock()
+    failed = threading.Event()
+    errors = []
+    counts = {"ok": 0, "invalid": 0, "error": 0, "skipped": 0}
+
+    with output.open("w" if restart else "a", encoding="utf-8") as out:
+        if needs_newline:
+            out.write("\n")
+
+        def work(index: int):
+            try:
+                checker = checker_factory()
+                try:
+                    while (code := todo.get()) is not None:
+                        record = _check_one(checker, code, index)
+                        with lock:
+                            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                            out.flush()
+                            counts[record["status"]] += 1
+                finally:
+                    checker.close()
+            except Exception as e:
+                errors.append(e)
+                failed.set()
+                # keep taking codes (unrecorded, so a rerun retries them) until the
+                # stop marker, so the producer never blocks on a full queue
+                while todo.get() is not None:
+                    pass
+
+        threads = [threading.Thread(target=work, args=(i,), name=f"balance-{i}") for i in range(workers)]
+        for t in threads:
+            t.start()
+        try:
+            for code in codes:
+                if failed.is_set():
+                    break
+                if code in done:
+                    counts["skipped"] += 1
+                    continue
+                done.add(code)  # duplicates in the input are checked once
+                todo.put(code)
+        finally:
+            for _ in threads:
+                todo.put(None)
+            for t in threads:
+                t.join()
+    if errors:
+        raise errors[0]
+    return counts
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check balances for many gift codes")
+    parser.add_argument("input", type=Path, help="CSV (code column), JSONL ({\"code\": ...}) or text file")
+    parser.add_argument("-o", "--output", type=Path, help="results JSONL (default: <input>.balances.jsonl)")
+    parser.add_argument("--mode", choices=("browser", "api"), default="browser",
+                        help="check through the balance modal or directly over HTTP")
+    parser.add_argument("--workers", type=int, default=2, help="parallel browsers / concurrent requests")
+    parser.add_argument("--base-url", help="site to check against (default: BASE_URL)")
+    parser.add_argument("--restart", action="store_true", help="ignore previous results in the output file")
+    args = parser.parse_args(argv)
+
+    output = args.output or args.input.with_suffix(".balances.jsonl")
+    workers = max(1, args.workers)
+    client = None
+    if args.mode == "api":
+        from src.api.balance_client import BalanceClient
+
+        client = BalanceClient(base_url=args.base_url or BASE_URL, max_concurrency=workers)
+        factory = lambda: ApiChecker(client)
+    else:
+        factory = lambda: BrowserChecker(args.base_url)
+
+    start = time.perf_counter()
+    try:
+        counts = run_bulk(read_codes(args.input), output, workers, factory, restart=args.restart)
+    finally:
+        if client is not None:
+            client.close()
+    logger.info(
+        f"Balances -> {output}: ok={counts['ok']} invalid={counts['invalid']} "
+        f"error={counts['error']} skipped={counts['skipped']} in {time.perf_counter() - start:.1f}s"
+    )
+    return 1 if counts["error"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,18 +1,56 @@
 import json
-import re
+import os
 import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 import pytest
-
-from src.core.driver_factory import create_driver
+from selenium.common.exceptions import WebDriverException
+
+from src.core.config import (
+    NETWORK_PROFILE,
+    SESSION_WARMUP,
+    LOCAL_SITE,
+    NETWORK_ACCOUNTING,
+    BASIC_AUTH_USER,
+    BASIC_AUTH_PASSWORD,
+)
+from src.core.driver_pool import DriverPool
+from src.core.instrumentation import span, start_recording, stop_recording
+from src.core.page_metrics import start_collecting, stop_collecting
+from src.core.logger import logger
+from src.core.network_profiles import (
+    NETWORK_PROFILES,
+    NetworkMeter,
+    apply_network_profile,
+    merge_baseline,
+    summarize_by_profile,
+)
+from src.core.session_state import (
+    CheckpointStore,
+    capture_session,
+    clear_restore,
+    restore_checkpoint,
+    restore_session,
+)
+from src.core.waits import WAIT_STATS
+from src.local_site.server import LocalSite, LocalSiteSettings
+from src.pages.base_page import site_url
+from src.pages.checkout_page import CheckoutPage
+from src.pages.home_page import HomePage
+from src.pages.payment_page import PaymentPage
+from src.reporting import run_index
+from src.reporting.blob_store import BlobStore, blobs_of
+from src.reporting.dashboard import build_dashboard_html
+from src.reporting.duration_history import DurationHistory, history_key
+from src.reporting.retention import apply_retention
+from src.reporting.screenshots import ScreenshotWriter
 
 
 # =========================================================
 # Dashboard settings
 # =========================================================
-DASHBOARD_TITLE = "Fattal QA Automation Dashboard - Fattal- Gift"
 LOGO_FILENAME = "logo.svg"  # must exist in PROJECT ROOT
 
 
@@ -23,17 +61,36 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]  # tests/ -> project root
 REPORTS_DIR = PROJECT_ROOT / "reports"
 RUNS_DIR = REPORTS_DIR / "runs"
 ASSETS_DIR = REPORTS_DIR / "assets"
+BLOBS_DIR = REPORTS_DIR / "blobs"  # content-addressed screenshots shared by all runs
+ARCHIVE_DIR = REPORTS_DIR / "archive"  # runs expired by the retention policy
+NETWORK_BASELINE_FILE = REPORTS_DIR / "network_baseline.json"  # URL sizes seen with the "full" profile
 
-
-def _safe_filename(name: str) -> str:
-    name = name.strip().replace(" ", "_")
-    return re.sub(r"[^a-zA-Z0-9_\-\.]", "_", name)
+_BLOB_STORE = BlobStore(BLOBS_DIR)
 
 
 def _now_run_id() -> str:
     return "run_" + datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
 
+def _allocate_run_dir() -> tuple[str, Path]:
+    """
+    Creates a new, unique run folder.
+    Two sessions started in the same second get run_<ts>, run_<ts>_2, ...
+    """
+    RUNS_DIR.mkdir(parents=True, exist_ok=True)
+    base = _now_run_id()
+    run_id = base
+    n = 1
+    while True:
+        run_dir = RUNS_DIR / run_id
+        try:
+            run_dir.mkdir()
+            return run_id, run_dir
+        except FileExistsError:
+            n += 1
+            run_id = f"{base}_{n}"
+
+
 def _ensure_assets():
     """
     Copies project-root logo.svg into:
@@ -52,363 +109,237 @@ def _ensure_assets():
         dst_favicon.write_bytes(src_logo.read_bytes())
 
 
-def _load_all_runs() -> dict:
-    run_data = {}
-    if not RUNS_DIR.exists():
-        return run_data
+def _ensure_duration_history() -> DurationHistory:
+    """Loads the duration history; the first time, builds it from the runs on disk."""
+    history = DurationHistory(RUNS_DIR)
+    if not history.exists():
+        all_runs = run_index.load_all_runs(RUNS_DIR)
+        for run_id in sorted(all_runs.keys()):
+            history.add_run(run_id, all_runs[run_id])
+    return history
 
-    for run_folder in sorted(RUNS_DIR.iterdir(), reverse=True):
-        if not run_folder.is_dir():
-            continue
-        data_file = run_folder / "run_data.json"
-        if data_file.exists():
-            try:
-                run_data[run_folder.name] = json.loads(data_file.read_text(encoding="utf-8"))
-            except Exception:
-                pass
-    return run_data
+
+# =========================================================
+# Pytest run state (per run)
+# =========================================================
+# One run folder is shared by the whole session. With pytest-xdist the
+# controller allocates it and hands the run ID to every worker; each worker
+# appends its results to its own shard file (shards/<worker>.jsonl) and the
+# controller merges the shards into run_data.json at session finish.
+@dataclass
+class _RunState:
+    run_id: str
+    run_dir: Path
+    worker_id: str
+    is_worker: bool
+    started_at: float = field(default_factory=time.time)
+    screenshots: ScreenshotWriter = field(default_factory=ScreenshotWriter)
+    network: NetworkMeter = field(default_factory=lambda: NetworkMeter(NETWORK_BASELINE_FILE))
+
+    @property
+    def shards_dir(self) -> Path:
+        return self.run_dir / "shards"
+
+    @property
+    def shard_file(self) -> Path:
+        return self.shards_dir / f"{self.worker_id}.jsonl"
+
+    @property
+    def network_shard_file(self) -> Path:
+        return self.shards_dir / f"network_{self.worker_id}.json"
+
+
+_RUN_STATE_KEY = pytest.StashKey[_RunState]()
+
+
+def _run_state(config) -> _RunState:
+    state = config.stash.get(_RUN_STATE_KEY, None)
+    if state is not None:
+        return state
+
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        run_id = workerinput["fattal_run_id"]
+        state = _RunState(run_id, RUNS_DIR / run_id, workerinput["workerid"], is_worker=True)
+    else:
+        run_id, run_dir = _allocate_run_dir()
+        state = _RunState(run_id, run_dir, os.getenv("PYTEST_XDIST_WORKER", "main"), is_worker=False)
+
+    state.run_dir.mkdir(parents=True, exist_ok=True)
+    state.shards_dir.mkdir(parents=True, exist_ok=True)
+    config.stash[_RUN_STATE_KEY] = state
+    return state
+
+
+def _append_result(state: _RunState, record: dict):
+    with state.shard_file.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
 
 
-def _format_run_label(run_id: str, tests: list[dict]) -> str:
+def _merge_shards(state: _RunState) -> list[dict]:
+    results = []
+    if not state.shards_dir.exists():
+        return results
+
+    for shard in sorted(state.shards_dir.glob("*.jsonl")):
+        for line in shard.read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                try:
+                    results.append(json.loads(line))
+                except json.JSONDecodeError:
+                    pass  # partially written line from a crashed worker
+        shard.unlink()
+
     try:
-        dt = datetime.strptime(run_id.replace("run_", ""), "%Y-%m-%d_%H-%M-%S")
-        day_name = dt.strftime("%A")
-        ts = dt.strftime("%Y-%m-%d %H:%M:%S")
-    except Exception:
-        day_name = ""
-        ts = run_id
+        state.shards_dir.rmdir()
+    except OSError:
+        pass
+
+    results.sort(key=lambda r: r.get("timestamp", ""))
+    return results
 
-    total = len(tests)
-    passed = sum(1 for t in tests if t.get("status") == "PASSED")
-    failed = sum(1 for t in tests if t.get("status") == "FAILED")
-    desktop = total
 
-    return f"{day_name} {ts} | {total} tests | ✅ {passed} | ❌ {failed} | 💻 {desktop}"
+def pytest_addoption(parser):
+    parser.addoption(
+        "--network-profile",
+        default=NETWORK_PROFILE,
+        choices=sorted(NETWORK_PROFILES),
+        help="default network profile for browser tests (override per test with @pytest.mark.network_profile)",
+    )
+    parser.addoption(
+        "--local-site",
+        action="store_true",
+        default=LOCAL_SITE,
+        help="run against the local stand-in site (src/local_site) instead of BASE_URL",
+    )
 
 
-def _build_dashboard_html(run_data: dict, selected_run_id: str, mode: str) -> str:
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """xdist (controller side): share the controller's run ID with each worker."""
+    node.workerinput["fattal_run_id"] = _run_state(node.config).run_id
+
+
+@pytest.fixture(scope="session", autouse=True)
+def local_site(request):
     """
-    mode:
-      - "root": for reports/Dashboard.html
-      - "per_run": for reports/runs/<run_id>/Dashboard.html
+    With --local-site, one stand-in server per pytest worker; pages with a
+    PATH are pointed at it for the whole session. Basic Auth is required when
+    BASIC_AUTH_USER / BASIC_AUTH_PASSWORD are set, like on staging.
     """
-    if mode == "root":
-        logo_path = "assets/logo.svg"
-        favicon_path = "assets/favicon.svg"
-        screenshots_src_prefix = "runs/{runId}/Screenshots/{file}"
-    else:
-        # per-run dashboard is inside reports/runs/<run_id>/Dashboard.html
-        logo_path = "../../assets/logo.svg"
-        favicon_path = "../../assets/favicon.svg"
-        screenshots_src_prefix = "Screenshots/{file}"
-
-    options_html = []
-    for run_id in sorted(run_data.keys(), reverse=True):
-        tests = run_data.get(run_id, [])
-        label = _format_run_label(run_id, tests)
-        selected = "selected" if run_id == selected_run_id else ""
-        options_html.append(f'<option value="{run_id}" {selected}>{label}</option>')
-    options_html = "\n".join(options_html)
-
-    run_data_json = json.dumps(run_data, ensure_ascii=False)
-
-    return f"""<!DOCTYPE html>
-<html lang="he">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1"/>
-  <title>{DASHBOARD_TITLE}</title>
-  <link rel="icon" type="image/svg+xml" href="{favicon_path}">
-  <style>
-    body {{
-      font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-      background-color: #f9f9f9;
-      margin: 20px;
-      color: #333;
-    }}
-    .dashboard-header {{
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      margin-bottom: 10px;
-      gap: 24px;
-    }}
-    .dashboard-header h1 {{
-      margin: 0;
-      font-size: 1.8em;
-      display: flex;
-      align-items: center;
-      white-space: nowrap;
-    }}
-    .dashboard-header h1::before {{
-      content: '🧪';
-      margin-right: 10px;
-    }}
-    .header-logo {{
-      height: 60px;
-      max-width: 240px;
-      object-fit: contain;
-      border-radius: 8px;
-      background: #fff;
-      padding: 6px 12px;
-      box-shadow: 0 2px 8px rgba(0,0,0,0.04);
-    }}
-    @media (max-width: 700px) {{
-      .dashboard-header {{
-        flex-direction: column;
-        align-items: flex-start;
-        gap: 8px;
-      }}
-      .header-logo {{
-        margin-left: 0;
-        margin-top: 6px;
-        height: 44px;
-        max-width: 180px;
-      }}
-    }}
-
-    select {{
-      font-size: 14px;
-      padding: 5px;
-      margin-left: 10px;
-    }}
-
-    .test-entry {{
-      background: #fff;
-      border-radius: 6px;
-      padding: 15px;
-      margin-bottom: 20px;
-      box-shadow: 0 1px 4px rgba(0,0,0,0.1);
-      transition: background 0.2s ease;
-    }}
-    .test-entry:hover {{
-      background: #f0f8ff;
-    }}
-
-    .meta-line {{
-      margin: 6px 0 0 0;
-      font-size: 14px;
-    }}
-
-    /* 4-step grid */
-    .steps-grid {{
-      display: grid;
-      grid-template-columns: repeat(4, minmax(140px, 1fr));
-      gap: 14px;
-      margin-top: 12px;
-      align-items: start;
-    }}
-    @media (max-width: 1000px) {{
-      .steps-grid {{
-        grid-template-columns: repeat(2, minmax(140px, 1fr));
-      }}
-    }}
-    @media (max-width: 520px) {{
-      .steps-grid {{
-        grid-template-columns: 1fr;
-      }}
-    }}
-
-    .step-card {{
-      display: flex;
-      flex-direction: column;
-      gap: 6px;
-    }}
-    .step-title {{
-      font-weight: 700;
-      font-size: 13px;
-      color: #222;
-    }}
-    .step-card img {{
-      width: 100%;
-      height: auto;
-      max-height: 190px;
-      object-fit: contain;
-      border-radius: 6px;
-      border: 1px solid #ccc;
-      background: #fff;
-      cursor: pointer;
-    }}
-
-    /* Modal */
-    .modal {{
-      display: none;
-      position: fixed;
-      z-index: 999;
-      left: 0; top: 0; width: 100%; height: 100%;
-      background-color: rgba(0,0,0,0.85);
-    }}
-    .modal-content {{
-      margin: 5% auto;
-      display: block;
-      max-width: 92vw;
-      max-height: 84vh;
-    }}
-    .close {{
-      position: absolute;
-      top: 15px;
-      right: 35px;
-      color: #fff;
-      font-size: 40px;
-      font-weight: bold;
-      cursor: pointer;
-    }}
-
-    /* Back-to-top button */
-    #backToTop {{
-      position: fixed;
-      bottom: 18px;
-      right: 18px;
-      width: 46px;
-      height: 46px;
-      border-radius: 999px;
-      border: none;
-      background: #111827;
-      color: white;
-      font-size: 22px;
-      cursor: pointer;
-      display: none;
-      box-shadow: 0 8px 20px rgba(0,0,0,0.22);
-    }}
-    #backToTop:hover {{
-      background: #0b1220;
-    }}
-  </style>
-
-  <script>
-    const runData = {run_data_json};
-    const screenshotsPrefix = `{screenshots_src_prefix}`;
-
-    function openModal(src) {{
-      const modal = document.getElementById("screenshotModal");
-      const modalImg = document.getElementById("modalImage");
-      modal.style.display = "block";
-      modalImg.src = src;
-    }}
-
-    function closeModal() {{
-      document.getElementById("screenshotModal").style.display = "none";
-    }}
-
-    function imgSrc(runId, file) {{
-      return screenshotsPrefix
-        .replace("{{runId}}", runId)
-        .replace("{{file}}", file);
-    }}
-
-    function populateRun(runId) {{
-      const container = document.getElementById("results");
-      container.innerHTML = "";
-
-      const showPassed = document.getElementById("filterPassed").checked;
-      const showFailed = document.getElementById("filterFailed").checked;
-
-      const data = runData[runId] || [];
-      data.forEach(test => {{
-        if ((test.status === "PASSED" && !showPassed) || (test.status === "FAILED" && !showFailed)) return;
-
-        const div = document.createElement("div");
-        div.classList.add("test-entry");
-
-        const color = test.status === "PASSED" ? "green" : "red";
-
-        const steps = Array.isArray(test.steps) ? test.steps.slice(0, 4) : [];
-        const hasSteps = steps.length > 0;
-
-        let gridHtml = "";
-
-        if (hasSteps) {{
-          const cards = steps.map(s => {{
-            const src = imgSrc(runId, s.file);
-            return `
-              <div class="step-card">
-                <div class="step-title">${{s.label}}</div>
-                <img src="${{src}}" onclick="openModal(this.src)" />
-              </div>
-            `;
-          }}).join("");
-
-          gridHtml = `<div class="steps-grid">${{cards}}</div>`;
-        }} else {{
-          if (test.final_screenshot) {{
-            const src = imgSrc(runId, test.final_screenshot);
-            gridHtml = `
-              <div class="steps-grid" style="grid-template-columns: minmax(200px, 340px);">
-                <div class="step-card">
-                  <div class="step-title">final_screenshot</div>
-                  <img src="${{src}}" onclick="openModal(this.src)" />
-                </div>
-              </div>
-            `;
-          }}
-        }}
-
-        div.innerHTML = `
-          <h3>${{test.name}} — <span style="color:${{color}}">${{test.status}}</span></h3>
-          <p class="meta-line"><strong>Timestamp:</strong> ${{test.timestamp}} | <strong>Duration:</strong> ${{test.duration}}</p>
-          ${{gridHtml}}
-          <hr>
-        `;
-
-        container.appendChild(div);
-      }});
-    }}
-
-    window.addEventListener("scroll", () => {{
-      const btn = document.getElementById("backToTop");
-      btn.style.display = (window.scrollY > 450) ? "block" : "none";
-    }});
-
-    function backToTop() {{
-      window.scrollTo({{ top: 0, behavior: "smooth" }});
-    }}
-  </script>
-</head>
-
-<body onload="populateRun(document.getElementById('runSelect').value)">
-  <div class="dashboard-header">
-    <h1>{DASHBOARD_TITLE}</h1>
-    <img src="{logo_path}" alt="Fattal Logo" class="header-logo" />
-  </div>
-
-  <label>Choose Run:
-    <select id="runSelect" onchange="populateRun(this.value)">
-      {options_html}
-    </select>
-  </label>
-
-  <div style="margin-top: 10px;">
-    <label><input type="checkbox" id="filterPassed" checked onchange="populateRun(document.getElementById('runSelect').value)"> Show Passed</label>
-    <label><input type="checkbox" id="filterFailed" checked onchange="populateRun(document.getElementById('runSelect').value)"> Show Failed</label>
-  </div>
-
-  <div id="results" style="margin-top: 20px;"></div>
-
-  <button id="backToTop" onclick="backToTop()" title="Back to top">↑</button>
-
-  <div id="screenshotModal" class="modal" onclick="closeModal()">
-    <span class="close">&times;</span>
-    <img class="modal-content" id="modalImage">
-  </div>
-</body>
-</html>
-"""
+    if not request.config.getoption("local_site"):
+        yield None
+        return
 
+    auth = (BASIC_AUTH_USER, BASIC_AUTH_PASSWORD) if BASIC_AUTH_USER and BASIC_AUTH_PASSWORD else None
+    with LocalSite(LocalSiteSettings(basic_auth=auth)) as site, pytest.MonkeyPatch.context() as mp:
+        for page in (HomePage, CheckoutPage, PaymentPage):
+            mp.setattr(page, "URL", site_url(page.PATH, site.url))
+        logger.info(f"Local site: {site.url}")
+        yield site
 
-# =========================================================
-# Pytest run state (per run)
-# =========================================================
-_CURRENT_RUN_ID = None
-_CURRENT_RUN_DIR = None
-_CURRENT_SCREENSHOTS_DIR = None
-_TEST_RESULTS = []
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """
+    One pool per pytest worker. Browsers stay warm for the whole session
+    and are reset between tests (see DRIVER_POOL_SIZE in config).
+    """
+    pool = DriverPool()
+    yield pool
+    pool.close()
+    logger.info(pool.summary())
 
 
 @pytest.fixture
-def driver():
-    drv = create_driver()
+def driver(request, driver_pool):
+    # resolved before acquiring, so the warm-up reuses the same pooled browser
+    warm_state = request.getfixturevalue("warm_session_state") if SESSION_WARMUP else None
+
+    marker = request.node.get_closest_marker("network_profile")
+    profile = marker.args[0] if marker else request.config.getoption("--network-profile")
+
+    # a never-used browser (from the background spawner when DRIVER_PREWARM > 0)
+    fresh = request.node.get_closest_marker("fresh_browser") is not None
+    drv = driver_pool.acquire(fresh=fresh)
+
+    apply_network_profile(drv, profile)
+    if NETWORK_ACCOUNTING:
+        NetworkMeter.drain(drv)
+    request.node._network_profile = profile
+
+    restore_token = restore_session(drv, warm_state) if warm_state else None
+
     yield drv
-    drv.quit()
+
+    try:
+        clear_restore(drv, restore_token)
+    except Exception:
+        pass  # a broken browser is recreated by the pool anyway
+
+    # a test that died on a WebDriver error may have left a crashed / hung browser behind
+    healthy = not getattr(request.node, "_browser_error", False) and driver_pool.is_alive(drv)
+    driver_pool.release(drv, healthy=healthy)
+
+
+@pytest.fixture(scope="session")
+def warm_session_state(driver_pool):
+    """
+    Loads the home page once per worker and snapshots cookies + localStorage.
+    With SESSION_WARMUP=true every `driver` starts from this state.
+    """
+    drv = driver_pool.acquire()
+    try:
+        HomePage(drv).load()
+        state = capture_session(drv)
+    finally:
+        driver_pool.release(drv)
+    return state
+
+
+@pytest.fixture(scope="session")
+def checkpoint_store():
+    return CheckpointStore()
+
+
+@pytest.fixture
+def flow_checkpoint(request, driver, checkpoint_store):
+    """
+    reach(name, build, server=None): the first test on a worker runs
+    build(driver) and snapshots the browser (URL, cookies, local/sessionStorage)
+    as checkpoint `name`; later tests restore it with one navigation. A failing
+    test drops the checkpoints it used, so the next one rebuilds them.
+
+    The snapshot's cookies still point at the builder's server-side state (its
+    cart), so without `server` a checkpoint is only valid for tests that don't
+    change that state after reaching it. `server()` rebuilds the server-side
+    part for each restoring test (e.g. flow_setup.cart_session) and its cookies
+    replace the snapshot's.
+    """
+    tokens = []
+    request.node._checkpoint_store = checkpoint_store
+    request.node._flow_checkpoints = used = []
+
+    def reach(name: str, build, server=None):
+        used.append(name)
+        state = checkpoint_store.get(name)
+        if state is not None:
+            with span(f"checkpoint.restore:{name}"):
+                tokens.append(restore_checkpoint(driver, state, server() if server else None))
+            return
+
+        with span(f"checkpoint.build:{name}"):
+            build(driver)
+            checkpoint_store.put(name, capture_session(driver))
+        logger.info(f"Checkpoint '{name}' recorded at {driver.current_url}")
+
+    yield reach
+
+    for token in tokens:
+        try:
+            clear_restore(driver, token)
+        except Exception:
+            pass
 
 
 @pytest.fixture
@@ -419,39 +350,35 @@ def capture_step(request, driver):
     """
     def _capture(label: str):
         label_clean = (label or "step").strip()
-        safe_label = _safe_filename(label_clean)
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_name = f"{_safe_filename(request.node.nodeid)}__{safe_label}_{ts}.png"
-        path = _CURRENT_SCREENSHOTS_DIR / file_name
-        driver.save_screenshot(str(path))
+
+        # only the capture round trip happens here; encoding runs in the background
+        state = _run_state(request.config)
+        with span("screenshot.step"):
+            files = state.screenshots.submit(driver.get_screenshot_as_png(), _BLOB_STORE)
 
         if not hasattr(request.node, "_step_screenshots"):
             request.node._step_screenshots = []
 
         if len(request.node._step_screenshots) < 4:
-            request.node._step_screenshots.append({"label": label_clean, "file": file_name})
+            request.node._step_screenshots.append({"label": label_clean, **files})
 
     return _capture
 
 
 def pytest_sessionstart(session):
-    global _CURRENT_RUN_ID, _CURRENT_RUN_DIR, _CURRENT_SCREENSHOTS_DIR, _TEST_RESULTS
-
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
     RUNS_DIR.mkdir(parents=True, exist_ok=True)
 
-    _ensure_assets()
-
-    _CURRENT_RUN_ID = _now_run_id()
-    _CURRENT_RUN_DIR = RUNS_DIR / _CURRENT_RUN_ID
-    _CURRENT_SCREENSHOTS_DIR = _CURRENT_RUN_DIR / "Screenshots"
-
-    _CURRENT_SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
-    _TEST_RESULTS = []
+    state = _run_state(session.config)
+    if not state.is_worker:
+        _ensure_assets()
 
 
 def pytest_runtest_setup(item):
     item._start_time = time.perf_counter()
+    WAIT_STATS.reset()
+    start_recording()  # spans cover fixture setup (driver acquire/create) and the test body
+    start_collecting()
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -459,9 +386,16 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
 
+    if call.excinfo is not None and call.excinfo.errisinstance(WebDriverException):
+        item._browser_error = True
+
     if rep.when != "call":
         return
 
+    if rep.failed:
+        for name in getattr(item, "_flow_checkpoints", []):
+            item._checkpoint_store.invalidate(name)
+
     drv = item.funcargs.get("driver", None)
 
     start = getattr(item, "_start_time", None)
@@ -471,43 +405,97 @@ def pytest_runtest_makereport(item, call):
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     duration = f"{dur_sec:.2f}s"
 
-    screenshot_file = ""
+    state = _run_state(item.config)
+
+    # pages were measured as they were navigated to (BasePage.open / load)
+    navigations = stop_collecting()
+
+    network = {}
+    if NETWORK_ACCOUNTING and drv is not None and hasattr(item, "_network_profile"):
+        network = state.network.collect(drv, item._network_profile)
+
+    screenshot = {"blob": "", "thumb_blob": ""}
     if drv is not None:
-        safe = _safe_filename(item.nodeid)
-        screenshot_file = f"{safe}_{status}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        screenshot_path = _CURRENT_SCREENSHOTS_DIR / screenshot_file
         try:
-            drv.save_screenshot(str(screenshot_path))
+            with span("screenshot.final"):
+                screenshot = state.screenshots.submit(drv.get_screenshot_as_png(), _BLOB_STORE)
         except Exception:
-            screenshot_file = ""
+            pass
 
     steps = getattr(item, "_step_screenshots", [])
     if not isinstance(steps, list):
         steps = []
 
-    _TEST_RESULTS.append({
+    _append_result(state, {
         "name": item.name,
+        "nodeid": item.nodeid,
         "status": status,
         "timestamp": timestamp,
         "duration": duration,
-        "final_screenshot": screenshot_file,
+        "final_blob": screenshot["blob"],
+        "final_thumb_blob": screenshot["thumb_blob"],
         "steps": steps[:4],
+        "waits": WAIT_STATS.summary(),
+        "network": network,
+        "spans": stop_recording(),
+        "navigations": navigations,
     })
 
 
 def pytest_sessionfinish(session, exitstatus):
+    state = _run_state(session.config)
+    state.screenshots.close()
+    state.network.save(state.network_shard_file)
+    if state.is_worker:
+        return  # results are already in this worker's shard; the controller merges
+
     _ensure_assets()
+    merge_baseline(NETWORK_BASELINE_FILE, state.shards_dir.glob("network_*.json"))
 
-    run_data_file = _CURRENT_RUN_DIR / "run_data.json"
-    run_data_file.write_text(json.dumps(_TEST_RESULTS, ensure_ascii=False, indent=2), encoding="utf-8")
+    run_index.ensure_index(RUNS_DIR)  # before this run's run_data.json exists, so it is indexed once
+    results = _merge_shards(state)
 
-    all_runs = _load_all_runs()
-    all_runs[_CURRENT_RUN_ID] = _TEST_RESULTS
+    # Duration history: flag tests much slower than their own past runs
+    history = _ensure_duration_history()
+    stats = history.add_run(state.run_id, results)
+    for test in results:
+        test_stats = stats.get(history_key(test))
+        if test_stats is None:
+            continue
+        test["duration_stats"] = test_stats
+        if test_stats["regressed"]:
+            logger.warning(
+                f"Duration regression: {history_key(test)} took {test.get('duration')} "
+                f"(p50 {test_stats['p50']}s, p95 {test_stats['p95']}s over {test_stats['samples']} run(s))"
+            )
+    history.save()
+
+    run_data_file = state.run_dir / "run_data.json"
+    run_data_file.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    run_index.write_run_data_js(state.run_dir, state.run_id, results)
+
+    # Screenshots: one reference per run on every blob it uses; drop orphans
+    _BLOB_STORE.add_refs(blobs_of(results))
+
+    for profile, totals in summarize_by_profile(results).items():
+        logger.info(
+            f"Network profile '{profile}': {totals['tests']} test(s), "
+            f"{totals['requests_blocked']} request(s) blocked, "
+            f"~{totals['bytes_saved_est'] / 1024:.0f} KB saved, "
+            f"{totals['bytes_loaded'] / 1024:.0f} KB loaded"
+        )
+
+    # Index: one appended line per run, history is never re-parsed
+    summary = run_index.run_summary(state.run_id, results, duration_sec=time.time() - state.started_at)
+    run_index.append_entry(RUNS_DIR, summary)
+
+    # Retention: keeps reports/runs bounded, expired runs go to reports/archive
+    apply_retention(RUNS_DIR, ARCHIVE_DIR, _BLOB_STORE)
 
     # Per-run dashboard (paths adjusted)
-    per_run_html = _build_dashboard_html({_CURRENT_RUN_ID: _TEST_RESULTS}, selected_run_id=_CURRENT_RUN_ID, mode="per_run")
-    (_CURRENT_RUN_DIR / "Dashboard.html").write_text(per_run_html, encoding="utf-8")
+    per_run_html = build_dashboard_html(state.run_id, mode="per_run", index_entries=[summary])
+    (state.run_dir / "Dashboard.html").write_text(per_run_html, encoding="utf-8")
 
     # Main dashboard (always named Dashboard.html)
-    main_html = _build_dashboard_html(all_runs, selected_run_id=_CURRENT_RUN_ID, mode="root")
+    main_html = build_dashboard_html(state.run_id, mode="root")
     (REPORTS_DIR / "Dashboard.html").write_text(main_html, encoding="utf-8")
@@ -0,0 +1,58 @@
+import time
+
+import pytest
+
+from src.api.balance_client import BalanceApiError, BalanceClient
+from src.local_site.server import LocalSite, LocalSiteSettings
+
+
+def test_balance_client_checks_codes():
+    with LocalSite() as site, BalanceClient(site.url, auth=None) as client:
+        result = client.check("1234-1234-1234")
+        assert result.found and result.balance == 250.0 and result.currency == "ILS"
+
+        missing = client.check("0000")
+        assert not missing.found and missing.http_status == 404
+
+
+def test_balance_client_wrong_path_is_an_error():
+    # the server's generic 404 for an unknown route must not read as "code not found"
+    with LocalSite() as site, BalanceClient(site.url, auth=None, retries=0, path="api/balanse") as client:
+        with pytest.raises(BalanceApiError, match="HTTP 404"):
+            client.check("1234-1234-1234")
+
+
+def test_balance_client_basic_auth():
+    with LocalSite(LocalSiteSettings(basic_auth=("qa", "secret"))) as site:
+        with BalanceClient(site.url, auth=("qa", "secret")) as client:
+            assert client.check("1234-1234-1234").found
+        with BalanceClient(site.url, auth=("qa", "wrong"), retries=0) as client:
+            with pytest.raises(BalanceApiError):
+                client.check("1234-1234-1234")
+
+
+def test_balance_client_retries_with_backoff():
+    with LocalSite(LocalSiteSettings(api_failures=2)) as site:
+        with BalanceClient(site.url, auth=None, retries=2, backoff=0.01) as client:
+            result = client.check("1234-1234-1234")
+        assert result.found and result.attempts == 3
+
+    with LocalSite(LocalSiteSettings(api_failures=5)) as site:
+        with BalanceClient(site.url, auth=None, retries=1, backoff=0.01) as client:
+            with pytest.raises(BalanceApiError, match="HTTP 503"):
+                client.check("1234-1234-1234")
+        assert site.api_calls == 2
+
+
+def test_balance_client_limits_concurrency():
+    from concurrent.futures import ThreadPoolExecutor
+
+    with LocalSite(LocalSiteSettings(api_latency_ms=200)) as site:
+        with BalanceClient(site.url, auth=None, max_concurrency=2) as client:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = list(pool.map(client.check, ["1234-1234-1234"] * 4))
+            elapsed = time.perf_counter() - start
+
+    assert all(r.found for r in results)
+    assert elapsed >= 0.4  # 4 calls, 2 at a time
@@ -0,0 +1,83 @@
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from src.pages.base_page import BasePage
+
+BUTTON = (By.ID, "pay")
+
+
+class _Driver:
+    """Counts WebDriver round trips: lookups plus every call on a handed-out element."""
+
+    def __init__(self):
+        self.calls = []
+        self.element = _Element(self)
+
+    def find_element(self, *locator):
+        self.calls.append("find_element")
+        return self.element
+
+    def execute_script(self, *args):
+        self.calls.append("execute_script")
+
+    @property
+    def current_url(self):
+        self.calls.append("current_url")
+        return "http://site/checkout"
+
+
+class _Element:
+    def __init__(self, driver, value="Pay"):
+        self.driver = driver
+        self.value = value
+        self.stale = False
+
+    def _call(self, name):
+        self.driver.calls.append(name)
+        if self.stale:
+            raise StaleElementReferenceException("element is not attached to the page document")
+
+    def is_displayed(self):
+        self._call("is_displayed")
+        return True
+
+    def get_attribute(self, name):
+        self._call("get_attribute")
+        return self.value
+
+    def is_enabled(self):
+        self._call("is_enabled")
+        return True
+
+
+def test_cached_handle_costs_one_round_trip():
+    drv = _Driver()
+    page = BasePage(drv)
+
+    assert page.attr(BUTTON, "value") == "Pay"
+    assert drv.calls == ["find_element", "get_attribute"]
+
+    drv.calls.clear()
+    assert page.attr(BUTTON, "value") == "Pay"
+    assert page.is_enabled(BUTTON)
+    assert drv.calls == ["get_attribute", "is_enabled"]
+
+
+def test_stale_handle_is_found_again_once():
+    drv = _Driver()
+    page = BasePage(drv)
+    page.attr(BUTTON, "value")
+
+    # the page navigated away: the old handle raises, a new lookup returns the new element
+    old = drv.element
+    old.stale = True
+    drv.element = _Element(drv, "Pay now")
+    drv.calls.clear()
+
+    assert page.attr(BUTTON, "value") == "Pay now"
+    assert drv.calls == ["get_attribute", "find_element", "get_attribute"]
+
+    drv.calls.clear()
+    assert page.attr(BUTTON, "value") == "Pay now"
+    assert drv.calls == ["get_attribute"]
+
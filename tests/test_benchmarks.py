@@ -0,0 +1,32 @@
+from src.benchmarks.harness import BenchSuite, compare, load_results
+
+
+def test_bench_suite_measures_and_saves(tmp_path):
+    suite = BenchSuite()
+    calls = []
+    result = suite.measure("noop", lambda: calls.append(1), repeat=5, warmup=2)
+    suite.skip("browser", "no chrome")
+
+    assert len(calls) == 7
+    assert result.samples == 5 and result.min_ms <= result.median_ms <= result.p95_ms
+
+    path = tmp_path / "bench.json"
+    suite.save(path)
+    assert set(load_results(path)) == {"noop"}
+
+
+def test_compare_flags_only_real_regressions():
+    baseline = {
+        "slow": {"median_ms": 10.0},
+        "noise": {"median_ms": 0.1},
+        "same": {"median_ms": 5.0},
+    }
+    current = {
+        "slow": {"median_ms": 30.0},   # 3x and +20 ms
+        "noise": {"median_ms": 0.5},   # 5x but below the absolute noise floor
+        "same": {"median_ms": 5.5},
+        "new": {"median_ms": 100.0},   # no baseline yet
+    }
+    regressions = compare(current, baseline, threshold=1.25, min_delta_ms=1.0)
+    assert [r["name"] for r in regressions] == ["slow"]
+    assert regressions[0]["ratio"] == 3.0
@@ -0,0 +1,62 @@
+import os
+import threading
+import time
+
+from src.reporting.blob_store import BlobStore, thumb_name
+
+
+def _blob(store, name, age_seconds=0):
+    store.write(name, b"png")
+    store.write(thumb_name(name), b"thumb")
+    if age_seconds:
+        old = time.time() - age_seconds
+        for blob in (name, thumb_name(name)):
+            os.utime(store.path_of(blob), (old, old))
+
+
+def test_refcounts_add_and_release(tmp_path):
+    store = BlobStore(tmp_path)
+    store.add_refs(["aa.webp", "bb.webp"])
+    store.add_refs(["aa.webp"])
+    assert store.load_refs() == {"aa.webp": 2, "bb.webp": 1}
+
+    store.release_refs(["aa.webp", "bb.webp"])
+    assert store.load_refs() == {"aa.webp": 1}
+
+
+def test_concurrent_add_refs_keep_every_count(tmp_path):
+    store = BlobStore(tmp_path)
+    threads = [threading.Thread(target=store.add_refs, args=(["aa.webp"],)) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert store.load_refs() == {"aa.webp": 20}
+    assert not (tmp_path / "refs.lock").exists()
+
+
+def test_gc_keeps_referenced_and_recent_blobs(tmp_path):
+    store = BlobStore(tmp_path)
+    _blob(store, "aa.webp", age_seconds=7200)   # referenced
+    _blob(store, "bb.webp", age_seconds=7200)   # orphaned (e.g. an aborted run)
+    _blob(store, "cc.webp")                     # orphaned, but may belong to a running session
+    store.add_refs(["aa.webp"])
+
+    removed, freed = store.gc(grace_seconds=3600)
+
+    assert removed == 2 and freed == len(b"png") + len(b"thumb")
+    assert store.exists("aa.webp") and store.exists(thumb_name("aa.webp"))
+    assert not store.exists("bb.webp") and not store.exists(thumb_name("bb.webp"))
+    assert store.exists("cc.webp")
+
+
+def test_stale_lock_is_taken_over(tmp_path):
+    store = BlobStore(tmp_path)
+    lock = tmp_path / "refs.lock"
+    lock.write_text("")
+    old = time.time() - 600
+    os.utime(lock, (old, old))
+
+    store.add_refs(["aa.webp"])
+    assert store.load_refs() == {"aa.webp": 1}
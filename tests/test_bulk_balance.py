@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from src.tools.bulk_balance import load_checkpoint, parse_balance, read_codes, run_bulk
+
+
+class _FakeChecker:
+    balances = {"A": "יתרה: 250 ILS", "B": "יתרה: 1,200.50 ILS", "C": "שובר 4580 לא נמצא"}
+
+    def __init__(self, calls, fail=()):
+        self.calls = calls
+        self.fail = fail
+
+    def check(self, code):
+        self.calls.append(code)
+        if code in self.fail:
+            raise RuntimeError("browser crashed")
+        message = self.balances[code]
+        balance = parse_balance(message)
+        return {"status": "ok" if balance is not None else "invalid", "balance": balance, "message": message}
+
+    def close(self):
+        pass
+
+
+def _records(path):
+    return {r["code"]: r for r in map(json.loads, path.read_text(encoding="utf-8").splitlines())}
+
+
+def test_read_codes_formats(tmp_path):
+    (tmp_path / "a.csv").write_text("name,code\nx,A\ny,B\n", encoding="utf-8")
+    (tmp_path / "b.csv").write_text("A\nB\n", encoding="utf-8")
+    (tmp_path / "c.jsonl").write_text('{"code": "A"}\n\n{"code": "B"}\n', encoding="utf-8")
+    (tmp_path / "d.txt").write_text("A\n B \n", encoding="utf-8")
+
+    for name in ("a.csv", "b.csv", "c.jsonl", "d.txt"):
+        assert list(read_codes(tmp_path / name)) == ["A", "B"], name
+
+
+def test_run_bulk_streams_results_and_resumes(tmp_path):
+    output = tmp_path / "out.jsonl"
+    calls = []
+
+    counts = run_bulk(["A", "B", "C", "A"], output, 2, lambda: _FakeChecker(calls, fail={"B"}))
+    assert counts == {"ok": 1, "invalid": 1, "error": 1, "skipped": 1}  # duplicate "A"
+    records = _records(output)
+    assert records["A"]["balance"] == 250.0 and records["A"]["status"] == "ok"
+    assert records["C"]["status"] == "invalid"
+    assert records["B"]["status"] == "error" and "browser crashed" in records["B"]["error"]
+    assert calls.count("B") == 2  # retried once
+
+    # crash mid-write: a truncated last line must not break the resume
+    with output.open("a", encoding="utf-8") as f:
+        f.write('{"code": "Z", "sta')
+    assert load_checkpoint(output) == {"A", "C"}
+
+    calls.clear()
+    counts = run_bulk(["A", "B", "C"], output, 2, lambda: _FakeChecker(calls))
+    assert calls == ["B"]
+    assert counts["skipped"] == 2 and counts["ok"] == 1
+    assert load_checkpoint(output) == {"A", "B", "C"}
+
+
+def test_parse_balance_needs_the_success_format():
+    assert parse_balance("יתרה: 1,200.50 ILS") == 1200.5
+    assert parse_balance("יתרה: 250 ₪") == 250.0
+    # digits alone are not a balance: error messages echo the code
+    assert parse_balance("שובר 4580 לא נמצא") is None
+    assert parse_balance("שגיאה 503, נסו שוב") is None
+
+
+def test_run_bulk_surfaces_a_dead_worker(tmp_path):
+    def factory():
+        raise RuntimeError("no browser")
+
+    # more codes than the queue holds: the producer only finishes if the dead workers keep draining
+    with pytest.raises(RuntimeError, match="no browser"):
+        run_bulk([f"X{i}" for i in range(50)], tmp_path / "out.jsonl", 2, factory)
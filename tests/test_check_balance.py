@@ -1,5 +1,5 @@
-import time
-
+from src.local_site.server import LocalSite, LocalSiteSettings
+from src.pages.base_page import site_url
 from src.pages.home_page import HomePage
 from src.data.test_data import COUPON_CODE
 
@@ -21,7 +21,15 @@ def test_check_balance_button_enabled_after_code(driver):
     assert modal.is_check_button_present(), "Check button not found in modal"
     assert modal.is_check_button_enabled(), "Check button is not enabled after entering coupon code"
 
-    modal.wait_and_click_check(wait_seconds=1.0)
+    modal.wait_and_click_check()
+
+
+def test_check_balance_waits_for_each_codes_result(driver, monkeypatch):
+    # own server: a slow API keeps the previous code's message on screen while the next request is in flight
+    with LocalSite(LocalSiteSettings(api_latency_ms=500, balances={"1111": 100.0})) as site:
+        monkeypatch.setattr(HomePage, "URL", site_url(HomePage.PATH, site.url))
 
-    # optional: keep browser open briefly for debugging
-    time.sleep(2)
+        modal = HomePage(driver).load().open_check_balance_modal()
+        assert modal.check_balance("1111") == "יתרה: 100 ILS"
+        assert modal.check_balance("2222") == "שובר לא נמצא"
+        assert site.api_calls == 2
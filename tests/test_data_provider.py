@@ -0,0 +1,55 @@
+import pytest
+
+from src.data.provider import Dataset, params, shard_of
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_csv_rows_are_read_lazily_by_offset(tmp_path):
+    path = _write(tmp_path / "buyers.csv", '\ufeffid,name,note\na,Israel,"two\nlines"\n\nb,Dana,plain\n')
+    data = Dataset(path, cache_dir=tmp_path / "cache")
+
+    assert list(data) == [
+        {"id": "a", "name": "Israel", "note": "two\nlines"},
+        {"id": "b", "name": "Dana", "note": "plain"},
+    ]
+    rows = data.rows()
+    assert [r.id for r in rows] == ["a", "b"]
+    assert rows[1]._data is None  # nothing parsed until a field is used
+    assert rows[1]["name"] == "Dana" and rows[0]["note"] == "two\nlines"
+
+
+def test_jsonl_rows_without_ids(tmp_path):
+    path = _write(tmp_path / "coupons.jsonl", '{"code": "1"}\n\n{"code": "2", "balance": 5}\n')
+    rows = Dataset(path, cache_dir=tmp_path / "cache").rows()
+    assert [r.id for r in rows] == ["row1", "row2"]
+    assert dict(rows[1]) == {"code": "2", "balance": 5}
+
+
+def test_index_is_cached_by_content_hash(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    path = _write(tmp_path / "amounts.csv", "id,amount\nmin,100\nmax,5000\n")
+    assert [r.id for r in Dataset(path, cache_dir=cache).rows()] == ["min", "max"]
+
+    # same content: the cached index is used, the file isn't parsed again
+    monkeypatch.setattr(Dataset, "_build_index", lambda self, digest: pytest.fail("index rebuilt"))
+    path.touch()
+    assert [r.id for r in Dataset(path, cache_dir=cache).rows()] == ["min", "max"]
+    monkeypatch.undo()
+
+    _write(path, "id,amount\nmin,100\nmid,900\nmax,5000\n")
+    rows = Dataset(path, cache_dir=cache).rows()
+    assert [r.id for r in rows] == ["min", "mid", "max"] and rows[2]["amount"] == "5000"
+
+
+def test_params_group_rows_by_id(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.data.provider.DATA_CACHE_DIR", str(tmp_path / "cache"))
+    path = _write(tmp_path / "buyers.csv", "id,name\n" + "".join(f"b{i},n{i}\n" for i in range(20)))
+    grouped = {p.id: p.marks[0].args[0] for p in params(str(path), shards=4)}
+
+    assert grouped["b7"] == f"buyers:{shard_of('b7', 4)}"
+    assert len(set(grouped.values())) > 1
+    assert all(not p.marks for p in params(str(path), shards=0))
@@ -0,0 +1,89 @@
+from selenium.common.exceptions import WebDriverException
+
+from src.core.driver_pool import DriverPool
+
+
+class _Switch:
+    def __init__(self, drv):
+        self.drv = drv
+
+    def window(self, handle):
+        pass
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+        self.visited = []
+        self.switch_to = _Switch(self)
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise WebDriverException("chrome not reachable")
+        return ["main"]
+
+    def execute_script(self, script):
+        pass
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {}
+
+    def get(self, url):
+        if not self.alive:
+            raise WebDriverException("chrome not reachable")
+        self.visited.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+def _pool(size=1):
+    created = []
+
+    def factory():
+        created.append(_FakeDriver())
+        return created[-1]
+
+    return DriverPool(size=size, factory=factory, owner="t", prewarm=0), created
+
+
+def test_pool_reuses_and_resets_a_released_browser():
+    pool, created = _pool()
+    first = pool.acquire()
+    first.visited.append("https://example.com/")
+    pool.release(first)
+
+    assert pool.acquire() is first
+    assert first.visited[-1] == "about:blank"
+    assert pool.stats.created == 1 and pool.stats.reused == 1
+
+
+def test_pool_replaces_a_browser_that_fails_reset():
+    pool, created = _pool()
+    first = pool.acquire()
+    pool.release(first)
+    first.alive = False  # crashed while idle
+
+    second = pool.acquire()
+    assert second is not first and first.quit_called
+    assert pool.stats.recreated == 1
+
+
+def test_pool_discards_dead_and_surplus_browsers():
+    pool, created = _pool(size=1)
+    a, b = pool.acquire(), pool.acquire()
+
+    a.alive = False
+    pool.release(a, healthy=pool.is_alive(a))
+    pool.release(b)
+    c = pool.acquire()
+    pool.release(c)
+
+    assert a.quit_called and c is b
+    assert pool.stats.discarded == 1
+
+    d = pool.acquire(fresh=True)
+    pool.release(d)  # pool already holds b
+    assert d.quit_called and pool.stats.discarded == 2
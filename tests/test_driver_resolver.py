@@ -0,0 +1,55 @@
+import threading
+
+import pytest
+
+from src.core import driver_resolver
+from src.core.driver_resolver import _store_in_cache, cached_driver_path, resolve_chromedriver
+
+
+def test_concurrent_cache_writes_publish_a_complete_binary(tmp_path):
+    binary = tmp_path / "chromedriver-download"
+    binary.write_bytes(b"\x7fELF" + b"x" * 2_000_000)
+
+    errors = []
+
+    def store():
+        try:
+            _store_in_cache(str(binary), "126", str(tmp_path / "cache"))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=store) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    target = cached_driver_path("126", str(tmp_path / "cache"))
+    assert errors == []
+    assert target.read_bytes() == binary.read_bytes()
+    assert [p.name for p in target.parent.iterdir()] == [target.name]  # no tmp files left
+
+
+def _seed(cache, *majors):
+    for major in majors:
+        path = cached_driver_path(major, str(cache))
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"driver")
+
+
+def test_unknown_chrome_version_falls_back_to_the_cache(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    _seed(cache, "99", "126", "125")
+    (cache / "127").mkdir()  # no binary inside
+    monkeypatch.setattr(driver_resolver, "CHROMEDRIVER_CACHE_DIR", str(cache))
+    monkeypatch.setattr(driver_resolver, "CHROMEDRIVER_PATH", None)
+    monkeypatch.setattr(driver_resolver, "detect_chrome_version", lambda: None)
+    monkeypatch.setattr(driver_resolver, "_from_path", lambda major: pytest.fail("PATH checked before the cache"))
+
+    resolve_chromedriver.cache_clear()
+    assert resolve_chromedriver() == str(cached_driver_path("126", str(cache)))
+
+    monkeypatch.setattr(driver_resolver, "CHROMEDRIVER_MAJOR", "125")
+    resolve_chromedriver.cache_clear()
+    assert resolve_chromedriver() == str(cached_driver_path("125", str(cache)))
+    resolve_chromedriver.cache_clear()
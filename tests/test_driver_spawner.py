@@ -0,0 +1,119 @@
+import threading
+from concurrent import futures
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import driver_spawner
+from src.core.driver_pool import DriverPool
+from src.core.driver_spawner import DriverSpawner, LaunchStats
+
+WAIT = 5  # seconds; only a safety net against hangs, nothing is timed
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.quit_called = threading.Event()
+
+    def quit(self):
+        self.quit_called.set()
+
+
+class _Launcher:
+    """Factory whose launches start immediately but finish only when the test releases them."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.started = threading.Semaphore(0)
+        self.finished = threading.Semaphore(0)
+        self.gates = [threading.Event() for _ in range(10)]
+        self.created = []
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            gate = self.gates[self._count]
+            self._count += 1
+        self.started.release()
+        assert gate.wait(WAIT), "launch never released"
+        self.clock.now += 2.0  # Chrome boot time, on the fake clock
+        drv = _FakeDriver()
+        self.created.append(drv)
+        self.finished.release()
+        return drv
+
+    def wait_started(self, n: int):
+        for _ in range(n):
+            assert self.started.acquire(timeout=WAIT), "launch did not start"
+
+    def wait_finished(self, n: int):
+        for _ in range(n):
+            assert self.finished.acquire(timeout=WAIT), "launch did not finish"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(driver_spawner, "time", SimpleNamespace(perf_counter=lambda: clock.now))
+    return clock
+
+
+def test_spawner_hides_launch_latency(clock):
+    launcher = _Launcher(clock)
+    spawner = DriverSpawner(launcher, size=2)
+    launcher.wait_started(2)  # both launches run in the background
+
+    first = spawner._pending[0]
+    launcher.gates[0].set()
+    futures.wait([first], timeout=WAIT)
+    launcher.wait_finished(1)
+
+    drv = spawner.take()  # already launched: no time is exposed to the caller
+    assert drv is launcher.created[0]
+    assert spawner.stats.launches == 1
+    assert spawner.stats.launch_ms == pytest.approx(2000) and spawner.stats.exposed_ms == 0
+    launcher.wait_started(1)  # take() started a replacement
+
+    # launches still running at close() are quit once they finish
+    spawner.close()
+    for gate in launcher.gates[1:3]:
+        gate.set()
+    launcher.wait_finished(2)
+    for leftover in launcher.created[1:]:
+        assert leftover.quit_called.wait(WAIT)
+    assert not drv.quit_called.is_set()
+
+
+def test_pool_fresh_acquire_skips_warm_browsers():
+    pool = DriverPool(size=1, factory=_FakeDriver, owner="t", prewarm=0)
+    pool.reset = lambda drv: True
+
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+    pool.release(first)
+
+    fresh = pool.acquire(fresh=True)
+    assert fresh is not first
+    assert pool.stats.created == 2 and pool.launch.launches == 2
+    pool.release(fresh)
+    pool.close()
+
+
+def test_launch_stats_add_from_many_threads():
+    stats = LaunchStats()
+    start = threading.Barrier(8)
+
+    def add():
+        start.wait()
+        for _ in range(1000):
+            stats.add(2.0, 1.0)
+
+    threads = [threading.Thread(target=add) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert stats.as_dict() == {"launches": 8000, "launch_ms": 16000.0, "exposed_ms": 8000.0, "hidden_ms": 8000.0}
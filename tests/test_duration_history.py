@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from src.reporting.duration_history import DurationHistory, percentile
+
+
+def _record(seconds, status="PASSED", nodeid="tests/test_a.py::test_flow", name="test_flow"):
+    return {"name": name, "nodeid": nodeid, "status": status, "duration": f"{seconds:.2f}s"}
+
+
+def _history(tmp_path, runs, **kwargs):
+    history = DurationHistory(tmp_path, window=50, factor=2.0, min_samples=3, **kwargs)
+    for i, tests in enumerate(runs):
+        history.add_run(f"run_{i:03d}", tests)
+    return history
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) is None
+    assert percentile([4.0], 95) == 4.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 95) == pytest.approx(4.8)
+
+
+def test_regression_needs_min_samples(tmp_path):
+    history = _history(tmp_path, [[_record(1.0)], [_record(1.0)]])
+    stats = history.add_run("run_100", [_record(9.0)])
+    assert stats["tests/test_a.py::test_flow"]["samples"] == 2
+    assert not stats["tests/test_a.py::test_flow"]["regressed"]
+
+
+def test_regression_against_passing_p95(tmp_path):
+    # the failed 30s timeout run is not part of the baseline
+    history = _history(tmp_path, [[_record(1.0)], [_record(1.2)], [_record(30.0, "FAILED")], [_record(1.1)]])
+
+    slow = history.add_run("run_100", [_record(2.0)])["tests/test_a.py::test_flow"]
+    assert slow["samples"] == 3 and slow["p95"] == pytest.approx(1.19, abs=0.01)
+    assert not slow["regressed"]  # 2.0s is under 2 x p95
+
+    stats = history.add_run("run_101", [_record(5.0)])["tests/test_a.py::test_flow"]
+    assert stats["regressed"] and stats["ratio"] > 2.0
+
+    failed = history.add_run("run_102", [_record(50.0, "FAILED")])["tests/test_a.py::test_flow"]
+    assert not failed["regressed"]  # only passing runs are flagged
+
+
+def test_same_named_tests_are_separate_series(tmp_path):
+    a = _record(1.0, nodeid="tests/test_a.py::test_flow")
+    b = _record(20.0, nodeid="tests/test_b.py::test_flow")
+    history = _history(tmp_path, [[a, b]] * 3)
+
+    stats = history.add_run("run_100", [_record(1.1, nodeid=a["nodeid"]), _record(21.0, nodeid=b["nodeid"])])
+    assert set(stats) == {a["nodeid"], b["nodeid"]}
+    assert not any(s["regressed"] for s in stats.values())
+
+    # a run is added once
+    assert history.add_run("run_100", [a]) == {}
+    assert len(history.tests[a["nodeid"]]["samples"]) == 4
+
+
+def test_name_keyed_history_is_rebuilt(tmp_path):
+    (tmp_path / "history.json").write_text(json.dumps({"tests": {"test_flow": {"samples": []}}}))
+    history = DurationHistory(tmp_path)
+    assert not history.exists() and history.tests == {}
+
+    history.add_run("run_000", [_record(1.0)])
+    history.save()
+    assert DurationHistory(tmp_path).exists()
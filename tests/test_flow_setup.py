@@ -0,0 +1,91 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from src.api.flow_setup import FlowSetup, cart_session, open_checkout
+from src.core.session_state import SessionState, capture_session, clear_restore, restore_checkpoint
+from src.local_site.server import CART_COOKIE, LocalSite
+from src.pages.checkout_page import CheckoutPage
+
+
+def test_flow_setup_builds_cart_cookie_for_the_browser():
+    with LocalSite() as site, FlowSetup(site.url, auth=None) as setup:
+        cart = setup.add_voucher(500)
+        assert cart["amount"] == "500"
+        assert setup.set_buyer("Israel Israeli", "qa@example.com", "0500000000")["buyer"]["name"] == "Israel Israeli"
+
+        state = setup.session_state()
+        assert [c["name"] for c in state.cookies] == ["fattal_cart"]
+        cookie = state.cookies[0]
+        assert cookie["url"].startswith(state.origin) and cookie["httpOnly"]
+
+        # the same cookie opens the payment step directly
+        resp = setup.session.get(site.url + "payment", allow_redirects=False)
+        assert resp.status_code == 200 and "500" in resp.text
+
+
+def test_checkout_starts_with_seeded_cart(request, local_site):
+    if local_site is None:
+        pytest.skip("cart endpoints are only known for the local site (--local-site)")
+    driver = request.getfixturevalue("driver")
+
+    checkout = open_checkout(driver, 250)
+    assert isinstance(checkout, CheckoutPage)
+    assert checkout.text_of((By.ID, "cartAmount")) == "250"
+
+
+def test_checkout_checkpoint_is_reused(request, local_site, checkpoint_store):
+    if local_site is None:
+        pytest.skip("cart endpoints are only known for the local site (--local-site)")
+    driver = request.getfixturevalue("driver")
+    reach = request.getfixturevalue("flow_checkpoint")
+
+    reach("checkout-250", lambda d: open_checkout(d, 250))
+    state = checkpoint_store.get("checkout-250")
+    assert state is not None and state.url.endswith("/checkout")
+
+    # a second reach restores the snapshot instead of rebuilding
+    driver.get("about:blank")
+    driver.delete_all_cookies()
+    reach("checkout-250", lambda d: pytest.fail("checkpoint was rebuilt"))
+    assert CheckoutPage(driver).text_of((By.ID, "cartAmount")) == "250"
+
+
+def test_capture_after_restore_skips_seed_flags(request, local_site):
+    if local_site is None:
+        pytest.skip("needs the local site (--local-site)")
+    driver = request.getfixturevalue("driver")
+
+    state = SessionState(url=local_site.url, origin=local_site.url.split("/fattal-new")[0],
+                         session_storage={"step": "checkout"})
+    token = restore_checkpoint(driver, state)
+    try:
+        # the restore's own marker must not end up in the next snapshot
+        assert capture_session(driver).session_storage == {"step": "checkout"}
+    finally:
+        clear_restore(driver, token)
+
+
+def test_mutating_tests_get_their_own_cart(request, local_site):
+    if local_site is None:
+        pytest.skip("cart endpoints are only known for the local site (--local-site)")
+    driver = request.getfixturevalue("driver")
+    reach = request.getfixturevalue("flow_checkpoint")
+
+    def cart_id():
+        return driver.get_cookie(CART_COOKIE)["value"]
+
+    def reach_and_submit_buyer(first: bool):
+        # what two separate tests do: start from a clean browser, reach the checkpoint, change the cart
+        driver.get("about:blank")
+        driver.delete_all_cookies()
+        reach("checkout-mutable", lambda d: open_checkout(d, 250), server=lambda: cart_session(250))
+        checkout = CheckoutPage(driver)
+        if not first:
+            # the previous test's buyer must not be in this cart: payment bounces back to checkout
+            driver.get(local_site.url + "payment")
+            assert driver.current_url.endswith("/checkout")
+        checkout.fill_buyer_details("Israel Israeli", "qa@example.com", "0500000000").continue_to_payment()
+        assert driver.current_url.endswith("/payment")
+        return cart_id()
+
+    assert reach_and_submit_buyer(first=True) != reach_and_submit_buyer(first=False)
@@ -0,0 +1,85 @@
+import base64
+import http.cookiejar
+import json
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.local_site.server import LocalSite, LocalSiteSettings
+
+
+def _request(url, data=None, auth=None, opener=None):
+    headers = {"Content-Type": "application/json"} if data is not None else {}
+    if auth:
+        token = base64.b64encode(f"{auth[0]}:{auth[1]}".encode()).decode()
+        headers["Authorization"] = f"Basic {token}"
+    body = json.dumps(data).encode() if data is not None else None
+    req = urllib.request.Request(url, data=body, headers=headers)
+    try:
+        with (opener or urllib.request.build_opener()).open(req, timeout=5) as resp:
+            return resp.status, resp.read().decode("utf-8")
+    except urllib.error.HTTPError as e:
+        return e.code, e.read().decode("utf-8")
+
+
+@pytest.fixture
+def site():
+    with LocalSite() as s:
+        yield s
+
+
+def test_local_site_serves_page_object_dom(site):
+    status, home = _request(site.url)
+    assert status == 200
+    assert 'class="btn nav-btn rounded-3 d-none d-md-block"' in home
+    assert 'id="checkRemainingBtn" disabled' in home
+    assert 'name="amount"' in home
+
+    # the voucher form creates the cart (cookie) and redirects to checkout
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+    status, checkout = _request(site.url + "cart/add?amount=100", opener=opener)
+    assert status == 200
+    assert 'name="buyer_name"' in checkout and 'type="email"' in checkout
+    assert '<span id="cartAmount">100</span>' in checkout
+
+    status, payment = _request(site.url + "checkout/submit?buyer_name=A&email=a%40b.c&phone=1", opener=opener)
+    assert status == 200 and 'id="payBtn"' in payment
+
+    status, confirmation = _request(site.url + "confirmation")
+    assert status == 200 and "תודה" in confirmation
+
+
+def test_local_site_flow_pages_need_a_cart(site):
+    status, page = _request(site.url + "checkout")
+    assert status == 200 and "checkRemainingBtn" in page  # redirected home
+
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+    _request(site.url + "api/cart", {"amount": 300}, opener=opener)
+    status, page = _request(site.url + "payment", opener=opener)
+    assert 'name="buyer_name"' in page  # no buyer yet: back to checkout
+
+
+def test_local_site_balance_api(site):
+    status, body = _request(site.url + "api/balance", {"code": "1234-1234-1234"})
+    assert status == 200
+    assert json.loads(body)["balance"] == 250.0
+
+    status, body = _request(site.url + "api/balance", {"code": "0000"})
+    assert status == 404
+    assert json.loads(body)["error"] == "not_found"
+
+
+def test_local_site_basic_auth():
+    with LocalSite(LocalSiteSettings(basic_auth=("qa", "secret"))) as site:
+        assert _request(site.url)[0] == 401
+        assert _request(site.url, auth=("qa", "wrong"))[0] == 401
+        assert _request(site.url, auth=("qa", "secret"))[0] == 200
+
+
+def test_local_site_latency():
+    with LocalSite(LocalSiteSettings(latency_ms=200)) as site:
+        start = time.perf_counter()
+        _request(site.url)
+        assert time.perf_counter() - start >= 0.2
@@ -1,18 +1,13 @@
 import pytest
 
-from src.core.driver_factory import create_driver
+from src.api.flow_setup import open_checkout
 from src.pages.home_page import HomePage
 from src.pages.voucher_page import VoucherPage
 from src.pages.checkout_page import CheckoutPage
 from src.pages.confirmation_page import ConfirmationPage
+from src.data.provider import params
 from src.data.test_data import BUYER, VOUCHER_AMOUNT
 
-@pytest.fixture
-def driver():
-    d = create_driver()
-    yield d
-    d.quit()
-
 def test_voucher_flow_skeleton(driver):
     HomePage(driver).load()
 
@@ -31,3 +26,17 @@ def test_voucher_flow_skeleton(driver):
     # PaymentPage(driver).pay_mock()
     # assert ConfirmationPage(driver).is_success()
     assert True
+
+
+@pytest.mark.parametrize("buyer", params("buyers"))
+def test_checkout_accepts_buyer(request, local_site, buyer):
+    if local_site is None:
+        pytest.skip("cart endpoints are only known for the local site (--local-site)")
+    driver = request.getfixturevalue("driver")
+
+    open_checkout(driver, VOUCHER_AMOUNT).fill_buyer_details(
+        name=buyer["name"],
+        email=buyer["email"],
+        phone=buyer["phone"]
+    ).continue_to_payment()
+    assert driver.current_url.endswith("/payment")
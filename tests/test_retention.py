@@ -0,0 +1,50 @@
+import os
+from datetime import datetime, timedelta
+
+from src.reporting.blob_store import BlobStore
+from src.reporting.retention import RetentionPolicy, apply_retention, select_expired
+
+NOW = datetime(2026, 10, 18, 12, 0, 0)
+
+
+def _entry(days_ago: float, failed: int = 0, hour: int = 10) -> dict:
+    started = (NOW - timedelta(days=days_ago)).replace(hour=hour)
+    return {"id": started.strftime("run_%Y-%m-%d_%H-%M-%S"), "failed": failed}
+
+
+def test_recent_runs_are_kept_by_age():
+    entries = [_entry(1), _entry(3), _entry(20)]
+    policy = RetentionPolicy(keep_last=0, keep_days=7, keep_failed=False, downsample_days=0)
+    assert select_expired(entries, policy, NOW) == [entries[2]["id"]]
+
+
+def test_newest_runs_are_kept_by_count():
+    entries = [_entry(d) for d in (30, 40, 50, 60)]
+    policy = RetentionPolicy(keep_last=2, keep_days=0, keep_failed=False, downsample_days=0)
+    assert select_expired(entries, policy, NOW) == [entries[2]["id"], entries[3]["id"]]
+
+
+def test_failed_runs_are_kept():
+    entries = [_entry(30, failed=1), _entry(31)]
+    policy = RetentionPolicy(keep_last=0, keep_days=7, keep_failed=True, downsample_days=0)
+    assert select_expired(entries, policy, NOW) == [entries[1]["id"]]
+
+    policy.keep_failed = False
+    assert set(select_expired(entries, policy, NOW)) == {e["id"] for e in entries}
+
+
+def test_downsampling_keeps_the_newest_passing_run_per_day():
+    late, early = _entry(10, hour=18), _entry(10, hour=9)
+    archived = dict(_entry(11), archived=True)
+    policy = RetentionPolicy(keep_last=0, keep_days=7, keep_failed=False, downsample_days=30)
+    assert select_expired([early, late, archived], policy, NOW) == [early["id"]]
+
+
+def test_retention_collects_orphaned_blobs_without_expired_runs(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+    store.write("aa.webp", b"png")  # left behind by an aborted session
+    old = (NOW - timedelta(days=1)).timestamp()
+    os.utime(store.path_of("aa.webp"), (old, old))
+
+    assert apply_retention(tmp_path / "runs", tmp_path / "archive", store, now=NOW) == []
+    assert not store.exists("aa.webp")
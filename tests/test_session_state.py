@@ -0,0 +1,61 @@
+from src.core.session_state import CheckpointStore, SessionState, restore_checkpoint
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.calls = []
+        self.cookies = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.calls.append(cmd)
+        if cmd == "Network.setCookies":
+            self.cookies = params["cookies"]
+        return {"identifier": "1"}
+
+    def get(self, url):
+        self.calls.append(f"get {url}")
+
+
+def test_restore_checkpoint_seeds_state_before_navigating():
+    state = SessionState(
+        url="http://127.0.0.1/fattal-new/checkout",
+        origin="http://127.0.0.1",
+        cookies=[{"name": "fattal_cart", "value": "x", "domain": "127.0.0.1", "path": "/"}],
+        session_storage={"step": "checkout"},
+    )
+    drv = _FakeDriver()
+    token = restore_checkpoint(drv, state)
+
+    assert token == "1"
+    assert drv.calls == [
+        "Network.setCookies",
+        "Page.addScriptToEvaluateOnNewDocument",
+        "get http://127.0.0.1/fattal-new/checkout",
+    ]
+
+
+def test_restore_checkpoint_swaps_in_fresh_server_state():
+    state = SessionState(
+        url="http://127.0.0.1/fattal-new/checkout",
+        origin="http://127.0.0.1",
+        cookies=[
+            {"name": "fattal_cart", "value": "shared", "domain": "127.0.0.1", "path": "/"},
+            {"name": "lang", "value": "he", "domain": "127.0.0.1", "path": "/"},
+        ],
+    )
+    fresh = SessionState(url="u", origin="o", cookies=[{"name": "fattal_cart", "value": "new", "url": "http://127.0.0.1/"}])
+    drv = _FakeDriver()
+    restore_checkpoint(drv, state, fresh)
+
+    assert sorted((c["name"], c["value"]) for c in drv.cookies) == [("fattal_cart", "new"), ("lang", "he")]
+    assert state.cookies[0]["value"] == "shared"  # the stored snapshot is untouched
+
+
+def test_checkpoint_store_invalidate():
+    store = CheckpointStore()
+    store.put("checkout", SessionState(url="u", origin="o", cookies=[]))
+    assert store.names() == ["checkout"]
+
+    store.invalidate("checkout")
+    store.invalidate("missing")
+    assert store.get("checkout") is None and store.names() == []
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from src.core import waits
+from src.core.config import POLL_INITIAL, POLL_MAX
+from src.core.waits import WAIT_STATS, wait_until
+from src.pages.base_page import BasePage
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake time for waits.py: sleep() advances perf_counter() and is recorded."""
+    state = {"now": 0.0, "sleeps": []}
+
+    def sleep(seconds):
+        state["sleeps"].append(seconds)
+        state["now"] += seconds
+
+    # replaces waits.py's `time` only; conftest keeps timing the test with the real clock
+    monkeypatch.setattr(waits, "time", SimpleNamespace(perf_counter=lambda: state["now"], sleep=sleep))
+    WAIT_STATS.reset()
+    return state
+
+
+def test_condition_already_true_returns_without_sleeping(clock):
+    assert wait_until(None, lambda d: "ok", timeout=5) == "ok"
+    assert clock["sleeps"] == []
+    assert WAIT_STATS.summary()["count"] == 1
+
+
+def test_polling_backs_off_to_poll_max_and_stops_at_the_deadline(clock):
+    with pytest.raises(TimeoutException):
+        wait_until(None, lambda d: False, timeout=3)
+
+    sleeps = clock["sleeps"]
+    assert sleeps[0] == POLL_INITIAL
+    assert all(b >= a for a, b in zip(sleeps, sleeps[1:-1]))  # never speeds up again
+    assert max(sleeps) == POLL_MAX
+    assert sum(sleeps) == pytest.approx(3)  # the last sleep is trimmed to the deadline
+    assert WAIT_STATS.summary()["timeouts"] == 1
+
+
+def test_ignored_exceptions_mean_not_yet(clock):
+    calls = []
+
+    def condition(_driver):
+        calls.append(1)
+        if len(calls) < 3:
+            raise NoSuchElementException()
+        return True
+
+    assert wait_until(None, condition, timeout=5) is True
+    assert len(calls) == 3
+
+    with pytest.raises(ValueError):
+        wait_until(None, lambda d: int("x"), timeout=5)
+
+
+def test_zero_timeout_checks_once(clock):
+    class _NoElements:
+        lookups = 0
+
+        def find_element(self, *locator):
+            self.lookups += 1
+            raise NoSuchElementException()
+
+    drv = _NoElements()
+    assert BasePage(drv).is_present((By.ID, "missing"), timeout=0) is False
+    assert drv.lookups == 1 and clock["sleeps"] == []